@@ -0,0 +1,392 @@
+"""
+Command line entry point for the validator.
+
+    python -m app.cli benchmark --endpoint report_pages \\
+        --param account_id=123 --param date_range=today \\
+        --concurrency 10 --requests 1000
+
+    python -m app.cli health-check --tokens-file tokens.txt --workers 4
+    python -m app.cli batch --jobs jobs.json --tokens-file tokens.txt
+
+The API token is read from --token or the SEALMETRICS_API_TOKEN env var.
+health-check and batch also take --tokens-file: one token per line, or
+JSON lines like {"token": "...", "label": "...", "account_ids": ["..."]}
+("token_env" names an environment variable instead of "token").
+They print JSON Lines to stdout and exit with 1 when anything is degraded.
+"""
+import argparse
+import asyncio
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from multiprocessing import Manager
+from queue import Empty, Queue
+from typing import Any, Awaitable, Callable
+
+from pydantic import ValidationError
+from pydantic_core import to_json
+
+from app.models import BatchRequest, ResponseOptions, ValidationResult
+from app.services import EndpointsRegistry, SealmetricsClient
+from app.services.batch import BatchError, expand_batch, iter_batch
+from app.services.benchmark import run_benchmark
+from app.services.health_check import run_multi_account_health_check
+from app.services.http_pool import close_http_client, open_http_client
+from app.services.result_store import start_result_store, stop_result_store
+from app.services.token_hash import hash_token
+
+
+@dataclass
+class TokenEntry:
+    token: str
+    label: str | None = None
+    account_ids: list[str] | None = None
+
+    @property
+    def name(self) -> str:
+        """How the token appears in the output; raw tokens are never printed."""
+        return self.label or hash_token(self.token)[:12]
+
+
+# One output line and whether it reports a healthy/successful check
+Line = tuple[dict, bool]
+Emit = Callable[[list[Line]], None]
+
+
+def _param(value: str) -> tuple[str, str]:
+    """argparse type for --param KEY=VALUE."""
+    key, sep, raw = value.partition("=")
+    if not sep or not key:
+        raise argparse.ArgumentTypeError(f"invalid value {value!r}, expected KEY=VALUE")
+    return key, raw
+
+
+def _token(args: argparse.Namespace) -> str:
+    token = args.token or os.environ.get("SEALMETRICS_API_TOKEN")
+    if not token:
+        raise SystemExit("An API token is required (--token or SEALMETRICS_API_TOKEN)")
+    return token
+
+
+def load_tokens(path: str) -> list[TokenEntry]:
+    """Read a tokens file: plain tokens or JSON objects, one per line; # starts a comment."""
+    entries = []
+    with open(path) as f:
+        for number, line in enumerate(f, 1):
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            if not line.startswith("{"):
+                entries.append(TokenEntry(token=line))
+                continue
+            item = json.loads(line)
+            token = item.get("token") or os.environ.get(item.get("token_env", ""))
+            if not token:
+                raise SystemExit(f'{path}:{number}: no token (missing "token" or unset "token_env")')
+            entries.append(TokenEntry(token=token, label=item.get("label"), account_ids=item.get("account_ids")))
+    return entries
+
+
+def _token_entries(args: argparse.Namespace) -> list[TokenEntry]:
+    if args.tokens_file:
+        entries = load_tokens(args.tokens_file)
+    else:
+        entries = [TokenEntry(token=_token(args))]
+    if args.account:
+        for entry in entries:
+            entry.account_ids = args.account
+    return entries
+
+
+def _token_error(entry: TokenEntry, error: str | None) -> Line:
+    return {"type": "token", "token": entry.name, "overall_status": "unhealthy", "error": error}, False
+
+
+async def _health_check_token(entry: TokenEntry, options: dict, emit: Emit) -> None:
+    """Check every account of a token; its lines are emitted together once all accounts are done."""
+    client = SealmetricsClient(entry.token)
+    is_valid, accounts, error = await client.validate_token()
+    if not is_valid:
+        emit([_token_error(entry, error or "Invalid API token")])
+        return
+
+    result = await run_multi_account_health_check(
+        client,
+        accounts,
+        account_ids=entry.account_ids,
+        endpoint_ids=options["endpoint_ids"],
+        response_options=ResponseOptions(summary_only=True),
+    )
+
+    lines: list[Line] = []
+    for account in result.accounts:
+        health = account.health
+        line = {
+            "type": "health_check",
+            "token": entry.name,
+            "account_id": account.account_id,
+            "account_name": account.account_name,
+            "overall_status": health.overall_status,
+            "successful": health.successful,
+            "failed": health.failed,
+            "total_time_ms": health.total_time_ms,
+            "timestamp": health.timestamp,
+            "failures": [
+                {"endpoint_id": r.endpoint_id, "status_code": r.status_code, "error": r.error_message}
+                for r in health.results
+                if not r.success
+            ],
+        }
+        if options["include_results"]:
+            line["results"] = [
+                r.model_dump(mode="json", exclude={"response_data"}, exclude_none=True) for r in health.results
+            ]
+        lines.append((line, health.overall_status == "healthy"))
+
+    for account_id in result.unknown_account_ids:
+        line = {
+            "type": "health_check",
+            "token": entry.name,
+            "account_id": account_id,
+            "overall_status": "unhealthy",
+            "error": "Account not accessible with this token",
+        }
+        lines.append((line, False))
+
+    if not lines:
+        # Nothing was checked: the token sees no accounts at all
+        lines.append(_token_error(entry, "No accounts accessible with this token"))
+    emit(lines)
+
+
+def _result_line(entry: TokenEntry, account_id: str | None, result: ValidationResult, include_data: bool) -> Line:
+    line = {
+        "type": "result",
+        "token": entry.name,
+        "account_id": account_id,
+        **result.model_dump(mode="json", exclude=None if include_data else {"response_data"}, exclude_none=True),
+    }
+    return line, result.success
+
+
+async def _batch_token(entry: TokenEntry, options: dict, emit: Emit) -> None:
+    """Run the batch for every account of a token, emitting each result as it completes."""
+    client = SealmetricsClient(entry.token)
+    is_valid, _, error = await client.validate_token()
+    if not is_valid:
+        emit([_token_error(entry, error or "Invalid API token")])
+        return
+
+    spec = options["batch"]
+    for account_id in entry.account_ids or [spec.get("account_id")]:
+        request = BatchRequest(api_token=entry.token, **{**spec, "account_id": account_id})
+        try:
+            async for result in iter_batch(client, request, expand_batch(request)):
+                emit([_result_line(entry, account_id, result, options["include_data"])])
+        except Exception as e:
+            # The results already emitted stand; the other accounts still run
+            line = {
+                "type": "result",
+                "token": entry.name,
+                "account_id": account_id,
+                "success": False,
+                "error_message": str(e),
+            }
+            emit([(line, False)])
+
+
+_RUNNERS: dict[str, Callable[[TokenEntry, dict, Emit], Awaitable[None]]] = {
+    "health-check": _health_check_token,
+    "batch": _batch_token,
+}
+
+
+async def _run_tokens(
+    command: str,
+    entries: list[TokenEntry],
+    options: dict,
+    concurrency: int,
+    emit: Emit,
+) -> None:
+    """Run a command for every token, `concurrency` tokens at a time, emitting lines as they are produced."""
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def run_one(entry: TokenEntry) -> None:
+        async with semaphore:
+            try:
+                await _RUNNERS[command](entry, options, emit)
+            except Exception as e:
+                emit([_token_error(entry, str(e))])
+
+    await open_http_client()
+    await start_result_store()
+    try:
+        await asyncio.gather(*[run_one(entry) for entry in entries])
+    finally:
+        await stop_result_store()
+        await close_http_client()
+
+
+def _run_chunk(command: str, entries: list[TokenEntry], options: dict, concurrency: int, queue: Queue) -> None:
+    """Worker process entry point: run a chunk of tokens in a fresh event loop, sending lines to `queue`."""
+    asyncio.run(_run_tokens(command, entries, options, concurrency, queue.put))
+
+
+def _execute(args: argparse.Namespace, options: dict) -> int:
+    """
+    Run health-check/batch for every token, in this process or spread over
+    --workers processes, writing JSON Lines as results complete. Workers
+    send their lines back through a queue, so output is not held until a
+    whole chunk of tokens is done.
+    Returns 1 when any line reports a degraded check, else 0.
+    """
+    entries = _token_entries(args)
+    output = open(args.output, "w") if args.output else sys.stdout
+    totals = {"lines": 0, "degraded": 0}
+
+    def emit(lines: list[Line]) -> None:
+        for line, ok in lines:
+            output.write(to_json(line).decode() + "\n")
+            totals["lines"] += 1
+            totals["degraded"] += not ok
+        output.flush()
+
+    try:
+        if args.workers <= 1:
+            asyncio.run(_run_tokens(args.command, entries, options, args.concurrency, emit))
+        else:
+            chunks = [entries[i:i + args.concurrency] for i in range(0, len(entries), args.concurrency)]
+            with Manager() as manager, ProcessPoolExecutor(max_workers=args.workers) as pool:
+                queue = manager.Queue()
+                futures = [pool.submit(_run_chunk, args.command, c, options, args.concurrency, queue) for c in chunks]
+                while not all(f.done() for f in futures):
+                    try:
+                        emit(queue.get(timeout=0.2))
+                    except Empty:
+                        pass
+                # Workers put every line before they return; pick up the last ones
+                while not queue.empty():
+                    emit(queue.get())
+                for future in futures:
+                    future.result()  # re-raise worker failures
+    finally:
+        if output is not sys.stdout:
+            output.close()
+
+    print(f"{len(entries)} token(s), {totals['lines']} line(s), {totals['degraded']} degraded", file=sys.stderr)
+    return 1 if totals["degraded"] else 0
+
+
+def _health_check(args: argparse.Namespace) -> int:
+    for endpoint_id in args.endpoint or []:
+        if not EndpointsRegistry.get_endpoint_by_id(endpoint_id):
+            print(f"Unknown endpoint: {endpoint_id}", file=sys.stderr)
+            return 2
+    return _execute(args, {"endpoint_ids": args.endpoint, "include_results": args.include_results})
+
+
+def _batch(args: argparse.Namespace) -> int:
+    with open(args.jobs) as f:
+        spec: dict[str, Any] = json.load(f)
+    spec.pop("api_token", None)
+    spec.setdefault("response_options", {"summary_only": True})
+    # Reject a bad jobs file before any token is used
+    try:
+        expand_batch(BatchRequest(api_token="-", **spec))
+    except (ValidationError, BatchError) as e:
+        print(f"Invalid jobs file: {e}", file=sys.stderr)
+        return 2
+    return _execute(args, {"batch": spec, "include_data": args.include_data})
+
+
+async def _benchmark(args: argparse.Namespace) -> int:
+    if not EndpointsRegistry.get_endpoint_by_id(args.endpoint):
+        print(f"Unknown endpoint: {args.endpoint}", file=sys.stderr)
+        return 2
+
+    await open_http_client()
+    try:
+        client = SealmetricsClient(
+            _token(args),
+            rate_limited=not args.no_rate_limit,
+            max_retries=0,
+            deduplicate=False,
+            hedge=False,
+            store_results=False,
+        )
+        result = await run_benchmark(
+            client,
+            args.endpoint,
+            dict(args.param),
+            concurrency=args.concurrency,
+            total_requests=args.requests,
+            duration_seconds=args.duration,
+            target_rps=args.rps,
+        )
+    finally:
+        await close_http_client()
+
+    print(result.model_dump_json(indent=2))
+    return 0 if result.failed == 0 else 1
+
+
+def build_parser() -> argparse.ArgumentParser:
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument("--token", help="Sealmetrics API token (default: $SEALMETRICS_API_TOKEN)")
+
+    tokens = argparse.ArgumentParser(add_help=False, parents=[common])
+    tokens.add_argument("--tokens-file", help="One token (or JSON object) per line, instead of --token")
+    tokens.add_argument("--account", action="append", help="Account id to check (default: every account)")
+    tokens.add_argument("--concurrency", type=int, default=4, help="Tokens in flight per worker")
+    tokens.add_argument("--workers", type=int, default=1, help="Worker processes")
+    tokens.add_argument("--output", help="Write JSON Lines here instead of stdout")
+
+    parser = argparse.ArgumentParser(prog="python -m app.cli", description="Sealmetrics API validator")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    bench = commands.add_parser(
+        "benchmark",
+        parents=[common],
+        help="Load-test an endpoint and report latency percentiles",
+    )
+    bench.add_argument("--endpoint", required=True, help="Endpoint id from the registry")
+    bench.add_argument("--param", action="append", default=[], type=_param, metavar="KEY=VALUE")
+    bench.add_argument("--concurrency", type=int, default=1)
+    bench.add_argument("--requests", type=int, help="Stop after N requests")
+    bench.add_argument("--duration", type=float, help="Stop after N seconds")
+    bench.add_argument("--rps", type=float, help="Target requests per second")
+    bench.add_argument("--no-rate-limit", action="store_true", help="Bypass the per-token rate limiter")
+    bench.set_defaults(handler=_benchmark)
+
+    health = commands.add_parser(
+        "health-check",
+        parents=[tokens],
+        help="Health check every account of one or more tokens",
+    )
+    health.add_argument("--endpoint", action="append", help="Endpoint id to check (default: health check set)")
+    health.add_argument("--include-results", action="store_true", help="Add every endpoint result to the lines")
+    health.set_defaults(handler=_health_check)
+
+    batch = commands.add_parser(
+        "batch",
+        parents=[tokens],
+        help="Run a batch (the /validate/batch body without api_token) for one or more tokens",
+    )
+    batch.add_argument("--jobs", required=True, help="JSON file with the batch body")
+    batch.add_argument("--include-data", action="store_true", help="Keep response_data in the result lines")
+    batch.set_defaults(handler=_batch)
+
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = build_parser().parse_args(argv)
+    if asyncio.iscoroutinefunction(args.handler):
+        return asyncio.run(args.handler(args))
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -8,6 +8,108 @@ class Settings(BaseSettings):
     sealmetrics_api_base: str = "https://app.sealmetrics.com/api"
     cors_origins: list[str] = ["http://localhost:3000", "https://api-validator.sealmetrics.com"]
 
+    # Shared upstream HTTP connection pool
+    http_max_connections: int = 100
+    http_max_keepalive_connections: int = 20
+    http_keepalive_expiry: float = 30.0
+    http2_enabled: bool = False
+
+    # Health check parallelism
+    health_check_max_concurrency: int = 20
+    health_check_per_token_concurrency: int = 5
+
+    # /validate/batch: expanded jobs per request and validations in flight
+    batch_max_jobs: int = 1000
+    batch_max_concurrency: int = 10
+    batch_default_deadline_seconds: float | None = None
+
+    # /validate/paginated: pages per request and pages in flight
+    pagination_max_pages: int = 1000
+    pagination_default_max_pages: int = 100
+    pagination_max_concurrency: int = 4
+
+    # Multi-account health checks: accounts in flight and endpoints per account.
+    # They replace the per-token limit for this fan-out; the global limit and
+    # the per-token rate limiter still apply
+    health_check_max_concurrent_accounts: int = 10
+    health_check_per_account_concurrency: int = 3
+
+    # Token validation cache (negative TTL applies to 401 responses)
+    token_cache_enabled: bool = True
+    token_cache_ttl_seconds: float = 300.0
+    token_cache_negative_ttl_seconds: float = 30.0
+    token_cache_max_entries: int = 1024
+
+    # Server-wide cap on embedded response_data (None = unlimited)
+    response_max_bytes: int | None = None
+
+    # Validate and normalize parameters against the registry before calling upstream
+    parameter_validation_enabled: bool = True
+
+    # Opt-in response cache for GETs (ETag / Last-Modified revalidation)
+    response_cache_enabled: bool = True
+    response_cache_max_bytes: int = 64 * 1024 * 1024
+
+    # Row fingerprints kept for opt-in freshness/drift tracking
+    drift_max_bytes: int = 64 * 1024 * 1024
+
+    # Share one upstream call between identical concurrent validations;
+    # the window also shares results that completed within it
+    single_flight_enabled: bool = True
+    single_flight_window_seconds: float = 0.0
+
+    # Hedged GETs: when an upstream call takes longer than the endpoint's recent
+    # latency percentile, a second one is sent and the first response wins
+    hedge_enabled: bool = False
+    hedge_percentile: float = 95
+    hedge_min_samples: int = 20
+    hedge_min_delay_ms: float = 50
+    hedge_latency_window: int = 1000
+
+    # Analyze summary-only responses while streaming (requires ijson)
+    incremental_json_enabled: bool = True
+
+    # Adaptive rate limiting per (base URL, token)
+    rate_limit_enabled: bool = True
+    rate_limit_requests_per_second: float = 10.0
+    rate_limit_burst: int = 10
+    rate_limit_min_requests_per_second: float = 0.5
+
+    # Retries for idempotent GETs (jittered exponential backoff)
+    retry_max_attempts: int = 2
+    retry_backoff_base_seconds: float = 0.5
+    retry_backoff_max_seconds: float = 10.0
+    retry_status_codes: list[int] = [429, 502, 503, 504]
+
+    # Background synthetic monitors (JSON list of MonitorConfig)
+    monitors_config_path: str | None = None
+    monitor_history_size: int = 100
+    monitor_max_concurrency: int = 10
+    monitor_jitter_ratio: float = 0.1
+
+    # Persistent validation history (SQLite in WAL mode; None = disabled)
+    result_store_path: str | None = None
+    result_store_batch_size: int = 200
+    result_store_flush_interval_seconds: float = 1.0
+    result_store_queue_size: int = 10000
+    result_store_raw_retention_days: float = 7
+
+    # Response compression, in server preference order (br/zstd need brotli/zstandard)
+    compression_enabled: bool = True
+    compression_min_size: int = 1024
+    compression_encodings: list[str] = ["zstd", "br", "gzip"]
+    compression_gzip_level: int = 6
+    compression_brotli_quality: int = 4
+    compression_zstd_level: int = 3
+
+    # Prometheus metrics at /metrics
+    metrics_enabled: bool = True
+
+    # Limits for /validate/benchmark (the CLI is not limited)
+    benchmark_max_concurrency: int = 50
+    benchmark_max_requests: int = 10000
+    benchmark_max_duration_seconds: float = 300.0
+
     class Config:
         env_file = ".env"
 
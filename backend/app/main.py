@@ -1,17 +1,40 @@
-from fastapi import FastAPI
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.config import get_settings
-from app.routers import validator_router, endpoints_router
+from app.middleware import CompressionMiddleware, MetricsMiddleware
+from app.routers import validator_router, endpoints_router, monitors_router, history_router
+from app.services.http_pool import open_http_client, close_http_client
+from app.services.monitor_scheduler import start_monitors, stop_monitors
+from app.services.result_store import start_result_store, stop_result_store
+from app.services.metrics import render_metrics
 
 settings = get_settings()
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Open the shared upstream connection pool, result store and background monitors for the lifetime of the app."""
+    await open_http_client()
+    await start_result_store()
+    start_monitors()
+    try:
+        yield
+    finally:
+        await stop_monitors()
+        await stop_result_store()
+        await close_http_client()
+
+
 app = FastAPI(
     title=settings.app_name,
     version=settings.app_version,
     description="Validate Sealmetrics API endpoints and ensure they return correct responses",
     docs_url="/docs",
     redoc_url="/redoc",
+    lifespan=lifespan,
 )
 
 # CORS middleware
@@ -23,9 +46,26 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+if settings.compression_enabled:
+    app.add_middleware(
+        CompressionMiddleware,
+        encodings=settings.compression_encodings,
+        minimum_size=settings.compression_min_size,
+        levels={
+            "gzip": settings.compression_gzip_level,
+            "br": settings.compression_brotli_quality,
+            "zstd": settings.compression_zstd_level,
+        },
+    )
+
+if settings.metrics_enabled:
+    app.add_middleware(MetricsMiddleware)
+
 # Include routers
 app.include_router(validator_router)
 app.include_router(endpoints_router)
+app.include_router(monitors_router)
+app.include_router(history_router)
 
 
 @app.get("/")
@@ -42,3 +82,12 @@ async def root():
 async def health():
     """Simple health check for Railway/monitoring."""
     return {"status": "healthy"}
+
+
+if settings.metrics_enabled:
+
+    @app.get("/metrics", include_in_schema=False)
+    async def metrics():
+        """Prometheus metrics."""
+        content, media_type = render_metrics()
+        return Response(content=content, media_type=media_type)
@@ -0,0 +1,4 @@
+from .compression import CompressionMiddleware
+from .metrics import MetricsMiddleware
+
+__all__ = ["CompressionMiddleware", "MetricsMiddleware"]
@@ -0,0 +1,226 @@
+import asyncio
+import time
+import zlib
+from abc import ABC, abstractmethod
+from typing import Callable
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.services.metrics import (
+    COMPRESSION_CPU_SECONDS,
+    COMPRESSION_INPUT_BYTES,
+    COMPRESSION_OUTPUT_BYTES,
+    COMPRESSION_RATIO,
+)
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - optional dependency
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - optional dependency
+    zstandard = None
+
+# Complete bodies at least this large are compressed off the event loop
+THREAD_MIN_SIZE = 256 * 1024
+
+
+class Encoder(ABC):
+    """Incremental compressor. compress(flush=True) emits everything written so far."""
+
+    @abstractmethod
+    def compress(self, data: bytes, flush: bool = False) -> bytes: ...
+
+    @abstractmethod
+    def finish(self) -> bytes: ...
+
+
+class GzipEncoder(Encoder):
+    def __init__(self, level: int):
+        self._compressor = zlib.compressobj(level, zlib.DEFLATED, zlib.MAX_WBITS | 16)
+
+    def compress(self, data: bytes, flush: bool = False) -> bytes:
+        output = self._compressor.compress(data)
+        return output + self._compressor.flush(zlib.Z_SYNC_FLUSH) if flush else output
+
+    def finish(self) -> bytes:
+        return self._compressor.flush()
+
+
+class BrotliEncoder(Encoder):
+    def __init__(self, level: int):
+        self._compressor = brotli.Compressor(quality=level)
+
+    def compress(self, data: bytes, flush: bool = False) -> bytes:
+        output = self._compressor.process(data)
+        return output + self._compressor.flush() if flush else output
+
+    def finish(self) -> bytes:
+        return self._compressor.finish()
+
+
+class ZstdEncoder(Encoder):
+    def __init__(self, level: int):
+        self._compressor = zstandard.ZstdCompressor(level=level).compressobj()
+
+    def compress(self, data: bytes, flush: bool = False) -> bytes:
+        output = self._compressor.compress(data)
+        return output + self._compressor.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK) if flush else output
+
+    def finish(self) -> bytes:
+        return self._compressor.flush()
+
+
+def available_encodings() -> dict[str, type[Encoder]]:
+    """Content codings supported by the installed libraries."""
+    encoders: dict[str, type[Encoder]] = {"gzip": GzipEncoder}
+    if brotli is not None:
+        encoders["br"] = BrotliEncoder
+    if zstandard is not None:
+        encoders["zstd"] = ZstdEncoder
+    return encoders
+
+
+def choose_encoding(accept_encoding: str, encodings: list[str]) -> str | None:
+    """
+    Pick the content coding for an Accept-Encoding header: highest q-value
+    first, then the order of `encodings` (server preference).
+    """
+    accepted: dict[str, float] = {}
+    for part in accept_encoding.split(","):
+        name, _, params = part.strip().partition(";")
+        if not name:
+            continue
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        accepted[name.strip().lower()] = q
+
+    best, best_q = None, 0.0
+    for encoding in encodings:
+        q = accepted.get(encoding, accepted.get("*", 0.0))
+        if q > best_q:
+            best, best_q = encoding, q
+    return best
+
+
+def _is_compressible(headers: Headers) -> bool:
+    content_type = headers.get("content-type", "")
+    return (
+        "content-encoding" not in headers
+        and "no-transform" not in headers.get("cache-control", "")
+        and ("json" in content_type or content_type.startswith("text/"))
+    )
+
+
+class CompressionMiddleware:
+    """
+    Compresses responses with the best coding the client accepts.
+    Complete bodies below minimum_size are sent as-is. Streaming bodies
+    (NDJSON, SSE) are compressed chunk by chunk and flushed after every
+    chunk, so each line reaches the client as soon as it is produced.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        encodings: list[str] | None = None,
+        minimum_size: int = 1024,
+        levels: dict[str, int] | None = None,
+    ):
+        self.app = app
+        self.minimum_size = minimum_size
+        supported = available_encodings()
+        levels = {"gzip": 6, "br": 4, "zstd": 3, **(levels or {})}
+        self.encodings = [e for e in (encodings or ["zstd", "br", "gzip"]) if e in supported]
+        self._factories: dict[str, Callable[[], Encoder]] = {
+            e: (lambda cls=supported[e], level=levels[e]: cls(level)) for e in self.encodings
+        }
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = choose_encoding(Headers(scope=scope).get("accept-encoding", ""), self.encodings)
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        start: Message | None = None
+        encoder: Encoder | None = None
+        passthrough = False
+        bytes_in = bytes_out = 0
+        cpu = 0.0
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal start, encoder, passthrough, bytes_in, bytes_out, cpu
+            if message["type"] == "http.response.start":
+                start = {**message, "headers": list(message.get("headers", []))}
+                return
+            if message["type"] != "http.response.body" or passthrough:
+                await send(message)
+                return
+
+            body = message.get("body", b"")
+            more_body = message.get("more_body", False)
+
+            if encoder is None:
+                headers = MutableHeaders(raw=start["headers"])
+                if not _is_compressible(headers) or (not more_body and len(body) < self.minimum_size):
+                    passthrough = True
+                    await send(start)
+                    await send(message)
+                    return
+
+                encoder = self._factories[encoding]()
+                del headers["content-length"]
+                headers["content-encoding"] = encoding
+                headers.add_vary_header("Accept-Encoding")
+
+                if not more_body:
+                    if len(body) >= THREAD_MIN_SIZE:
+                        data, cpu = await asyncio.to_thread(_compress_all, encoder, body)
+                    else:
+                        data, cpu = _compress_all(encoder, body)
+                    headers["content-length"] = str(len(data))
+                    await send(start)
+                    await send({"type": "http.response.body", "body": data})
+                    _observe(encoding, len(body), len(data), cpu)
+                    return
+                await send(start)
+
+            cpu_start = time.thread_time()
+            data = encoder.compress(body, flush=True)
+            if not more_body:
+                data += encoder.finish()
+            cpu += time.thread_time() - cpu_start
+            bytes_in += len(body)
+            bytes_out += len(data)
+            await send({"type": "http.response.body", "body": data, "more_body": more_body})
+            if not more_body:
+                _observe(encoding, bytes_in, bytes_out, cpu)
+
+        await self.app(scope, receive, send_wrapper)
+
+
+def _compress_all(encoder: Encoder, body: bytes) -> tuple[bytes, float]:
+    """Compress a complete body. Returns (data, CPU seconds)."""
+    cpu_start = time.thread_time()
+    data = encoder.compress(body) + encoder.finish()
+    return data, time.thread_time() - cpu_start
+
+
+def _observe(encoding: str, bytes_in: int, bytes_out: int, cpu: float) -> None:
+    COMPRESSION_INPUT_BYTES.labels(encoding=encoding).inc(bytes_in)
+    COMPRESSION_OUTPUT_BYTES.labels(encoding=encoding).inc(bytes_out)
+    COMPRESSION_CPU_SECONDS.labels(encoding=encoding).inc(cpu)
+    if bytes_in:
+        COMPRESSION_RATIO.labels(encoding=encoding).observe(bytes_out / bytes_in)
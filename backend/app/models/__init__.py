@@ -7,10 +7,29 @@ from .schemas import (
     ValidateTokenRequest,
     ValidateTokenResponse,
     EndpointInfo,
+    ResponseOptions,
     ValidationRequest,
+    ParameterError,
+    DriftReport,
     ValidationResult,
     HealthCheckRequest,
     HealthCheckResult,
+    MultiAccountHealthCheckRequest,
+    AccountHealthCheckResult,
+    MultiAccountHealthCheckResult,
+    BatchJob,
+    BatchRequest,
+    PaginatedValidationRequest,
+    BenchmarkRequest,
+    LatencyStats,
+    HistogramBucket,
+    BenchmarkResult,
+    PageResult,
+    PaginatedValidationResult,
+    MonitorConfig,
+    MonitorStatus,
+    StoredResult,
+    RollupBucket,
 )
 
 __all__ = [
@@ -22,8 +41,27 @@ __all__ = [
     "ValidateTokenRequest",
     "ValidateTokenResponse",
     "EndpointInfo",
+    "ResponseOptions",
     "ValidationRequest",
+    "ParameterError",
+    "DriftReport",
     "ValidationResult",
     "HealthCheckRequest",
     "HealthCheckResult",
+    "MultiAccountHealthCheckRequest",
+    "AccountHealthCheckResult",
+    "MultiAccountHealthCheckResult",
+    "BatchJob",
+    "BatchRequest",
+    "PaginatedValidationRequest",
+    "BenchmarkRequest",
+    "LatencyStats",
+    "HistogramBucket",
+    "BenchmarkResult",
+    "PageResult",
+    "PaginatedValidationResult",
+    "MonitorConfig",
+    "MonitorStatus",
+    "StoredResult",
+    "RollupBucket",
 ]
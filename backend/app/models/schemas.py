@@ -1,5 +1,5 @@
-from pydantic import BaseModel, Field
-from typing import Any, Optional
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
+from typing import Any, Literal, Optional
 from datetime import datetime
 from enum import Enum
 
@@ -57,6 +57,8 @@ class ValidateTokenResponse(BaseModel):
 
 
 class EndpointInfo(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     id: str
     name: str
     description: str
@@ -66,10 +68,44 @@ class EndpointInfo(BaseModel):
     parameters: list[dict] = []
 
 
+class ResponseOptions(BaseModel):
+    max_items: Optional[int] = Field(None, ge=0, description="Keep only the first N data items")
+    max_bytes: Optional[int] = Field(None, ge=0, description="Cap the embedded response_data size in bytes")
+    fields: Optional[list[str]] = Field(None, description="Only keep these fields of each data item")
+    summary_only: bool = Field(False, description="Drop response_data, keep data_count and latest_data_date")
+
+
 class ValidationRequest(BaseModel):
     api_token: str = Field(..., description="Sealmetrics API token")
     endpoint_id: str = Field(..., description="ID del endpoint a validar")
     parameters: dict = Field(default_factory=dict, description="Parámetros para el endpoint")
+    response_options: ResponseOptions = Field(default_factory=ResponseOptions)
+    use_cache: bool = Field(False, description="Serve GETs from the ETag-aware response cache")
+    track_drift: bool = Field(False, description="Compare the response with the previous snapshot of the same request")
+
+
+class ParameterError(BaseModel):
+    name: str
+    error: Literal["unknown", "missing", "invalid_enum", "invalid_type"]
+    message: str
+    allowed: Optional[list[Any]] = None
+
+
+class DriftReport(BaseModel):
+    first_snapshot: bool
+    latest_data_date: Optional[str] = None
+    previous_latest_data_date: Optional[str] = None
+    freshness_lag_days: Optional[int] = None
+    item_count: int = 0
+    item_count_delta: int = 0
+    changed: bool = False
+    changed_days: list[str] = Field(default_factory=list)
+    rows_added: int = 0
+    rows_removed: int = 0
+    rows_changed: int = 0
+    day_total_deltas: dict[str, dict[str, float]] = Field(default_factory=dict)
+    unchanged_for_seconds: float = 0
+    previous_snapshot_at: Optional[datetime] = None
 
 
 class ValidationResult(BaseModel):
@@ -85,11 +121,36 @@ class ValidationResult(BaseModel):
     error_message: Optional[str] = None
     data_count: Optional[int] = None
     latest_data_date: Optional[str] = None
+    earliest_data_date: Optional[str] = None
+    null_field_counts: Optional[dict[str, int]] = None
+    schema_fingerprint: Optional[str] = None
+    response_size_bytes: Optional[int] = None
+    response_truncated: bool = False
+    retry_count: int = 0
+    retry_wait_ms: float = 0
+    cache_status: Optional[Literal["hit", "revalidated", "miss"]] = None
+    deduplicated: bool = False
+    hedged: bool = False
+    parameter_errors: Optional[list[ParameterError]] = None
+    drift: Optional[DriftReport] = None
+
+    # Upstream JSON body when response_data is passed through unchanged
+    _raw_response_data: Optional[bytes] = PrivateAttr(None)
+
+    @property
+    def raw_response_data(self) -> Optional[bytes]:
+        return self._raw_response_data
+
+    @raw_response_data.setter
+    def raw_response_data(self, value: Optional[bytes]) -> None:
+        self._raw_response_data = value
 
 
 class HealthCheckRequest(BaseModel):
     api_token: str = Field(..., description="Sealmetrics API token")
     account_id: str = Field(..., description="Account ID para las pruebas")
+    response_options: ResponseOptions = Field(default_factory=ResponseOptions)
+    track_drift: bool = Field(False, description="Compare the response with the previous snapshot of the same request")
 
 
 class HealthCheckResult(BaseModel):
@@ -100,3 +161,187 @@ class HealthCheckResult(BaseModel):
     total_time_ms: float
     timestamp: datetime
     results: list[ValidationResult]
+
+
+class MultiAccountHealthCheckRequest(BaseModel):
+    api_token: str = Field(..., description="Sealmetrics API token")
+    account_ids: Optional[list[str]] = Field(None, description="Accounts to check (default: every account of the token)")
+    endpoint_ids: Optional[list[str]] = Field(None, description="Endpoints to check (default: health check set)")
+    response_options: ResponseOptions = Field(default_factory=lambda: ResponseOptions(summary_only=True))
+    track_drift: bool = Field(False, description="Compare the response with the previous snapshot of the same request")
+
+
+class AccountHealthCheckResult(BaseModel):
+    account_id: str
+    account_name: Optional[str] = None
+    health: HealthCheckResult
+
+
+class MultiAccountHealthCheckResult(BaseModel):
+    overall_status: str  # "healthy", "degraded", "unhealthy"
+    total_accounts: int
+    healthy_accounts: int
+    degraded_accounts: int
+    unhealthy_accounts: int
+    total_endpoints: int
+    successful: int
+    failed: int
+    total_time_ms: float
+    timestamp: datetime
+    accounts: list[AccountHealthCheckResult]
+    unknown_account_ids: list[str] = Field(default_factory=list)
+
+
+class BatchJob(BaseModel):
+    endpoint_id: str = Field(..., description="ID del endpoint a validar")
+    parameters: dict = Field(default_factory=dict, description="Parámetros para el endpoint")
+    matrix: dict[str, list[Any] | Literal["*"]] = Field(
+        default_factory=dict,
+        description='Parameter values to sweep (cartesian product); "*" = every option of an enum parameter',
+    )
+
+
+class BatchRequest(BaseModel):
+    api_token: str = Field(..., description="Sealmetrics API token")
+    account_id: Optional[str] = Field(None, description="Account ID applied to every endpoint that takes one")
+    parameters: dict = Field(default_factory=dict, description="Parameters applied to every endpoint that takes them")
+    jobs: list[BatchJob] = Field(..., min_length=1)
+    response_options: ResponseOptions = Field(default_factory=ResponseOptions)
+    use_cache: bool = Field(False, description="Serve GETs from the ETag-aware response cache")
+    track_drift: bool = Field(False, description="Compare the response with the previous snapshot of the same request")
+    max_concurrency: Optional[int] = Field(None, ge=1, description="Validations in flight at once")
+    deadline_seconds: Optional[float] = Field(None, gt=0, description="Overall time budget shared by every request of the batch")
+
+
+class PaginatedValidationRequest(BaseModel):
+    api_token: str = Field(..., description="Sealmetrics API token")
+    endpoint_id: str = Field(..., description="ID del endpoint a validar")
+    parameters: dict = Field(default_factory=dict, description="Parámetros para el endpoint")
+    page_size: Optional[int] = Field(None, ge=1, description="Rows per page (default: the endpoint's limit default)")
+    max_pages: Optional[int] = Field(None, ge=1, description="Stop after N pages")
+    concurrency: int = Field(1, ge=1, description="Pages in flight at once")
+    use_cache: bool = Field(False, description="Serve GETs from the ETag-aware response cache")
+
+
+class BenchmarkRequest(BaseModel):
+    api_token: str = Field(..., description="Sealmetrics API token")
+    endpoint_id: str = Field(..., description="ID del endpoint a medir")
+    parameters: dict = Field(default_factory=dict, description="Parámetros para el endpoint")
+    concurrency: int = Field(1, ge=1, description="Requests in flight at once")
+    total_requests: Optional[int] = Field(None, ge=1, description="Stop after N requests")
+    duration_seconds: Optional[float] = Field(None, gt=0, description="Stop after this many seconds")
+    target_rps: Optional[float] = Field(None, gt=0, description="Pace requests to this rate")
+    respect_rate_limit: bool = Field(True, description="Go through the per-token rate limiter")
+
+
+class LatencyStats(BaseModel):
+    min_ms: float
+    mean_ms: float
+    p50_ms: float
+    p90_ms: float
+    p99_ms: float
+    max_ms: float
+
+
+class HistogramBucket(BaseModel):
+    upper_ms: float
+    count: int
+
+
+class BenchmarkResult(BaseModel):
+    endpoint_id: str
+    endpoint_name: str
+    total_requests: int
+    successful: int
+    failed: int
+    duration_ms: float
+    throughput_rps: float
+    latency: LatencyStats
+    status_codes: dict[str, int]
+    errors: dict[str, int]
+    histogram: list[HistogramBucket]
+    timestamp: datetime
+
+
+class PageResult(BaseModel):
+    page: int
+    offset: int
+    success: bool
+    status_code: int
+    response_time_ms: float
+    data_count: Optional[int] = None
+    latest_data_date: Optional[str] = None
+    earliest_data_date: Optional[str] = None
+    response_size_bytes: Optional[int] = None
+    error_message: Optional[str] = None
+
+
+class PaginatedValidationResult(BaseModel):
+    endpoint_id: str
+    endpoint_name: str
+    success: bool
+    complete: bool  # False when max_pages was reached before the last page
+    page_size: int
+    pages: int
+    total_rows: int
+    latest_data_date: Optional[str] = None
+    earliest_data_date: Optional[str] = None
+    null_field_counts: dict[str, int] = Field(default_factory=dict)
+    schema_fingerprints: list[str] = Field(default_factory=list)
+    response_size_bytes: int
+    total_time_ms: float
+    latency: LatencyStats
+    page_results: list[PageResult]
+    error_message: Optional[str] = None
+    timestamp: datetime
+
+
+class MonitorConfig(BaseModel):
+    id: str = Field(..., description="Unique monitor id")
+    token_env: str = Field(..., description="Environment variable holding the API token")
+    account_id: str = Field(..., description="Account ID para las pruebas")
+    endpoint_ids: Optional[list[str]] = Field(None, description="Endpoints to check (default: health check set)")
+    interval_seconds: float = Field(300, ge=10, description="Seconds between runs")
+    track_drift: bool = Field(False, description="Compare the response with the previous snapshot of the same request")
+
+
+class MonitorStatus(BaseModel):
+    id: str
+    account_id: str
+    endpoint_ids: list[str]
+    interval_seconds: float
+    running: bool
+    runs: int
+    consecutive_failures: int
+    last_run_at: Optional[datetime] = None
+    last_status: Optional[str] = None
+    last_total_time_ms: Optional[float] = None
+    last_error: Optional[str] = None
+
+
+class StoredResult(BaseModel):
+    timestamp: datetime
+    endpoint_id: str
+    account_id: Optional[str] = None
+    success: bool
+    status_code: int
+    response_time_ms: float
+    data_count: Optional[int] = None
+    latest_data_date: Optional[str] = None
+    response_size_bytes: Optional[int] = None
+    retry_count: int = 0
+    error_message: Optional[str] = None
+
+
+class RollupBucket(BaseModel):
+    endpoint_id: str
+    resolution: Literal["minute", "hour"]
+    bucket_start: datetime
+    count: int
+    errors: int
+    error_rate: float
+    mean_ms: float
+    p50_ms: float
+    p90_ms: float
+    p99_ms: float
+    max_ms: float
@@ -1,4 +1,6 @@
 from .validator import router as validator_router
 from .endpoints import router as endpoints_router
+from .monitors import router as monitors_router
+from .history import router as history_router
 
-__all__ = ["validator_router", "endpoints_router"]
+__all__ = ["validator_router", "endpoints_router", "monitors_router", "history_router"]
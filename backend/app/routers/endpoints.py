@@ -1,4 +1,4 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, Response
 
 from app.models import EndpointInfo, EndpointCategory
 from app.services import EndpointsRegistry
@@ -9,7 +9,10 @@ router = APIRouter(prefix="/endpoints", tags=["Endpoints"])
 @router.get("", response_model=list[EndpointInfo])
 async def list_endpoints():
     """Get all available API endpoints for validation."""
-    return EndpointsRegistry.get_all_endpoints()
+    return Response(
+        content=EndpointsRegistry.get_all_endpoints_json(),
+        media_type="application/json",
+    )
 
 
 @router.get("/categories")
@@ -21,7 +24,10 @@ async def list_categories():
 @router.get("/category/{category}", response_model=list[EndpointInfo])
 async def get_endpoints_by_category(category: EndpointCategory):
     """Get endpoints filtered by category."""
-    return EndpointsRegistry.get_endpoints_by_category(category)
+    return Response(
+        content=EndpointsRegistry.get_endpoints_by_category_json(category),
+        media_type="application/json",
+    )
 
 
 @router.get("/{endpoint_id}", response_model=EndpointInfo | None)
@@ -0,0 +1,38 @@
+from datetime import datetime
+from typing import Literal
+
+from fastapi import APIRouter, HTTPException, Query
+
+from app.models import RollupBucket, StoredResult
+from app.services.result_store import ResultStore, get_result_store
+
+router = APIRouter(prefix="/history", tags=["History"])
+
+
+def _get_store() -> ResultStore:
+    store = get_result_store()
+    if store is None:
+        raise HTTPException(status_code=404, detail="Result history is disabled (set RESULT_STORE_PATH)")
+    return store
+
+
+@router.get("/results", response_model=list[StoredResult])
+async def get_results(
+    endpoint_id: str | None = None,
+    since: datetime | None = None,
+    until: datetime | None = None,
+    limit: int = Query(100, ge=1, le=10000),
+):
+    """Stored validation results, newest first."""
+    return await _get_store().query_results(endpoint_id, since, until, limit)
+
+
+@router.get("/rollups", response_model=list[RollupBucket])
+async def get_rollups(
+    resolution: Literal["minute", "hour"] = "hour",
+    endpoint_id: str | None = None,
+    since: datetime | None = None,
+    until: datetime | None = None,
+):
+    """Per-endpoint request count, error rate and latency percentiles per minute or hour."""
+    return await _get_store().query_rollups(resolution, endpoint_id, since, until)
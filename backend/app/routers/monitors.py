@@ -0,0 +1,43 @@
+from fastapi import APIRouter, HTTPException
+
+from app.models import HealthCheckResult, MonitorStatus
+from app.services.monitor_scheduler import Monitor, get_monitor_scheduler
+
+router = APIRouter(prefix="/monitors", tags=["Monitors"])
+
+
+def _get_monitor(monitor_id: str) -> Monitor:
+    scheduler = get_monitor_scheduler()
+    monitor = scheduler.get(monitor_id) if scheduler else None
+    if monitor is None:
+        raise HTTPException(status_code=404, detail=f"Unknown monitor: {monitor_id}")
+    return monitor
+
+
+@router.get("", response_model=list[MonitorStatus])
+async def list_monitors():
+    """Latest status of every configured monitor."""
+    scheduler = get_monitor_scheduler()
+    if scheduler is None:
+        return []
+    return [m.status() for m in scheduler.monitors.values()]
+
+
+@router.get("/{monitor_id}", response_model=MonitorStatus)
+async def get_monitor(monitor_id: str):
+    """Latest status of a monitor."""
+    return _get_monitor(monitor_id).status()
+
+
+@router.get("/{monitor_id}/results", response_model=list[HealthCheckResult])
+async def get_monitor_results(monitor_id: str, limit: int | None = None):
+    """Recent health check results of a monitor, newest first."""
+    results = list(reversed(_get_monitor(monitor_id).results))
+    return results[:limit] if limit is not None else results
+
+
+@router.post("/{monitor_id}/run", response_model=HealthCheckResult | None)
+async def run_monitor(monitor_id: str):
+    """Run a monitor now (joins the current run if one is in progress)."""
+    _get_monitor(monitor_id)
+    return await get_monitor_scheduler().trigger(monitor_id)
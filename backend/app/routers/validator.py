@@ -1,8 +1,8 @@
 from fastapi import APIRouter, HTTPException
-from datetime import datetime
-import time
-import asyncio
+from fastapi.responses import StreamingResponse
+from typing import AsyncIterator, Literal
 
+from app.config import get_settings
 from app.models import (
     ValidateTokenRequest,
     ValidateTokenResponse,
@@ -10,8 +10,20 @@ from app.models import (
     ValidationResult,
     HealthCheckRequest,
     HealthCheckResult,
+    MultiAccountHealthCheckRequest,
+    MultiAccountHealthCheckResult,
+    BatchRequest,
+    PaginatedValidationRequest,
+    PaginatedValidationResult,
+    BenchmarkRequest,
+    BenchmarkResult,
 )
 from app.services import SealmetricsClient, EndpointsRegistry
+from app.services.batch import BatchError, expand_batch, iter_batch, run_batch
+from app.services.benchmark import run_benchmark
+from app.services.health_check import run_health_check, run_multi_account_health_check
+from app.services.pagination import default_page_size, run_paginated
+from app.services.serialization import ModelJSONResponse, dump_json
 
 router = APIRouter(prefix="/validate", tags=["Validator"])
 
@@ -47,9 +59,15 @@ async def validate_endpoint(request: ValidationRequest):
         )
 
     client = SealmetricsClient(request.api_token)
-    result = await client.validate_endpoint(request.endpoint_id, request.parameters)
+    result = await client.validate_endpoint(
+        request.endpoint_id,
+        request.parameters,
+        request.response_options,
+        use_cache=request.use_cache,
+        track_drift=request.track_drift,
+    )
 
-    return result
+    return ModelJSONResponse(result)
 
 
 @router.post("/health-check", response_model=HealthCheckResult)
@@ -65,83 +83,208 @@ async def health_check(request: HealthCheckRequest):
     if not is_valid:
         raise HTTPException(status_code=401, detail=error or "Invalid API token")
 
-    # Get health check endpoints
-    endpoint_ids = EndpointsRegistry.get_health_check_endpoints()
-
-    start_time = time.perf_counter()
-    results: list[ValidationResult] = []
-
-    # Run validations
-    for endpoint_id in endpoint_ids:
-        # Build parameters based on endpoint
-        params = {}
-        if endpoint_id != "auth_accounts":
-            params = {
-                "account_id": request.account_id,
-                "date_range": "today",
-                "limit": 10,
-            }
-            # Add report_type for endpoints that require it
-            if endpoint_id in ("report_acquisition", "report_funnel"):
-                params["report_type"] = "Source"
-
-        result = await client.validate_endpoint(endpoint_id, params)
-        results.append(result)
-
-    total_time = (time.perf_counter() - start_time) * 1000
-
-    # Calculate overall status
-    successful = sum(1 for r in results if r.success)
-    failed = len(results) - successful
-
-    if failed == 0:
-        status = "healthy"
-    elif successful > 0:
-        status = "degraded"
-    else:
-        status = "unhealthy"
-
-    return HealthCheckResult(
-        overall_status=status,
-        total_endpoints=len(results),
-        successful=successful,
-        failed=failed,
-        total_time_ms=round(total_time, 2),
-        timestamp=datetime.utcnow(),
-        results=results,
+    result = await run_health_check(
+        client,
+        request.account_id,
+        response_options=request.response_options,
+        track_drift=request.track_drift,
     )
+    return ModelJSONResponse(result)
+
+
+@router.post("/health-check/accounts", response_model=MultiAccountHealthCheckResult)
+async def health_check_accounts(request: MultiAccountHealthCheckRequest):
+    """
+    Run the health check across every account of the token (or a subset)
+    in one call, sharing a single token validation.
+    """
+    client = SealmetricsClient(request.api_token)
+
+    is_valid, accounts, error = await client.validate_token()
+    if not is_valid:
+        raise HTTPException(status_code=401, detail=error or "Invalid API token")
+
+    result = await run_multi_account_health_check(
+        client,
+        accounts,
+        account_ids=request.account_ids,
+        endpoint_ids=request.endpoint_ids,
+        response_options=request.response_options,
+        track_drift=request.track_drift,
+    )
+    return ModelJSONResponse(result)
 
 
 @router.post("/batch", response_model=list[ValidationResult])
-async def validate_batch(
-    api_token: str,
-    endpoint_ids: list[str],
-    account_id: str,
-    date_range: str = "today",
-):
+async def validate_batch(request: BatchRequest):
     """
-    Validate multiple endpoints in parallel.
-    Useful for comprehensive API testing.
+    Validate a list of (endpoint, parameters) jobs with bounded concurrency.
+    Parameter matrices are expanded server-side; results follow job order.
     """
-    client = SealmetricsClient(api_token)
+    jobs = _expand_batch(request)
+    client = SealmetricsClient(request.api_token)
 
     # Validate token first
     is_valid, _, error = await client.validate_token()
     if not is_valid:
         raise HTTPException(status_code=401, detail=error or "Invalid API token")
 
-    # Create validation tasks
-    async def validate_one(endpoint_id: str) -> ValidationResult:
-        params = {}
-        if endpoint_id != "auth_accounts":
-            params = {
-                "account_id": account_id,
-                "date_range": date_range,
-                "limit": 10,
-            }
-        return await client.validate_endpoint(endpoint_id, params)
-
-    # Run all validations in parallel
-    results = await asyncio.gather(*[validate_one(eid) for eid in endpoint_ids])
-
-    return list(results)
+    return ModelJSONResponse(await run_batch(client, request, jobs))
+
+
+@router.post("/batch/stream")
+async def validate_batch_stream(request: BatchRequest, format: Literal["ndjson", "sse"] = "ndjson"):
+    """
+    Validate a batch, streaming each result as soon as it completes.
+    Emits NDJSON lines (application/x-ndjson) or Server-Sent Events (text/event-stream).
+    """
+    jobs = _expand_batch(request)
+    client = SealmetricsClient(request.api_token)
+
+    # Validate token first so auth errors are returned before the stream starts
+    is_valid, _, error = await client.validate_token()
+    if not is_valid:
+        raise HTTPException(status_code=401, detail=error or "Invalid API token")
+
+    async def stream() -> AsyncIterator[bytes]:
+        # Closing the generator (client went away) cancels pending validations
+        async for result in iter_batch(client, request, jobs):
+            payload = dump_json(result)
+            if format == "sse":
+                yield b"event: result\ndata: " + payload + b"\n\n"
+            else:
+                yield payload + b"\n"
+        if format == "sse":
+            yield b"event: done\ndata: {}\n\n"
+
+    media_type = "text/event-stream" if format == "sse" else "application/x-ndjson"
+    return StreamingResponse(
+        stream(),
+        media_type=media_type,
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.post("/paginated", response_model=PaginatedValidationResult)
+async def validate_paginated(request: PaginatedValidationRequest):
+    """
+    Validate every page of a report endpoint (limit/skip), one request per page.
+    Reports total rows, date range, pages and per-page latency; page payloads are not kept.
+    """
+    settings = get_settings()
+
+    endpoint = EndpointsRegistry.get_endpoint_by_id(request.endpoint_id)
+    if not endpoint:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unknown endpoint: {request.endpoint_id}",
+        )
+    if not EndpointsRegistry.is_paginated(endpoint.id):
+        raise HTTPException(
+            status_code=400,
+            detail=f"Endpoint does not support pagination: {endpoint.id}",
+        )
+    max_pages = request.max_pages or min(settings.pagination_default_max_pages, settings.pagination_max_pages)
+    if max_pages > settings.pagination_max_pages:
+        raise HTTPException(
+            status_code=400,
+            detail=f"max_pages must be <= {settings.pagination_max_pages}",
+        )
+    if request.concurrency > settings.pagination_max_concurrency:
+        raise HTTPException(
+            status_code=400,
+            detail=f"concurrency must be <= {settings.pagination_max_concurrency}",
+        )
+    if settings.parameter_validation_enabled:
+        _, errors = EndpointsRegistry.get_params_validator(endpoint.id).validate(request.parameters)
+        if errors:
+            raise HTTPException(status_code=400, detail=[e.model_dump() for e in errors])
+
+    # One history row per page would flood the store
+    client = SealmetricsClient(request.api_token, store_results=False)
+    is_valid, _, error = await client.validate_token()
+    if not is_valid:
+        raise HTTPException(status_code=401, detail=error or "Invalid API token")
+
+    result = await run_paginated(
+        client,
+        endpoint,
+        request.parameters,
+        page_size=request.page_size or default_page_size(endpoint),
+        max_pages=max_pages,
+        concurrency=request.concurrency,
+        use_cache=request.use_cache,
+    )
+    return ModelJSONResponse(result)
+
+
+@router.post("/benchmark", response_model=BenchmarkResult)
+async def benchmark(request: BenchmarkRequest):
+    """
+    Run an endpoint repeatedly at a fixed concurrency or target rate.
+    Reports latency percentiles, throughput, status codes and a histogram.
+    """
+    settings = get_settings()
+
+    if not EndpointsRegistry.get_endpoint_by_id(request.endpoint_id):
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unknown endpoint: {request.endpoint_id}",
+        )
+    if request.concurrency > settings.benchmark_max_concurrency:
+        raise HTTPException(
+            status_code=400,
+            detail=f"concurrency must be <= {settings.benchmark_max_concurrency}",
+        )
+    if request.total_requests is not None and request.total_requests > settings.benchmark_max_requests:
+        raise HTTPException(
+            status_code=400,
+            detail=f"total_requests must be <= {settings.benchmark_max_requests}",
+        )
+
+    duration = request.duration_seconds
+    if duration is not None and duration > settings.benchmark_max_duration_seconds:
+        raise HTTPException(
+            status_code=400,
+            detail=f"duration_seconds must be <= {settings.benchmark_max_duration_seconds}",
+        )
+    if settings.parameter_validation_enabled:
+        _, errors = EndpointsRegistry.get_params_validator(request.endpoint_id).validate(request.parameters)
+        if errors:
+            raise HTTPException(status_code=400, detail=[e.model_dump() for e in errors])
+
+    total_requests = request.total_requests
+    if duration is not None and total_requests is None:
+        total_requests = settings.benchmark_max_requests
+
+    # Retries, deduplication and hedging would hide the latency being measured;
+    # individual benchmark requests are not validation history
+    client = SealmetricsClient(
+        request.api_token,
+        rate_limited=request.respect_rate_limit,
+        max_retries=0,
+        deduplicate=False,
+        hedge=False,
+        store_results=False,
+    )
+
+    is_valid, _, error = await client.validate_token()
+    if not is_valid:
+        raise HTTPException(status_code=401, detail=error or "Invalid API token")
+
+    return await run_benchmark(
+        client,
+        request.endpoint_id,
+        request.parameters,
+        concurrency=request.concurrency,
+        total_requests=total_requests,
+        duration_seconds=duration,
+        target_rps=request.target_rps,
+    )
+
+
+def _expand_batch(request: BatchRequest) -> list[tuple[str, dict]]:
+    try:
+        return expand_batch(request)
+    except BatchError as e:
+        raise HTTPException(status_code=400, detail=str(e))
@@ -0,0 +1,114 @@
+import asyncio
+import itertools
+import time
+from typing import AsyncIterator, Awaitable, Callable
+
+from app.config import get_settings
+from app.models import BatchRequest, EndpointInfo, ValidationResult
+from app.services.deadline import deadline
+from app.services.endpoints_registry import EndpointsRegistry
+from app.services.health_check import build_health_check_params
+from app.services.sealmetrics_client import SealmetricsClient
+
+
+class BatchError(ValueError):
+    """The batch request cannot be expanded (unknown endpoint, bad matrix, too many jobs)."""
+
+
+def _matrix_values(endpoint: EndpointInfo, name: str, values: list | str) -> list:
+    if values != "*":
+        return list(values)
+    spec = next((p for p in endpoint.parameters if p["name"] == name), None)
+    if spec is None or not spec.get("options"):
+        raise BatchError(f'"*" needs an enum parameter: {endpoint.id}.{name}')
+    return list(spec["options"])
+
+
+def expand_batch(request: BatchRequest) -> list[tuple[str, dict]]:
+    """
+    Expand the jobs of a batch into (endpoint_id, params) pairs, in order.
+    Params are layered: health check defaults for the account, then the
+    request-wide parameters the endpoint accepts, then the job's own
+    parameters, then one combination of its matrix.
+    """
+    max_jobs = get_settings().batch_max_jobs
+    expanded: list[tuple[str, dict]] = []
+
+    for job in request.jobs:
+        endpoint = EndpointsRegistry.get_endpoint_by_id(job.endpoint_id)
+        if endpoint is None:
+            raise BatchError(f"Unknown endpoint: {job.endpoint_id}")
+
+        accepted = {p["name"] for p in endpoint.parameters}
+        base = build_health_check_params(endpoint.id, request.account_id) if request.account_id else {}
+        base.update({k: v for k, v in request.parameters.items() if k in accepted})
+        base.update(job.parameters)
+
+        names = list(job.matrix)
+        value_lists = [_matrix_values(endpoint, name, job.matrix[name]) for name in names]
+        for combination in itertools.product(*value_lists):
+            expanded.append((endpoint.id, {**base, **dict(zip(names, combination))}))
+            if len(expanded) > max_jobs:
+                raise BatchError(f"Batch expands to more than {max_jobs} jobs")
+
+    return expanded
+
+
+def _job_runner(
+    client: SealmetricsClient,
+    request: BatchRequest,
+) -> Callable[[str, dict], Awaitable[ValidationResult]]:
+    """
+    Validation coroutine for one job, bounded by the batch concurrency.
+    Every job shares the batch deadline, counted from now.
+    """
+    settings = get_settings()
+    limit = settings.batch_max_concurrency
+    semaphore = asyncio.Semaphore(min(request.max_concurrency or limit, limit))
+    budget = request.deadline_seconds or settings.batch_default_deadline_seconds
+    expires_at = time.monotonic() + budget if budget else None
+
+    async def run_one(endpoint_id: str, params: dict) -> ValidationResult:
+        with deadline(expires_at):
+            async with semaphore:
+                return await client.validate_endpoint(
+                    endpoint_id,
+                    params,
+                    request.response_options,
+                    use_cache=request.use_cache,
+                    track_drift=request.track_drift,
+                )
+
+    return run_one
+
+
+async def run_batch(
+    client: SealmetricsClient,
+    request: BatchRequest,
+    jobs: list[tuple[str, dict]],
+) -> list[ValidationResult]:
+    """Validate the expanded jobs with bounded concurrency. Results keep the job order."""
+    run_one = _job_runner(client, request)
+    return list(await asyncio.gather(*[run_one(eid, params) for eid, params in jobs]))
+
+
+async def iter_batch(
+    client: SealmetricsClient,
+    request: BatchRequest,
+    jobs: list[tuple[str, dict]],
+) -> AsyncIterator[ValidationResult]:
+    """
+    Like run_batch(), but yields results as they complete.
+    Pending validations, and their upstream requests, are cancelled when
+    the consumer stops iterating.
+    """
+    run_one = _job_runner(client, request)
+    tasks = [asyncio.create_task(run_one(eid, params)) for eid, params in jobs]
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            yield await next_done
+    finally:
+        for task in tasks:
+            task.cancel()
+        # Wait for them to unwind, so their upstream connections and slots are released
+        await asyncio.gather(*tasks, return_exceptions=True)
@@ -0,0 +1,108 @@
+import asyncio
+import time
+from datetime import datetime
+
+from app.models import BenchmarkResult, HistogramBucket, LatencyStats, ResponseOptions
+from app.services.histogram import LatencyHistogram
+from app.services.sealmetrics_client import SealmetricsClient
+
+# Only the stats are kept per request, never the payload
+_BENCHMARK_RESPONSE_OPTIONS = ResponseOptions(summary_only=True)
+
+DEFAULT_TOTAL_REQUESTS = 100
+
+# Distinct error messages tracked before grouping the rest as "other"
+MAX_ERROR_KINDS = 50
+
+
+async def run_benchmark(
+    client: SealmetricsClient,
+    endpoint_id: str,
+    parameters: dict,
+    concurrency: int = 1,
+    total_requests: int | None = None,
+    duration_seconds: float | None = None,
+    target_rps: float | None = None,
+) -> BenchmarkResult:
+    """
+    Drive an endpoint with `concurrency` workers until `total_requests` have
+    been sent or `duration_seconds` have elapsed, optionally paced to
+    `target_rps`. Latencies go into a fixed-memory histogram.
+    """
+    if total_requests is None and duration_seconds is None:
+        total_requests = DEFAULT_TOTAL_REQUESTS
+
+    histogram = LatencyHistogram()
+    status_codes: dict[str, int] = {}
+    errors: dict[str, int] = {}
+    successful = 0
+    sent = 0
+    endpoint_name = endpoint_id
+
+    start_time = time.perf_counter()
+    deadline = start_time + duration_seconds if duration_seconds is not None else None
+
+    def claim() -> int | None:
+        """Reserve the next request slot, or None when the run is over."""
+        nonlocal sent
+        if total_requests is not None and sent >= total_requests:
+            return None
+        if deadline is not None and time.perf_counter() >= deadline:
+            return None
+        sent += 1
+        return sent - 1
+
+    async def worker() -> None:
+        nonlocal successful, endpoint_name
+        while (sequence := claim()) is not None:
+            if target_rps is not None:
+                # Open-loop pacing: request i is due at start + i / rps
+                delay = start_time + sequence / target_rps - time.perf_counter()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+
+            result = await client.validate_endpoint_record(
+                endpoint_id, parameters, _BENCHMARK_RESPONSE_OPTIONS
+            )
+            endpoint_name = result.endpoint_name
+            histogram.record(result.response_time_ms)
+
+            status = str(result.status_code)
+            status_codes[status] = status_codes.get(status, 0) + 1
+            if result.success:
+                successful += 1
+            else:
+                error = result.error_message or f"HTTP {result.status_code}"
+                if error not in errors and len(errors) >= MAX_ERROR_KINDS:
+                    error = "other"
+                errors[error] = errors.get(error, 0) + 1
+
+    await asyncio.gather(*[worker() for _ in range(concurrency)])
+    duration_ms = (time.perf_counter() - start_time) * 1000
+
+    completed = histogram.total_count
+    p = histogram.percentiles([50, 90, 99])
+
+    return BenchmarkResult(
+        endpoint_id=endpoint_id,
+        endpoint_name=endpoint_name,
+        total_requests=completed,
+        successful=successful,
+        failed=completed - successful,
+        duration_ms=round(duration_ms, 2),
+        throughput_rps=round(completed / (duration_ms / 1000), 2) if duration_ms else 0.0,
+        latency=LatencyStats(
+            min_ms=histogram.min_ms,
+            mean_ms=round(histogram.mean_ms, 3),
+            p50_ms=p[50],
+            p90_ms=p[90],
+            p99_ms=p[99],
+            max_ms=histogram.max_ms,
+        ),
+        status_codes=status_codes,
+        errors=errors,
+        histogram=[
+            HistogramBucket(upper_ms=upper, count=count) for upper, count in histogram.buckets()
+        ],
+        timestamp=datetime.utcnow(),
+    )
@@ -0,0 +1,55 @@
+import asyncio
+from contextlib import asynccontextmanager
+from functools import lru_cache
+from typing import AsyncIterator
+
+from app.config import get_settings
+from app.services.token_hash import hash_token
+
+
+class ConcurrencyLimiter:
+    """
+    Bounds concurrent upstream calls globally and per API token.
+    Per-token semaphores are created on demand and dropped once idle.
+    """
+
+    def __init__(self, global_limit: int, per_token_limit: int):
+        self.global_limit = global_limit
+        self.per_token_limit = per_token_limit
+        self._global = asyncio.Semaphore(global_limit)
+        self._per_token: dict[str, asyncio.Semaphore] = {}
+        self._users: dict[str, int] = {}
+
+    @asynccontextmanager
+    async def slot(self, api_token: str) -> AsyncIterator[None]:
+        """Hold one global and one per-token slot for the duration of the block."""
+        key = hash_token(api_token)
+        semaphore = self._per_token.get(key)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self.per_token_limit)
+            self._per_token[key] = semaphore
+        self._users[key] = self._users.get(key, 0) + 1
+        try:
+            async with semaphore:
+                async with self._global:
+                    yield
+        finally:
+            self._users[key] -= 1
+            if self._users[key] == 0:
+                del self._users[key]
+                del self._per_token[key]
+
+    @asynccontextmanager
+    async def global_slot(self) -> AsyncIterator[None]:
+        """Hold only a global slot, for callers that bound their per-token calls themselves."""
+        async with self._global:
+            yield
+
+
+@lru_cache
+def get_health_check_limiter() -> ConcurrencyLimiter:
+    settings = get_settings()
+    return ConcurrencyLimiter(
+        global_limit=settings.health_check_max_concurrency,
+        per_token_limit=settings.health_check_per_token_concurrency,
+    )
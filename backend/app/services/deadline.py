@@ -0,0 +1,58 @@
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator
+
+import httpx
+
+# time.monotonic() by which every upstream call of the current task must finish
+_deadline: ContextVar[float | None] = ContextVar("upstream_deadline", default=None)
+
+
+@contextmanager
+def deadline(expires_at: float | None) -> Iterator[None]:
+    """
+    Bound the upstream calls made inside the block (and by the tasks it
+    creates) to finish by `expires_at` (time.monotonic()). Nested
+    deadlines can only shorten the budget. None leaves it unchanged.
+    """
+    current = _deadline.get()
+    if expires_at is None or (current is not None and current <= expires_at):
+        yield
+        return
+    token = _deadline.set(expires_at)
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+def current() -> float | None:
+    """The current deadline (time.monotonic()), or None without one."""
+    return _deadline.get()
+
+
+def remaining() -> float | None:
+    """Seconds left before the current deadline (may be <= 0), or None without one."""
+    expires_at = _deadline.get()
+    if expires_at is None:
+        return None
+    return expires_at - time.monotonic()
+
+
+def clip_timeout(timeout: httpx.Timeout) -> httpx.Timeout:
+    """Shorten every phase of a timeout to the time left before the deadline."""
+    left = remaining()
+    if left is None:
+        return timeout
+    left = max(left, 0.0)
+
+    def clip(value: float | None) -> float:
+        return left if value is None else min(value, left)
+
+    return httpx.Timeout(
+        connect=clip(timeout.connect),
+        read=clip(timeout.read),
+        write=clip(timeout.write),
+        pool=clip(timeout.pool),
+    )
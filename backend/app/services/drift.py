@@ -0,0 +1,239 @@
+import hashlib
+import json
+import time
+from array import array
+from collections import Counter, OrderedDict
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from functools import lru_cache
+from typing import Any, Hashable
+
+from app.config import get_settings
+from app.models import DriftReport
+from app.services.response_analysis import AnalyzerFactory
+
+_MASK = (1 << 64) - 1
+# Rough per-day bookkeeping overhead, for the byte budget
+_DAY_OVERHEAD = 200
+
+
+def _hash(value: Any) -> int:
+    """
+    64-bit hash of a row. Uses the builtin hash for flat rows (snapshots
+    never leave the process, so its per-process seed doesn't matter) and
+    falls back to hashing canonical JSON for nested values.
+    """
+    try:
+        if isinstance(value, dict):
+            return hash(tuple(sorted(value.items()))) & _MASK
+        return hash(value) & _MASK
+    except TypeError:
+        encoded = json.dumps(value, sort_keys=True, separators=(",", ":"), default=str).encode("utf-8")
+        return int.from_bytes(hashlib.blake2b(encoded, digest_size=8).digest(), "little")
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+@dataclass
+class DayFingerprint:
+    """
+    Hashed rows of one day of data. Each row is a (key, value) hash pair:
+    the key covers its dimensions (non-numeric fields), the value the
+    whole row, so a row whose metrics moved shows up as changed rather
+    than as removed + added.
+    """
+
+    rows: int = 0
+    digest: int = 0  # order-independent sum of the row hashes
+    totals: dict[str, float] = field(default_factory=dict)
+    keys: array = field(default_factory=lambda: array("Q"))
+    values: array = field(default_factory=lambda: array("Q"))
+
+    def pairs(self) -> Counter:
+        return Counter(zip(self.keys, self.values))
+
+
+@dataclass
+class Fingerprint:
+    """Compact fingerprint of a response: item count, latest date and per-day row hashes."""
+
+    item_count: int
+    latest_date: str | None
+    days: dict[str, DayFingerprint]  # "" holds rows without a date
+
+    @property
+    def size(self) -> int:
+        return sum(
+            _DAY_OVERHEAD + day.keys.itemsize * (len(day.keys) + len(day.values)) for day in self.days.values()
+        )
+
+
+class FingerprintBuilder:
+    """Hashes data items as they are analyzed (see ResponseAnalyzer.fingerprinter)."""
+
+    def __init__(self):
+        self.count = 0
+        self.days: dict[str, DayFingerprint] = {}
+
+    def feed(self, item: Any, day: str | None) -> None:
+        self.count += 1
+        bucket = self.days.get(day or "")
+        if bucket is None:
+            bucket = self.days[day or ""] = DayFingerprint()
+
+        if isinstance(item, dict):
+            dimensions = {}
+            row = {}
+            for key, value in item.items():
+                if _is_number(value):
+                    # Streamed bodies parse every number as a float
+                    row[key] = float(value)
+                    bucket.totals[key] = bucket.totals.get(key, 0) + value
+                else:
+                    row[key] = dimensions[key] = value
+            key_hash, value_hash = _hash(dimensions), _hash(row)
+        else:
+            key_hash = value_hash = _hash(item)
+
+        bucket.rows += 1
+        bucket.digest = (bucket.digest + value_hash) & _MASK
+        bucket.keys.append(key_hash)
+        bucket.values.append(value_hash)
+
+    def build(self, latest_date: str | None) -> Fingerprint:
+        return Fingerprint(item_count=self.count, latest_date=latest_date, days=self.days)
+
+
+def with_fingerprint(analyzer_factory: AnalyzerFactory) -> AnalyzerFactory:
+    """Wrap an analyzer factory so its analyzers also build a Fingerprint."""
+
+    def create():
+        analyzer = analyzer_factory()
+        analyzer.fingerprinter = FingerprintBuilder()
+        return analyzer
+
+    return create
+
+
+@dataclass
+class _Snapshot:
+    fingerprint: Fingerprint
+    taken_at: float  # time.time()
+    changed_at: float
+
+
+def _diff_day(previous: DayFingerprint | None, current: DayFingerprint | None) -> tuple[int, int, int]:
+    """(added, removed, changed) rows between two versions of a day."""
+    before = previous.pairs() if previous else Counter()
+    after = current.pairs() if current else Counter()
+    added, removed = after - before, before - after
+    added_keys = Counter(key for key, _ in added.elements())
+    removed_keys = Counter(key for key, _ in removed.elements())
+    changed = sum((added_keys & removed_keys).values())
+    return sum(added.values()) - changed, sum(removed.values()) - changed, changed
+
+
+def _total_deltas(previous: DayFingerprint | None, current: DayFingerprint | None) -> dict[str, float]:
+    before = previous.totals if previous else {}
+    after = current.totals if current else {}
+    deltas = {}
+    for name in dict.fromkeys([*before, *after]):
+        delta = after.get(name, 0) - before.get(name, 0)
+        if delta:
+            deltas[name] = round(delta, 6)
+    return deltas
+
+
+def freshness_lag_days(latest_date: str | None, today: date | None = None) -> int | None:
+    """Days between the newest data date (YYYY-MM-DD) and today (UTC)."""
+    if latest_date is None:
+        return None
+    try:
+        latest = date.fromisoformat(latest_date)
+    except ValueError:
+        return None
+    return ((today or datetime.utcnow().date()) - latest).days
+
+
+class DriftTracker:
+    """
+    Keeps the fingerprint of the last response per (token, endpoint,
+    params) and compares each new one against it. Only days whose digest
+    changed are diffed row by row. Byte-bounded LRU, like ResponseCache.
+    """
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self.total_bytes = 0
+        self._snapshots: OrderedDict[Hashable, _Snapshot] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._snapshots)
+
+    def observe(self, key: Hashable, fingerprint: Fingerprint) -> DriftReport:
+        """Compare a fingerprint with the previous one for the key, then make it the new snapshot."""
+        now = time.time()
+        previous = self._snapshots.get(key)
+        report = self._compare(previous, fingerprint, now)
+        changed_at = now if previous is None or report.changed else previous.changed_at
+        self._set(key, _Snapshot(fingerprint=fingerprint, taken_at=now, changed_at=changed_at))
+        return report
+
+    def _compare(self, previous: _Snapshot | None, fingerprint: Fingerprint, now: float) -> DriftReport:
+        report = DriftReport(
+            first_snapshot=previous is None,
+            latest_data_date=fingerprint.latest_date,
+            freshness_lag_days=freshness_lag_days(fingerprint.latest_date),
+            item_count=fingerprint.item_count,
+        )
+        if previous is None:
+            return report
+
+        before = previous.fingerprint
+        report.previous_latest_data_date = before.latest_date
+        report.previous_snapshot_at = datetime.utcfromtimestamp(previous.taken_at)
+        report.item_count_delta = fingerprint.item_count - before.item_count
+
+        for day in sorted(set(before.days) | set(fingerprint.days)):
+            old, new = before.days.get(day), fingerprint.days.get(day)
+            if old is not None and new is not None and old.rows == new.rows and old.digest == new.digest:
+                continue
+            added, removed, changed = _diff_day(old, new)
+            report.rows_added += added
+            report.rows_removed += removed
+            report.rows_changed += changed
+            report.changed_days.append(day)
+            deltas = _total_deltas(old, new)
+            if deltas:
+                report.day_total_deltas[day] = deltas
+
+        report.changed = bool(report.changed_days)
+        report.unchanged_for_seconds = 0.0 if report.changed else round(now - previous.changed_at, 3)
+        return report
+
+    def _set(self, key: Hashable, snapshot: _Snapshot) -> None:
+        self.invalidate(key)
+        size = snapshot.fingerprint.size
+        if size > self.max_bytes:
+            return
+        self._snapshots[key] = snapshot
+        self.total_bytes += size
+        while self.total_bytes > self.max_bytes:
+            _, evicted = self._snapshots.popitem(last=False)
+            self.total_bytes -= evicted.fingerprint.size
+
+    def invalidate(self, key: Hashable) -> None:
+        snapshot = self._snapshots.pop(key, None)
+        if snapshot is not None:
+            self.total_bytes -= snapshot.fingerprint.size
+
+    def clear(self) -> None:
+        self._snapshots.clear()
+        self.total_bytes = 0
+
+
+@lru_cache
+def get_drift_tracker() -> DriftTracker:
+    return DriftTracker(max_bytes=get_settings().drift_max_bytes)
@@ -1,4 +1,341 @@
+from types import MappingProxyType
+
+import httpx
+from pydantic import TypeAdapter
+
 from app.models import EndpointInfo, EndpointCategory, DateRange, ReportType, TimeUnit, FunnelReportType
+from app.services.param_validation import ParamsValidator
+from app.services.response_analysis import AnalyzerFactory, CountingAnalyzer, ResponseAnalyzer
+
+
+def _build_endpoints() -> tuple[EndpointInfo, ...]:
+    """Endpoint definitions. Evaluated once at import time."""
+    return (
+        # Authentication
+        EndpointInfo(
+            id="auth_accounts",
+            name="Get Accounts",
+            description="Retrieves all accounts accessible with the provided API token",
+            method="GET",
+            path="/auth/accounts",
+            category=EndpointCategory.AUTHENTICATION,
+            parameters=[],
+        ),
+        # Reports
+        EndpointInfo(
+            id="report_acquisition",
+            name="Traffic / Acquisition",
+            description="Get traffic and acquisition data by source, medium, campaign, or term",
+            method="GET",
+            path="/report/acquisition",
+            category=EndpointCategory.REPORTS,
+            parameters=[
+                {
+                    "name": "account_id",
+                    "type": "string",
+                    "required": True,
+                    "description": "Account ID",
+                },
+                {
+                    "name": "date_range",
+                    "type": "enum",
+                    "required": True,
+                    "description": "Date range for the report",
+                    "options": [e.value for e in DateRange],
+                    "default": "last_30_days",
+                },
+                {
+                    "name": "report_type",
+                    "type": "enum",
+                    "required": False,
+                    "description": "Group data by source, medium, campaign, or term",
+                    "options": [e.value for e in ReportType],
+                    "default": "Source",
+                },
+                {
+                    "name": "utm_source",
+                    "type": "string",
+                    "required": False,
+                    "description": "Filter by UTM source",
+                },
+                {
+                    "name": "utm_medium",
+                    "type": "string",
+                    "required": False,
+                    "description": "Filter by UTM medium",
+                },
+                {
+                    "name": "utm_campaign",
+                    "type": "string",
+                    "required": False,
+                    "description": "Filter by UTM campaign",
+                },
+                {
+                    "name": "limit",
+                    "type": "integer",
+                    "required": False,
+                    "description": "Max results to return",
+                    "default": 100,
+                },
+                {
+                    "name": "skip",
+                    "type": "integer",
+                    "required": False,
+                    "description": "Results to skip (pagination offset)",
+                },
+            ],
+        ),
+        EndpointInfo(
+            id="report_conversions",
+            name="Conversions",
+            description="Get conversion and sales data",
+            method="GET",
+            path="/report/conversions",
+            category=EndpointCategory.REPORTS,
+            parameters=[
+                {
+                    "name": "account_id",
+                    "type": "string",
+                    "required": True,
+                    "description": "Account ID",
+                },
+                {
+                    "name": "date_range",
+                    "type": "enum",
+                    "required": True,
+                    "description": "Date range for the report",
+                    "options": [e.value for e in DateRange],
+                    "default": "last_30_days",
+                },
+                {
+                    "name": "utm_source",
+                    "type": "string",
+                    "required": False,
+                    "description": "Filter by UTM source",
+                },
+                {
+                    "name": "utm_medium",
+                    "type": "string",
+                    "required": False,
+                    "description": "Filter by UTM medium",
+                },
+                {
+                    "name": "utm_campaign",
+                    "type": "string",
+                    "required": False,
+                    "description": "Filter by UTM campaign",
+                },
+                {
+                    "name": "limit",
+                    "type": "integer",
+                    "required": False,
+                    "description": "Max results to return",
+                    "default": 100,
+                },
+                {
+                    "name": "skip",
+                    "type": "integer",
+                    "required": False,
+                    "description": "Results to skip (pagination offset)",
+                },
+            ],
+        ),
+        EndpointInfo(
+            id="report_microconversions",
+            name="Microconversions",
+            description="Get microconversion events (add-to-cart, signups, etc.)",
+            method="GET",
+            path="/report/microconversions",
+            category=EndpointCategory.REPORTS,
+            parameters=[
+                {
+                    "name": "account_id",
+                    "type": "string",
+                    "required": True,
+                    "description": "Account ID",
+                },
+                {
+                    "name": "date_range",
+                    "type": "enum",
+                    "required": True,
+                    "description": "Date range for the report",
+                    "options": [e.value for e in DateRange],
+                    "default": "last_30_days",
+                },
+                {
+                    "name": "label",
+                    "type": "string",
+                    "required": False,
+                    "description": "Filter by microconversion label",
+                },
+                {
+                    "name": "limit",
+                    "type": "integer",
+                    "required": False,
+                    "description": "Max results to return",
+                    "default": 100,
+                },
+                {
+                    "name": "skip",
+                    "type": "integer",
+                    "required": False,
+                    "description": "Results to skip (pagination offset)",
+                },
+            ],
+        ),
+        EndpointInfo(
+            id="report_pages",
+            name="Pages Performance",
+            description="Get page-level performance metrics",
+            method="GET",
+            path="/report/pages",
+            category=EndpointCategory.REPORTS,
+            parameters=[
+                {
+                    "name": "account_id",
+                    "type": "string",
+                    "required": True,
+                    "description": "Account ID",
+                },
+                {
+                    "name": "date_range",
+                    "type": "enum",
+                    "required": True,
+                    "description": "Date range for the report",
+                    "options": [e.value for e in DateRange],
+                    "default": "last_30_days",
+                },
+                {
+                    "name": "content_grouping",
+                    "type": "string",
+                    "required": False,
+                    "description": "Group pages by content category",
+                },
+                {
+                    "name": "show_utms",
+                    "type": "boolean",
+                    "required": False,
+                    "description": "Include UTM parameters in results",
+                    "default": False,
+                },
+                {
+                    "name": "limit",
+                    "type": "integer",
+                    "required": False,
+                    "description": "Max results to return",
+                    "default": 100,
+                },
+                {
+                    "name": "skip",
+                    "type": "integer",
+                    "required": False,
+                    "description": "Results to skip (pagination offset)",
+                },
+            ],
+        ),
+        EndpointInfo(
+            id="report_funnel",
+            name="Funnel Analysis",
+            description="Get conversion funnel data",
+            method="GET",
+            path="/report/funnel",
+            category=EndpointCategory.REPORTS,
+            parameters=[
+                {
+                    "name": "account_id",
+                    "type": "string",
+                    "required": True,
+                    "description": "Account ID",
+                },
+                {
+                    "name": "date_range",
+                    "type": "enum",
+                    "required": True,
+                    "description": "Date range for the report",
+                    "options": [e.value for e in DateRange],
+                    "default": "last_30_days",
+                },
+                {
+                    "name": "report_type",
+                    "type": "enum",
+                    "required": False,
+                    "description": "Group funnel data by dimension",
+                    "options": [e.value for e in FunnelReportType],
+                    "default": "by_source",
+                },
+            ],
+        ),
+        EndpointInfo(
+            id="report_roas_evolution",
+            name="ROAS Evolution",
+            description="Get ROAS (Return on Ad Spend) over time",
+            method="GET",
+            path="/report/roas-evolution",
+            category=EndpointCategory.REPORTS,
+            parameters=[
+                {
+                    "name": "account_id",
+                    "type": "string",
+                    "required": True,
+                    "description": "Account ID",
+                },
+                {
+                    "name": "date_range",
+                    "type": "enum",
+                    "required": True,
+                    "description": "Date range for the report",
+                    "options": [e.value for e in DateRange],
+                    "default": "last_30_days",
+                },
+                {
+                    "name": "time_unit",
+                    "type": "enum",
+                    "required": False,
+                    "description": "Time granularity",
+                    "options": [e.value for e in TimeUnit],
+                    "default": "daily",
+                },
+            ],
+        ),
+    )
+
+
+_ENDPOINTS: tuple[EndpointInfo, ...] = _build_endpoints()
+_BY_ID: MappingProxyType = MappingProxyType({e.id: e for e in _ENDPOINTS})
+_BY_CATEGORY: MappingProxyType = MappingProxyType(
+    {c: tuple(e for e in _ENDPOINTS if e.category == c) for c in EndpointCategory}
+)
+_HEALTH_CHECK_IDS: tuple[str, ...] = tuple(e.id for e in _ENDPOINTS)
+
+# Response analyzers for endpoints whose items need custom handling
+_ANALYZERS: MappingProxyType = MappingProxyType({
+    "auth_accounts": CountingAnalyzer,
+})
+
+# Upstream timeouts per httpx phase (connect/read/write/pool), in seconds.
+# read is the longest gap between bytes, not the whole response.
+_DEFAULT_TIMEOUT = httpx.Timeout(connect=5.0, read=60.0, write=10.0, pool=10.0)
+_TIMEOUTS: MappingProxyType = MappingProxyType({
+    "auth_accounts": httpx.Timeout(connect=5.0, read=30.0, write=10.0, pool=10.0),
+    # Funnel tails come from stuck connections: give up on them early so
+    # retries and hedged requests can take over
+    "report_funnel": httpx.Timeout(connect=2.0, read=30.0, write=5.0, pool=5.0),
+})
+
+# Endpoints that page with limit/skip
+_PAGINATED: frozenset[str] = frozenset(
+    e.id for e in _ENDPOINTS if {"limit", "skip"} <= {p["name"] for p in e.parameters}
+)
+
+# Parameter validators compiled from the specs
+_VALIDATORS: MappingProxyType = MappingProxyType({e.id: ParamsValidator(e.id, e.parameters) for e in _ENDPOINTS})
+
+# Pre-serialized bodies so the listing routes skip re-validation
+_endpoints_adapter = TypeAdapter(tuple[EndpointInfo, ...])
+_ALL_JSON: bytes = _endpoints_adapter.dump_json(_ENDPOINTS)
+_BY_CATEGORY_JSON: MappingProxyType = MappingProxyType(
+    {c: _endpoints_adapter.dump_json(endpoints) for c, endpoints in _BY_CATEGORY.items()}
+)
 
 
 class EndpointsRegistry:
@@ -6,283 +343,47 @@ class EndpointsRegistry:
 
     @staticmethod
     def get_all_endpoints() -> list[EndpointInfo]:
-        return [
-            # Authentication
-            EndpointInfo(
-                id="auth_accounts",
-                name="Get Accounts",
-                description="Retrieves all accounts accessible with the provided API token",
-                method="GET",
-                path="/auth/accounts",
-                category=EndpointCategory.AUTHENTICATION,
-                parameters=[],
-            ),
-            # Reports
-            EndpointInfo(
-                id="report_acquisition",
-                name="Traffic / Acquisition",
-                description="Get traffic and acquisition data by source, medium, campaign, or term",
-                method="GET",
-                path="/report/acquisition",
-                category=EndpointCategory.REPORTS,
-                parameters=[
-                    {
-                        "name": "account_id",
-                        "type": "string",
-                        "required": True,
-                        "description": "Account ID",
-                    },
-                    {
-                        "name": "date_range",
-                        "type": "enum",
-                        "required": True,
-                        "description": "Date range for the report",
-                        "options": [e.value for e in DateRange],
-                        "default": "last_30_days",
-                    },
-                    {
-                        "name": "report_type",
-                        "type": "enum",
-                        "required": False,
-                        "description": "Group data by source, medium, campaign, or term",
-                        "options": [e.value for e in ReportType],
-                        "default": "Source",
-                    },
-                    {
-                        "name": "utm_source",
-                        "type": "string",
-                        "required": False,
-                        "description": "Filter by UTM source",
-                    },
-                    {
-                        "name": "utm_medium",
-                        "type": "string",
-                        "required": False,
-                        "description": "Filter by UTM medium",
-                    },
-                    {
-                        "name": "utm_campaign",
-                        "type": "string",
-                        "required": False,
-                        "description": "Filter by UTM campaign",
-                    },
-                    {
-                        "name": "limit",
-                        "type": "integer",
-                        "required": False,
-                        "description": "Max results to return",
-                        "default": 100,
-                    },
-                ],
-            ),
-            EndpointInfo(
-                id="report_conversions",
-                name="Conversions",
-                description="Get conversion and sales data",
-                method="GET",
-                path="/report/conversions",
-                category=EndpointCategory.REPORTS,
-                parameters=[
-                    {
-                        "name": "account_id",
-                        "type": "string",
-                        "required": True,
-                        "description": "Account ID",
-                    },
-                    {
-                        "name": "date_range",
-                        "type": "enum",
-                        "required": True,
-                        "description": "Date range for the report",
-                        "options": [e.value for e in DateRange],
-                        "default": "last_30_days",
-                    },
-                    {
-                        "name": "utm_source",
-                        "type": "string",
-                        "required": False,
-                        "description": "Filter by UTM source",
-                    },
-                    {
-                        "name": "utm_medium",
-                        "type": "string",
-                        "required": False,
-                        "description": "Filter by UTM medium",
-                    },
-                    {
-                        "name": "utm_campaign",
-                        "type": "string",
-                        "required": False,
-                        "description": "Filter by UTM campaign",
-                    },
-                    {
-                        "name": "limit",
-                        "type": "integer",
-                        "required": False,
-                        "description": "Max results to return",
-                        "default": 100,
-                    },
-                ],
-            ),
-            EndpointInfo(
-                id="report_microconversions",
-                name="Microconversions",
-                description="Get microconversion events (add-to-cart, signups, etc.)",
-                method="GET",
-                path="/report/microconversions",
-                category=EndpointCategory.REPORTS,
-                parameters=[
-                    {
-                        "name": "account_id",
-                        "type": "string",
-                        "required": True,
-                        "description": "Account ID",
-                    },
-                    {
-                        "name": "date_range",
-                        "type": "enum",
-                        "required": True,
-                        "description": "Date range for the report",
-                        "options": [e.value for e in DateRange],
-                        "default": "last_30_days",
-                    },
-                    {
-                        "name": "label",
-                        "type": "string",
-                        "required": False,
-                        "description": "Filter by microconversion label",
-                    },
-                    {
-                        "name": "limit",
-                        "type": "integer",
-                        "required": False,
-                        "description": "Max results to return",
-                        "default": 100,
-                    },
-                ],
-            ),
-            EndpointInfo(
-                id="report_pages",
-                name="Pages Performance",
-                description="Get page-level performance metrics",
-                method="GET",
-                path="/report/pages",
-                category=EndpointCategory.REPORTS,
-                parameters=[
-                    {
-                        "name": "account_id",
-                        "type": "string",
-                        "required": True,
-                        "description": "Account ID",
-                    },
-                    {
-                        "name": "date_range",
-                        "type": "enum",
-                        "required": True,
-                        "description": "Date range for the report",
-                        "options": [e.value for e in DateRange],
-                        "default": "last_30_days",
-                    },
-                    {
-                        "name": "content_grouping",
-                        "type": "string",
-                        "required": False,
-                        "description": "Group pages by content category",
-                    },
-                    {
-                        "name": "show_utms",
-                        "type": "boolean",
-                        "required": False,
-                        "description": "Include UTM parameters in results",
-                        "default": False,
-                    },
-                    {
-                        "name": "limit",
-                        "type": "integer",
-                        "required": False,
-                        "description": "Max results to return",
-                        "default": 100,
-                    },
-                ],
-            ),
-            EndpointInfo(
-                id="report_funnel",
-                name="Funnel Analysis",
-                description="Get conversion funnel data",
-                method="GET",
-                path="/report/funnel",
-                category=EndpointCategory.REPORTS,
-                parameters=[
-                    {
-                        "name": "account_id",
-                        "type": "string",
-                        "required": True,
-                        "description": "Account ID",
-                    },
-                    {
-                        "name": "date_range",
-                        "type": "enum",
-                        "required": True,
-                        "description": "Date range for the report",
-                        "options": [e.value for e in DateRange],
-                        "default": "last_30_days",
-                    },
-                    {
-                        "name": "report_type",
-                        "type": "enum",
-                        "required": False,
-                        "description": "Group funnel data by dimension",
-                        "options": [e.value for e in FunnelReportType],
-                        "default": "by_source",
-                    },
-                ],
-            ),
-            EndpointInfo(
-                id="report_roas_evolution",
-                name="ROAS Evolution",
-                description="Get ROAS (Return on Ad Spend) over time",
-                method="GET",
-                path="/report/roas-evolution",
-                category=EndpointCategory.REPORTS,
-                parameters=[
-                    {
-                        "name": "account_id",
-                        "type": "string",
-                        "required": True,
-                        "description": "Account ID",
-                    },
-                    {
-                        "name": "date_range",
-                        "type": "enum",
-                        "required": True,
-                        "description": "Date range for the report",
-                        "options": [e.value for e in DateRange],
-                        "default": "last_30_days",
-                    },
-                    {
-                        "name": "time_unit",
-                        "type": "enum",
-                        "required": False,
-                        "description": "Time granularity",
-                        "options": [e.value for e in TimeUnit],
-                        "default": "daily",
-                    },
-                ],
-            ),
-        ]
+        return list(_ENDPOINTS)
 
     @staticmethod
     def get_endpoint_by_id(endpoint_id: str) -> EndpointInfo | None:
-        for endpoint in EndpointsRegistry.get_all_endpoints():
-            if endpoint.id == endpoint_id:
-                return endpoint
-        return None
+        return _BY_ID.get(endpoint_id)
 
     @staticmethod
     def get_endpoints_by_category(category: EndpointCategory) -> list[EndpointInfo]:
-        return [e for e in EndpointsRegistry.get_all_endpoints() if e.category == category]
+        return list(_BY_CATEGORY.get(category, ()))
 
     @staticmethod
     def get_health_check_endpoints() -> list[str]:
         """Returns endpoint IDs used for quick health check."""
-        return [e.id for e in EndpointsRegistry.get_all_endpoints()]
+        return list(_HEALTH_CHECK_IDS)
+
+    @staticmethod
+    def get_analyzer(endpoint_id: str) -> AnalyzerFactory:
+        """Returns the response analyzer factory for an endpoint."""
+        return _ANALYZERS.get(endpoint_id, ResponseAnalyzer)
+
+    @staticmethod
+    def get_timeout(endpoint_id: str) -> httpx.Timeout:
+        """Returns the upstream timeout profile of an endpoint."""
+        return _TIMEOUTS.get(endpoint_id, _DEFAULT_TIMEOUT)
+
+    @staticmethod
+    def is_paginated(endpoint_id: str) -> bool:
+        """Whether an endpoint can be paged through with limit/skip."""
+        return endpoint_id in _PAGINATED
+
+    @staticmethod
+    def get_params_validator(endpoint_id: str) -> ParamsValidator | None:
+        """Returns the compiled parameter validator of an endpoint."""
+        return _VALIDATORS.get(endpoint_id)
+
+    @staticmethod
+    def get_all_endpoints_json() -> bytes:
+        """Pre-serialized JSON array of all endpoints."""
+        return _ALL_JSON
+
+    @staticmethod
+    def get_endpoints_by_category_json(category: EndpointCategory) -> bytes:
+        """Pre-serialized JSON array of the endpoints in a category."""
+        return _BY_CATEGORY_JSON.get(category, b"[]")
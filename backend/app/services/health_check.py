@@ -0,0 +1,173 @@
+import asyncio
+import time
+from contextlib import nullcontext
+from datetime import datetime
+
+from app.config import get_settings
+from app.models import (
+    AccountHealthCheckResult,
+    HealthCheckResult,
+    MultiAccountHealthCheckResult,
+    ResponseOptions,
+)
+from app.services.concurrency import ConcurrencyLimiter, get_health_check_limiter
+from app.services.endpoints_registry import EndpointsRegistry
+from app.services.result_record import ResultRecord
+from app.services.sealmetrics_client import SealmetricsClient
+
+
+def build_health_check_params(endpoint_id: str, account_id: str) -> dict:
+    """
+    Build the request parameters used to probe an endpoint during a health check:
+    the account, today's data, a small page and the registry default report type,
+    limited to the parameters the endpoint declares.
+    """
+    endpoint = EndpointsRegistry.get_endpoint_by_id(endpoint_id)
+    if endpoint is None:
+        return {}
+    specs = {p["name"]: p for p in endpoint.parameters}
+    params = {
+        "account_id": account_id,
+        "date_range": "today",
+        "limit": 10,
+    }
+    # Add report_type for endpoints that take one
+    if "report_type" in specs:
+        params["report_type"] = specs["report_type"].get("default")
+    return {k: v for k, v in params.items() if k in specs and v is not None}
+
+
+def summarize_status(successful: int, failed: int) -> str:
+    """Map success/failure counts to "healthy", "degraded" or "unhealthy"."""
+    if failed == 0:
+        return "healthy"
+    if successful > 0:
+        return "degraded"
+    return "unhealthy"
+
+
+async def run_health_check(
+    client: SealmetricsClient,
+    account_id: str,
+    endpoint_ids: list[str] | None = None,
+    limiter: ConcurrencyLimiter | None = None,
+    response_options: ResponseOptions | None = None,
+    max_concurrency: int | None = None,
+    track_drift: bool = False,
+    per_token_limit: bool = True,
+) -> HealthCheckResult:
+    """
+    Run the health check endpoints concurrently, bounded by the limiter
+    (and by max_concurrency for this account, if given). Without
+    per_token_limit only the limiter's global bound applies.
+    Each result keeps its own response time; total_time_ms is wall-clock.
+    With track_drift, each result carries a DriftReport against the previous run.
+    """
+    if endpoint_ids is None:
+        endpoint_ids = EndpointsRegistry.get_health_check_endpoints()
+    limiter = limiter or get_health_check_limiter()
+    local = asyncio.Semaphore(max_concurrency) if max_concurrency else nullcontext()
+
+    async def run_one(endpoint_id: str) -> ResultRecord:
+        params = build_health_check_params(endpoint_id, account_id)
+        slot = limiter.slot(client.api_token) if per_token_limit else limiter.global_slot()
+        async with local, slot:
+            return await client.validate_endpoint_record(
+                endpoint_id, params, response_options, track_drift=track_drift
+            )
+
+    start_time = time.perf_counter()
+    records = await asyncio.gather(*[run_one(eid) for eid in endpoint_ids])
+    total_time = (time.perf_counter() - start_time) * 1000
+
+    successful = sum(1 for r in records if r.success)
+    failed = len(records) - successful
+
+    return HealthCheckResult(
+        overall_status=summarize_status(successful, failed),
+        total_endpoints=len(records),
+        successful=successful,
+        failed=failed,
+        total_time_ms=round(total_time, 2),
+        timestamp=datetime.utcnow(),
+        results=[r.to_validation_result() for r in records],
+    )
+
+
+def account_id_of(account: dict) -> str | None:
+    """Account id from one entry of the /auth/accounts response."""
+    for key in ("id", "_id", "account_id"):
+        if account.get(key) is not None:
+            return str(account[key])
+    return None
+
+
+async def run_multi_account_health_check(
+    client: SealmetricsClient,
+    accounts: list[dict],
+    account_ids: list[str] | None = None,
+    endpoint_ids: list[str] | None = None,
+    response_options: ResponseOptions | None = None,
+    limiter: ConcurrencyLimiter | None = None,
+    track_drift: bool = False,
+) -> MultiAccountHealthCheckResult:
+    """
+    Run the health check for every account of a token (or the requested
+    subset) with a bounded number of accounts in flight. The token must
+    already be validated; `accounts` is the list it returned, so the
+    token-level auth_accounts probe is left out of the default endpoints.
+    Requested ids that the token cannot access are reported, not checked;
+    with no account left to check the result is "unhealthy".
+    Every account shares the token, so the per-token health check limit
+    is replaced by the account bounds (accounts in flight x calls per
+    account); the global limit and the token's rate limiter still apply.
+    """
+    settings = get_settings()
+    if endpoint_ids is None:
+        endpoint_ids = [e for e in EndpointsRegistry.get_health_check_endpoints() if e != "auth_accounts"]
+    names = {account_id_of(a): a.get("name") for a in accounts if account_id_of(a) is not None}
+    if account_ids is None:
+        selected, unknown = list(names), []
+    else:
+        selected = [a for a in dict.fromkeys(account_ids) if a in names]
+        unknown = [a for a in dict.fromkeys(account_ids) if a not in names]
+
+    account_slots = asyncio.Semaphore(settings.health_check_max_concurrent_accounts)
+
+    async def run_account(account_id: str) -> AccountHealthCheckResult:
+        async with account_slots:
+            health = await run_health_check(
+                client,
+                account_id,
+                endpoint_ids,
+                limiter=limiter,
+                response_options=response_options,
+                max_concurrency=settings.health_check_per_account_concurrency,
+                track_drift=track_drift,
+                per_token_limit=False,
+            )
+        return AccountHealthCheckResult(account_id=account_id, account_name=names[account_id], health=health)
+
+    start_time = time.perf_counter()
+    results = list(await asyncio.gather(*[run_account(a) for a in selected]))
+    total_time = (time.perf_counter() - start_time) * 1000
+
+    statuses = [r.health.overall_status for r in results]
+    successful = sum(r.health.successful for r in results)
+    failed = sum(r.health.failed for r in results)
+
+    return MultiAccountHealthCheckResult(
+        # No account could be checked: that is not a healthy token
+        overall_status=summarize_status(successful, failed) if results else "unhealthy",
+        total_accounts=len(results),
+        healthy_accounts=statuses.count("healthy"),
+        degraded_accounts=statuses.count("degraded"),
+        unhealthy_accounts=statuses.count("unhealthy"),
+        total_endpoints=successful + failed,
+        successful=successful,
+        failed=failed,
+        total_time_ms=round(total_time, 2),
+        timestamp=datetime.utcnow(),
+        accounts=results,
+        unknown_account_ids=unknown,
+    )
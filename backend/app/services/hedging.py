@@ -0,0 +1,59 @@
+from functools import lru_cache
+
+from app.config import get_settings
+from app.services.histogram import LatencyHistogram
+
+# Records between recomputations of an endpoint's percentile
+_REFRESH_EVERY = 32
+
+
+class _EndpointLatency:
+    def __init__(self):
+        self.current = LatencyHistogram()
+        self.previous: LatencyHistogram | None = None
+        self.cached: dict[float, float | None] = {}
+        self.records_since_refresh = 0
+
+
+class LatencyTracker:
+    """
+    Recent upstream latency per endpoint, used to pick hedging delays.
+    Each endpoint keeps two fixed-memory histograms: the window being
+    filled and the last complete one, so old samples age out.
+    """
+
+    def __init__(self, window: int):
+        self.window = window
+        self._endpoints: dict[str, _EndpointLatency] = {}
+
+    def record(self, endpoint_id: str, latency_ms: float) -> None:
+        state = self._endpoints.get(endpoint_id)
+        if state is None:
+            state = self._endpoints[endpoint_id] = _EndpointLatency()
+        state.current.record(latency_ms)
+        state.records_since_refresh += 1
+        if state.current.total_count >= self.window:
+            state.previous, state.current = state.current, LatencyHistogram()
+
+    def percentile(self, endpoint_id: str, percentile: float, min_samples: int) -> float | None:
+        """Latency percentile in ms over the recent windows, or None with too few samples."""
+        state = self._endpoints.get(endpoint_id)
+        if state is None:
+            return None
+        if percentile not in state.cached or state.records_since_refresh >= _REFRESH_EVERY:
+            merged = LatencyHistogram()
+            merged.merge(state.current)
+            if state.previous is not None:
+                merged.merge(state.previous)
+            value = merged.percentile(percentile) if merged.total_count >= min_samples else None
+            state.cached = {percentile: value}
+            state.records_since_refresh = 0
+        return state.cached[percentile]
+
+    def reset(self) -> None:
+        self._endpoints.clear()
+
+
+@lru_cache
+def get_latency_tracker() -> LatencyTracker:
+    return LatencyTracker(window=get_settings().hedge_latency_window)
@@ -0,0 +1,169 @@
+import math
+from array import array
+
+
+class LatencyHistogram:
+    """
+    Fixed-memory log-linear histogram in the style of HdrHistogram.
+    Values are recorded in microseconds with `significant_digits` of
+    precision, so memory depends only on the trackable range and never
+    on the number of samples.
+    """
+
+    def __init__(self, highest_trackable_us: int = 3_600_000_000, significant_digits: int = 2):
+        self.highest_trackable_us = highest_trackable_us
+        self.significant_digits = significant_digits
+
+        largest_single_unit = 2 * 10 ** significant_digits
+        sub_bucket_count_magnitude = math.ceil(math.log2(largest_single_unit))
+        self.sub_bucket_half_count_magnitude = max(sub_bucket_count_magnitude, 1) - 1
+        self.sub_bucket_count = 1 << (self.sub_bucket_half_count_magnitude + 1)
+        self.sub_bucket_half_count = self.sub_bucket_count // 2
+        self.sub_bucket_mask = self.sub_bucket_count - 1
+
+        smallest_untrackable = self.sub_bucket_count
+        bucket_count = 1
+        while smallest_untrackable <= highest_trackable_us:
+            smallest_untrackable <<= 1
+            bucket_count += 1
+        self.bucket_count = bucket_count
+
+        self.counts = array("Q", bytes(8 * (bucket_count + 1) * self.sub_bucket_half_count))
+        self.total_count = 0
+        self.min_us: int | None = None
+        self.max_us = 0
+        self.sum_us = 0
+
+    def _counts_index(self, value: int) -> int:
+        magnitude = (value | self.sub_bucket_mask).bit_length()
+        bucket_index = magnitude - (self.sub_bucket_half_count_magnitude + 1)
+        sub_bucket_index = value >> bucket_index
+        return ((bucket_index + 1) << self.sub_bucket_half_count_magnitude) + (
+            sub_bucket_index - self.sub_bucket_half_count
+        )
+
+    def _value_range(self, index: int) -> tuple[int, int]:
+        """Lowest and highest value (inclusive) counted at a counts index."""
+        bucket_index = (index >> self.sub_bucket_half_count_magnitude) - 1
+        sub_bucket_index = (index & (self.sub_bucket_half_count - 1)) + self.sub_bucket_half_count
+        if bucket_index < 0:
+            sub_bucket_index -= self.sub_bucket_half_count
+            bucket_index = 0
+        lowest = sub_bucket_index << bucket_index
+        return lowest, lowest + (1 << bucket_index) - 1
+
+    def record(self, value_ms: float, count: int = 1) -> None:
+        value = min(max(int(value_ms * 1000), 0), self.highest_trackable_us)
+        self.counts[self._counts_index(value)] += count
+        self.total_count += count
+        self.sum_us += value * count
+        if self.min_us is None or value < self.min_us:
+            self.min_us = value
+        if value > self.max_us:
+            self.max_us = value
+
+    def merge(self, other: "LatencyHistogram") -> None:
+        if (other.highest_trackable_us, other.significant_digits) != (
+            self.highest_trackable_us,
+            self.significant_digits,
+        ):
+            raise ValueError("Cannot merge histograms with different ranges")
+        for index, count in enumerate(other.counts):
+            if count:
+                self.counts[index] += count
+        self.total_count += other.total_count
+        self.sum_us += other.sum_us
+        if other.min_us is not None and (self.min_us is None or other.min_us < self.min_us):
+            self.min_us = other.min_us
+        self.max_us = max(self.max_us, other.max_us)
+
+    def percentile(self, percentile: float) -> float:
+        """Value in ms at the given percentile (0-100)."""
+        if self.total_count == 0:
+            return 0.0
+        target = max(1, math.ceil(percentile / 100 * self.total_count))
+        seen = 0
+        for index, count in enumerate(self.counts):
+            if not count:
+                continue
+            seen += count
+            if seen >= target:
+                _, highest = self._value_range(index)
+                return min(highest, self.max_us) / 1000
+        return self.max_us / 1000
+
+    def percentiles(self, percentiles: list[float]) -> dict[float, float]:
+        """Several percentiles in a single walk over the counts."""
+        results: dict[float, float] = {}
+        if self.total_count == 0:
+            return {p: 0.0 for p in percentiles}
+        targets = sorted((max(1, math.ceil(p / 100 * self.total_count)), p) for p in percentiles)
+        position = 0
+        seen = 0
+        for index, count in enumerate(self.counts):
+            if not count:
+                continue
+            seen += count
+            while position < len(targets) and seen >= targets[position][0]:
+                _, highest = self._value_range(index)
+                results[targets[position][1]] = min(highest, self.max_us) / 1000
+                position += 1
+            if position == len(targets):
+                break
+        return results
+
+    @property
+    def mean_ms(self) -> float:
+        return self.sum_us / self.total_count / 1000 if self.total_count else 0.0
+
+    @property
+    def min_ms(self) -> float:
+        return (self.min_us or 0) / 1000
+
+    @property
+    def max_ms(self) -> float:
+        return self.max_us / 1000
+
+    def buckets(self) -> list[tuple[float, int]]:
+        """
+        Coarse (upper bound ms, count) pairs, one per power-of-two range,
+        for non-empty ranges only.
+        """
+        result: list[tuple[float, int]] = []
+        upper = 0
+        count_in_range = 0
+        for index, count in enumerate(self.counts):
+            if not count:
+                continue
+            _, highest = self._value_range(index)
+            range_upper = 1 << max(highest.bit_length(), 1)
+            if range_upper != upper and count_in_range:
+                result.append((upper / 1000, count_in_range))
+                count_in_range = 0
+            upper = range_upper
+            count_in_range += count
+        if count_in_range:
+            result.append((upper / 1000, count_in_range))
+        return result
+
+    def to_dict(self) -> dict:
+        """Sparse serializable form (index -> count), see from_dict()."""
+        return {
+            "highest_trackable_us": self.highest_trackable_us,
+            "significant_digits": self.significant_digits,
+            "min_us": self.min_us,
+            "max_us": self.max_us,
+            "sum_us": self.sum_us,
+            "counts": {str(i): c for i, c in enumerate(self.counts) if c},
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "LatencyHistogram":
+        histogram = cls(data["highest_trackable_us"], data["significant_digits"])
+        for index, count in data["counts"].items():
+            histogram.counts[int(index)] = count
+            histogram.total_count += count
+        histogram.min_us = data["min_us"]
+        histogram.max_us = data["max_us"]
+        histogram.sum_us = data["sum_us"]
+        return histogram
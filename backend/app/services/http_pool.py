@@ -0,0 +1,57 @@
+import httpx
+
+from app.config import Settings, get_settings
+
+_http_client: httpx.AsyncClient | None = None
+
+
+def create_http_client(
+    settings: Settings | None = None,
+    transport: httpx.AsyncBaseTransport | None = None,
+) -> httpx.AsyncClient:
+    """Build an AsyncClient configured from the connection pool settings."""
+    settings = settings or get_settings()
+    limits = httpx.Limits(
+        max_connections=settings.http_max_connections,
+        max_keepalive_connections=settings.http_max_keepalive_connections,
+        keepalive_expiry=settings.http_keepalive_expiry,
+    )
+    return httpx.AsyncClient(
+        limits=limits,
+        http2=settings.http2_enabled,
+        transport=transport,
+    )
+
+
+async def open_http_client(
+    transport: httpx.AsyncBaseTransport | None = None,
+) -> httpx.AsyncClient:
+    """
+    Create the process-wide client used for all upstream calls.
+    Called from the application lifespan on startup.
+    """
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+    _http_client = create_http_client(transport=transport)
+    return _http_client
+
+
+async def close_http_client() -> None:
+    """Close the process-wide client and release pooled connections."""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """
+    Return the process-wide client.
+    Falls back to creating one lazily when the lifespan hook has not run
+    (e.g. scripts importing the services directly).
+    """
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = create_http_client()
+    return _http_client
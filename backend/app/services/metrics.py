@@ -0,0 +1,177 @@
+import time
+from typing import Any, Iterator
+
+from prometheus_client import CONTENT_TYPE_LATEST, REGISTRY, Counter, Gauge, Histogram, generate_latest
+from prometheus_client.core import GaugeMetricFamily
+from prometheus_client.registry import Collector
+
+from app.services import http_pool
+
+_LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+# Validator routes
+HTTP_REQUESTS = Counter(
+    "validator_http_requests_total",
+    "Requests handled by the validator API",
+    ["method", "route", "status"],
+)
+HTTP_REQUEST_DURATION = Histogram(
+    "validator_http_request_duration_seconds",
+    "Validator API request duration",
+    ["method", "route"],
+    buckets=_LATENCY_BUCKETS,
+)
+HTTP_REQUESTS_IN_FLIGHT = Gauge(
+    "validator_http_requests_in_flight",
+    "Validator API requests currently being handled",
+)
+
+# Upstream Sealmetrics calls
+UPSTREAM_REQUESTS = Counter(
+    "validator_upstream_requests_total",
+    "Requests sent to the Sealmetrics API",
+    ["endpoint_id", "status"],
+)
+UPSTREAM_DURATION = Histogram(
+    "validator_upstream_request_duration_seconds",
+    "Total Sealmetrics API request duration",
+    ["endpoint_id"],
+    buckets=_LATENCY_BUCKETS,
+)
+UPSTREAM_PHASE_DURATION = Histogram(
+    "validator_upstream_phase_duration_seconds",
+    "Sealmetrics API request duration per phase (connect includes DNS resolution)",
+    ["endpoint_id", "phase"],
+    buckets=_LATENCY_BUCKETS,
+)
+UPSTREAM_IN_FLIGHT = Gauge(
+    "validator_upstream_requests_in_flight",
+    "Sealmetrics API requests currently in flight",
+    ["endpoint_id"],
+)
+# Response compression (ratio = output / input bytes)
+COMPRESSION_INPUT_BYTES = Counter(
+    "validator_response_compression_input_bytes_total",
+    "Response bytes before compression",
+    ["encoding"],
+)
+COMPRESSION_OUTPUT_BYTES = Counter(
+    "validator_response_compression_output_bytes_total",
+    "Response bytes after compression",
+    ["encoding"],
+)
+COMPRESSION_CPU_SECONDS = Counter(
+    "validator_response_compression_cpu_seconds_total",
+    "CPU time spent compressing responses",
+    ["encoding"],
+)
+COMPRESSION_RATIO = Histogram(
+    "validator_response_compression_ratio",
+    "Compressed / uncompressed size per response",
+    ["encoding"],
+    buckets=(0.05, 0.1, 0.15, 0.2, 0.3, 0.4, 0.5, 0.7, 1.0),
+)
+SINGLE_FLIGHT_REQUESTS = Counter(
+    "validator_single_flight_requests_total",
+    "Endpoint validations by single-flight outcome (leader = upstream call, shared = deduplicated)",
+    ["endpoint_id", "outcome"],
+)
+HEDGED_REQUESTS = Counter(
+    "validator_hedged_requests_total",
+    "Hedged upstream GETs by outcome (primary/hedge = which response won, skipped = rate limited)",
+    ["endpoint_id", "outcome"],
+)
+RESPONSE_CACHE_LOOKUPS = Counter(
+    "validator_response_cache_lookups_total",
+    "Response cache lookups of use_cache requests by outcome",
+    ["endpoint_id", "cache_status"],
+)
+
+
+class UpstreamTrace:
+    """
+    Collects per-phase timings of one upstream request through the
+    httpcore "trace" request extension.
+    Phases: connect (DNS + TCP), tls, ttfb (request sent to headers
+    received) and body (headers received to body fully read).
+    """
+
+    def __init__(self, endpoint_id: str):
+        self.endpoint_id = endpoint_id
+        self.started_at = time.perf_counter()
+        self.status_code = 0
+        self._marks: dict[str, float] = {}
+
+    async def __call__(self, event_name: str, info: dict[str, Any]) -> None:
+        # Event names look like "connection.connect_tcp.started" or
+        # "http11.receive_response_headers.complete"
+        _, _, name = event_name.partition(".")
+        self._marks.setdefault(name, time.perf_counter())
+
+    @property
+    def extensions(self) -> dict:
+        return {"trace": self}
+
+    def _span(self, start: str, end: str) -> float | None:
+        if start in self._marks and end in self._marks:
+            return self._marks[end] - self._marks[start]
+        return None
+
+    def observe(self) -> None:
+        """Record the request metrics once the body has been consumed."""
+        finished_at = time.perf_counter()
+        labels = {"endpoint_id": self.endpoint_id}
+
+        UPSTREAM_REQUESTS.labels(status=str(self.status_code), **labels).inc()
+        UPSTREAM_DURATION.labels(**labels).observe(finished_at - self.started_at)
+
+        phases = {
+            "connect": self._span("connect_tcp.started", "connect_tcp.complete"),
+            "tls": self._span("start_tls.started", "start_tls.complete"),
+            "ttfb": self._span("send_request_headers.started", "receive_response_headers.complete"),
+        }
+        headers_at = self._marks.get("receive_response_headers.complete")
+        if headers_at is not None:
+            body_at = self._marks.get("receive_response_body.complete", finished_at)
+            phases["body"] = body_at - headers_at
+
+        for phase, duration in phases.items():
+            if duration is not None:
+                UPSTREAM_PHASE_DURATION.labels(phase=phase, **labels).observe(duration)
+
+
+class ConnectionPoolCollector(Collector):
+    """Reports connection pool utilization of the shared upstream client at scrape time."""
+
+    def collect(self) -> Iterator[GaugeMetricFamily]:
+        client = http_pool._http_client
+        # httpx does not expose its pool publicly; read it defensively
+        transport = getattr(client, "_transport", None) if client is not None else None
+        pool = getattr(transport, "_pool", None)
+        connections = list(getattr(pool, "connections", []) or [])
+
+        idle = sum(1 for c in connections if c.is_idle())
+        gauge = GaugeMetricFamily(
+            "validator_upstream_pool_connections",
+            "Connections held by the shared upstream connection pool",
+            labels=["state"],
+        )
+        gauge.add_metric(["active"], len(connections) - idle)
+        gauge.add_metric(["idle"], idle)
+        yield gauge
+
+        if client is not None:
+            limits = GaugeMetricFamily(
+                "validator_upstream_pool_max_connections",
+                "Configured maximum connections of the upstream pool",
+            )
+            limits.add_metric([], getattr(pool, "_max_connections", 0) or 0)
+            yield limits
+
+
+REGISTRY.register(ConnectionPoolCollector())
+
+
+def render_metrics() -> tuple[bytes, str]:
+    """Exposition body and content type for the /metrics endpoint."""
+    return generate_latest(REGISTRY), CONTENT_TYPE_LATEST
@@ -0,0 +1,180 @@
+import asyncio
+import json
+import logging
+import os
+import random
+from collections import deque
+from datetime import datetime
+
+from app.config import get_settings
+from app.models import HealthCheckResult, MonitorConfig, MonitorStatus, ResponseOptions
+from app.services.endpoints_registry import EndpointsRegistry
+from app.services.health_check import run_health_check
+from app.services.sealmetrics_client import SealmetricsClient
+
+logger = logging.getLogger(__name__)
+
+# Monitors only keep stats, never payloads
+_MONITOR_RESPONSE_OPTIONS = ResponseOptions(summary_only=True)
+
+
+class Monitor:
+    """A scheduled health check job and its recent results."""
+
+    def __init__(self, config: MonitorConfig, history_size: int):
+        self.config = config
+        self.endpoint_ids = config.endpoint_ids or EndpointsRegistry.get_health_check_endpoints()
+        self.results: deque[HealthCheckResult] = deque(maxlen=history_size)
+        self.current: asyncio.Task | None = None
+        self.runs = 0
+        self.consecutive_failures = 0
+        self.last_run_at: datetime | None = None
+        self.last_error: str | None = None
+
+    def status(self) -> MonitorStatus:
+        latest = self.results[-1] if self.results else None
+        return MonitorStatus(
+            id=self.config.id,
+            account_id=self.config.account_id,
+            endpoint_ids=self.endpoint_ids,
+            interval_seconds=self.config.interval_seconds,
+            running=self.current is not None and not self.current.done(),
+            runs=self.runs,
+            consecutive_failures=self.consecutive_failures,
+            last_run_at=self.last_run_at,
+            last_status=latest.overall_status if latest else None,
+            last_total_time_ms=latest.total_time_ms if latest else None,
+            last_error=self.last_error,
+        )
+
+
+class MonitorScheduler:
+    """
+    Runs configured health checks in the background on jittered intervals.
+    Overlapping runs of the same monitor are coalesced and a global
+    semaphore caps how many monitors hit the upstream at once.
+    """
+
+    def __init__(
+        self,
+        configs: list[MonitorConfig],
+        history_size: int,
+        max_concurrency: int,
+        jitter_ratio: float,
+    ):
+        self.monitors = {c.id: Monitor(c, history_size) for c in configs}
+        self.jitter_ratio = jitter_ratio
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._loops: list[asyncio.Task] = []
+
+    def start(self) -> None:
+        for monitor in self.monitors.values():
+            self._loops.append(asyncio.create_task(self._loop(monitor)))
+
+    async def stop(self) -> None:
+        tasks = self._loops + [m.current for m in self.monitors.values() if m.current]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._loops.clear()
+
+    def get(self, monitor_id: str) -> Monitor | None:
+        return self.monitors.get(monitor_id)
+
+    async def _loop(self, monitor: Monitor) -> None:
+        interval = monitor.config.interval_seconds
+        # Spread the first runs so monitors don't all start together
+        await asyncio.sleep(random.uniform(0, interval))
+        while True:
+            try:
+                await self.trigger(monitor.config.id)
+            except Exception:
+                logger.exception("Monitor %s failed", monitor.config.id)
+            jitter = random.uniform(-self.jitter_ratio, self.jitter_ratio)
+            await asyncio.sleep(interval * (1 + jitter))
+
+    async def trigger(self, monitor_id: str) -> HealthCheckResult | None:
+        """Run a monitor now, or join its run if one is already in progress."""
+        monitor = self.monitors[monitor_id]
+        if monitor.current is None or monitor.current.done():
+            monitor.current = asyncio.create_task(self._run(monitor))
+        return await asyncio.shield(monitor.current)
+
+    async def _run(self, monitor: Monitor) -> HealthCheckResult | None:
+        config = monitor.config
+        async with self._semaphore:
+            monitor.runs += 1
+            monitor.last_run_at = datetime.utcnow()
+
+            api_token = os.environ.get(config.token_env)
+            if not api_token:
+                self._fail(monitor, f"Environment variable {config.token_env} is not set")
+                return None
+
+            client = SealmetricsClient(api_token)
+            is_valid, _, error = await client.validate_token()
+            if not is_valid:
+                self._fail(monitor, error or "Invalid API token")
+                return None
+
+            result = await run_health_check(
+                client,
+                config.account_id,
+                monitor.endpoint_ids,
+                response_options=_MONITOR_RESPONSE_OPTIONS,
+                track_drift=config.track_drift,
+            )
+
+        monitor.results.append(result)
+        monitor.last_error = None
+        if result.overall_status == "healthy":
+            monitor.consecutive_failures = 0
+        else:
+            monitor.consecutive_failures += 1
+        return result
+
+    def _fail(self, monitor: Monitor, error: str) -> None:
+        monitor.last_error = error
+        monitor.consecutive_failures += 1
+        logger.warning("Monitor %s: %s", monitor.config.id, error)
+
+
+def load_monitor_configs(path: str) -> list[MonitorConfig]:
+    with open(path) as f:
+        configs = [MonitorConfig(**item) for item in json.load(f)]
+    # Monitors are looked up by id: a duplicate would silently replace the earlier one
+    ids = [c.id for c in configs]
+    duplicates = sorted({i for i in ids if ids.count(i) > 1})
+    if duplicates:
+        raise ValueError(f"{path}: duplicate monitor ids: {', '.join(duplicates)}")
+    return configs
+
+
+_scheduler: MonitorScheduler | None = None
+
+
+def start_monitors() -> MonitorScheduler | None:
+    """Start the scheduler if MONITORS_CONFIG_PATH is set. Called from the app lifespan."""
+    global _scheduler
+    settings = get_settings()
+    if not settings.monitors_config_path:
+        return None
+    _scheduler = MonitorScheduler(
+        load_monitor_configs(settings.monitors_config_path),
+        history_size=settings.monitor_history_size,
+        max_concurrency=settings.monitor_max_concurrency,
+        jitter_ratio=settings.monitor_jitter_ratio,
+    )
+    _scheduler.start()
+    return _scheduler
+
+
+async def stop_monitors() -> None:
+    global _scheduler
+    if _scheduler is not None:
+        await _scheduler.stop()
+        _scheduler = None
+
+
+def get_monitor_scheduler() -> MonitorScheduler | None:
+    return _scheduler
@@ -0,0 +1,132 @@
+import asyncio
+import time
+from datetime import datetime
+
+from app.models import EndpointInfo, LatencyStats, PageResult, PaginatedValidationResult, ResponseOptions
+from app.services.histogram import LatencyHistogram
+from app.services.sealmetrics_client import SealmetricsClient
+
+# Pages only contribute stats; their payloads are analyzed while streaming and dropped
+_PAGE_RESPONSE_OPTIONS = ResponseOptions(summary_only=True)
+
+
+def default_page_size(endpoint: EndpointInfo) -> int:
+    spec = next((p for p in endpoint.parameters if p["name"] == "limit"), None)
+    return int(spec.get("default") or 100) if spec else 100
+
+
+async def run_paginated(
+    client: SealmetricsClient,
+    endpoint: EndpointInfo,
+    parameters: dict,
+    page_size: int,
+    max_pages: int,
+    concurrency: int = 1,
+    use_cache: bool = False,
+) -> PaginatedValidationResult:
+    """
+    Walk every page of a limit/skip endpoint until a short page, aggregating
+    row counts, dates and null counts as the pages come in. Up to
+    `concurrency` pages are requested ahead; pages past the end are cancelled.
+    Each page has its own timeout, so long exports don't hit it as one call.
+    A page with the same first and last rows as the previous one means the
+    upstream ignores `skip`: the walk stops with an error instead of
+    counting the same rows again.
+    """
+    histogram = LatencyHistogram()
+    page_results: list[PageResult] = []
+    null_field_counts: dict[str, int] = {}
+    fingerprints: dict[str, None] = {}
+    total_rows = 0
+    total_bytes = 0
+    latest: str | None = None
+    earliest: str | None = None
+    complete = False
+    error_message = None
+    previous_edges = None
+
+    async def fetch(page: int):
+        params = {**parameters, "limit": page_size, "skip": page * page_size}
+        return await client.validate_endpoint_record(endpoint.id, params, _PAGE_RESPONSE_OPTIONS, use_cache=use_cache)
+
+    start_time = time.perf_counter()
+    pending: dict[int, asyncio.Task] = {}
+    next_page = 0
+    try:
+        for page in range(max_pages):
+            while next_page < max_pages and len(pending) < concurrency:
+                pending[next_page] = asyncio.create_task(fetch(next_page))
+                next_page += 1
+            result = await pending.pop(page)
+
+            histogram.record(result.response_time_ms)
+            page_results.append(
+                PageResult(
+                    page=page,
+                    offset=page * page_size,
+                    success=result.success,
+                    status_code=result.status_code,
+                    response_time_ms=result.response_time_ms,
+                    data_count=result.data_count,
+                    latest_data_date=result.latest_data_date,
+                    earliest_data_date=result.earliest_data_date,
+                    response_size_bytes=result.response_size_bytes,
+                    error_message=result.error_message,
+                )
+            )
+            if not result.success:
+                error_message = f"Page {page}: {result.error_message or f'HTTP {result.status_code}'}"
+                break
+            if result.edges_digest is not None and result.edges_digest == previous_edges:
+                error_message = f"Page {page} repeats page {page - 1}: the upstream ignores skip"
+                break
+            previous_edges = result.edges_digest
+
+            rows = result.data_count or 0
+            total_rows += rows
+            total_bytes += result.response_size_bytes or 0
+            for key, count in (result.null_field_counts or {}).items():
+                null_field_counts[key] = null_field_counts.get(key, 0) + count
+            if result.schema_fingerprint:
+                fingerprints[result.schema_fingerprint] = None
+            if result.latest_data_date and (latest is None or result.latest_data_date > latest):
+                latest = result.latest_data_date
+            if result.earliest_data_date and (earliest is None or result.earliest_data_date < earliest):
+                earliest = result.earliest_data_date
+
+            if rows < page_size:
+                complete = True
+                break
+    finally:
+        for task in pending.values():
+            task.cancel()
+        await asyncio.gather(*pending.values(), return_exceptions=True)
+    total_time = (time.perf_counter() - start_time) * 1000
+
+    p = histogram.percentiles([50, 90, 99])
+    return PaginatedValidationResult(
+        endpoint_id=endpoint.id,
+        endpoint_name=endpoint.name,
+        success=error_message is None,
+        complete=complete,
+        page_size=page_size,
+        pages=len(page_results),
+        total_rows=total_rows,
+        latest_data_date=latest,
+        earliest_data_date=earliest,
+        null_field_counts=null_field_counts,
+        schema_fingerprints=list(fingerprints),
+        response_size_bytes=total_bytes,
+        total_time_ms=round(total_time, 2),
+        latency=LatencyStats(
+            min_ms=histogram.min_ms,
+            mean_ms=round(histogram.mean_ms, 3),
+            p50_ms=p[50],
+            p90_ms=p[90],
+            p99_ms=p[99],
+            max_ms=histogram.max_ms,
+        ),
+        page_results=page_results,
+        error_message=error_message,
+        timestamp=datetime.utcnow(),
+    )
@@ -0,0 +1,109 @@
+from enum import Enum
+from typing import Any
+
+from app.models import ParameterError
+
+
+class ParamsValidator:
+    """
+    Validator compiled once from an endpoint's parameter specs.
+    Drops empty values, coerces integers/booleans/strings, matches enum
+    options case-insensitively, fills defaults of missing required
+    parameters and rejects unknown names. The normalized params follow
+    the spec order, so equal requests map to the same canonical form.
+    """
+
+    def __init__(self, endpoint_id: str, specs: list[dict]):
+        self.endpoint_id = endpoint_id
+        self._specs = {spec["name"]: spec for spec in specs}
+        self._order = list(self._specs)
+        self._required = [spec["name"] for spec in specs if spec.get("required")]
+        # Lower-cased option -> canonical option, per enum parameter
+        self._options = {
+            spec["name"]: {str(option).lower(): option for option in spec["options"]}
+            for spec in specs
+            if spec.get("type") == "enum" and spec.get("options")
+        }
+
+    def validate(self, parameters: dict) -> tuple[dict, list[ParameterError]]:
+        """Returns (normalized params, errors); params are only sendable when errors is empty."""
+        values: dict[str, Any] = {}
+        errors: list[ParameterError] = []
+
+        for name, value in parameters.items():
+            if value is None or value == "":
+                continue
+            spec = self._specs.get(name)
+            if spec is None:
+                errors.append(
+                    ParameterError(
+                        name=name,
+                        error="unknown",
+                        message=f"Unknown parameter for {self.endpoint_id}",
+                        allowed=self._order,
+                    )
+                )
+                continue
+            normalized, error = self._coerce(spec, value)
+            if error is not None:
+                errors.append(error)
+            else:
+                values[name] = normalized
+
+        for name in self._required:
+            if name not in values:
+                default = self._specs[name].get("default")
+                if default is not None:
+                    values[name] = default
+                else:
+                    errors.append(ParameterError(name=name, error="missing", message="Required parameter"))
+
+        return {name: values[name] for name in self._order if name in values}, errors
+
+    def _coerce(self, spec: dict, value: Any) -> tuple[Any, ParameterError | None]:
+        name, kind = spec["name"], spec.get("type", "string")
+        if isinstance(value, Enum):
+            value = value.value
+
+        if kind == "enum" and name in self._options:
+            option = self._options[name].get(str(value).lower())
+            if option is None:
+                return None, ParameterError(
+                    name=name,
+                    error="invalid_enum",
+                    message=f"Invalid value: {value!r}",
+                    allowed=list(self._options[name].values()),
+                )
+            return option, None
+
+        if kind == "integer":
+            if isinstance(value, bool):
+                return None, _type_error(name, value, kind)
+            if isinstance(value, int):
+                return value, None
+            if isinstance(value, float) and value.is_integer():
+                return int(value), None
+            if isinstance(value, str):
+                try:
+                    return int(value.strip()), None
+                except ValueError:
+                    pass
+            return None, _type_error(name, value, kind)
+
+        if kind == "boolean":
+            if isinstance(value, bool):
+                return value, None
+            normalized = str(value).strip().lower()
+            if normalized in ("true", "1", "yes"):
+                return True, None
+            if normalized in ("false", "0", "no"):
+                return False, None
+            return None, _type_error(name, value, kind)
+
+        if isinstance(value, (dict, list)):
+            return None, _type_error(name, value, kind)
+        return str(value), None
+
+
+def _type_error(name: str, value: Any, kind: str) -> ParameterError:
+    return ParameterError(name=name, error="invalid_type", message=f"Expected {kind}, got {value!r}")
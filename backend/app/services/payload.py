@@ -0,0 +1,92 @@
+import json
+from typing import Any
+
+from app.models import ResponseOptions
+
+
+def find_data_list(response_data: Any) -> tuple[list | None, str | None]:
+    """
+    Locate the list of items in an API response.
+    Returns (items, key) where key is the envelope key ("data"/"items"),
+    or None when the response itself is the list.
+    """
+    if isinstance(response_data, dict):
+        if "data" in response_data and isinstance(response_data["data"], list):
+            return response_data["data"], "data"
+        if "items" in response_data and isinstance(response_data["items"], list):
+            return response_data["items"], "items"
+    elif isinstance(response_data, list):
+        return response_data, None
+    return None, None
+
+
+def _json_size(value: Any) -> int:
+    return len(json.dumps(value, separators=(",", ":"), default=str).encode("utf-8"))
+
+
+def _with_items(response_data: Any, key: str | None, items: list) -> Any:
+    if key is None:
+        return items
+    shaped = dict(response_data)
+    shaped[key] = items
+    return shaped
+
+
+def shape_response_data(
+    response_data: Any,
+    options: ResponseOptions,
+    body_size: int,
+) -> tuple[Any, bool]:
+    """
+    Apply projection and size limits to a parsed response.
+    Returns (shaped_data, truncated).
+    """
+    if response_data is None:
+        return None, False
+    if options.summary_only:
+        return None, True
+
+    items, key = find_data_list(response_data)
+    truncated = False
+
+    if items is not None:
+        if options.fields:
+            fields = options.fields
+            items = [
+                {f: item[f] for f in fields if f in item} if isinstance(item, dict) else item
+                for item in items
+            ]
+        if options.max_items is not None and len(items) > options.max_items:
+            items = items[: options.max_items]
+            truncated = True
+        if options.fields or truncated:
+            response_data = _with_items(response_data, key, items)
+
+    max_bytes = options.max_bytes
+    if max_bytes is None:
+        return response_data, truncated
+
+    # Cheap path: the untouched body already fits
+    if not options.fields and not truncated and body_size <= max_bytes:
+        return response_data, False
+
+    if items is None:
+        if _json_size(response_data) <= max_bytes:
+            return response_data, truncated
+        return None, True
+
+    # Keep as many leading items as fit in the byte budget
+    budget = max_bytes - _json_size(_with_items(response_data, key, []))
+    if budget < 0:
+        return None, True
+    kept = 0
+    for item in items:
+        # +1 for the separating comma
+        budget -= _json_size(item) + 1
+        if budget < 0:
+            break
+        kept += 1
+
+    if kept == len(items):
+        return response_data, truncated
+    return _with_items(response_data, key, items[:kept]), True
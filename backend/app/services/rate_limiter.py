@@ -0,0 +1,121 @@
+import asyncio
+import time
+from collections import OrderedDict
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
+
+from app.config import get_settings
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Parse a Retry-After header (delta-seconds or HTTP date) into seconds."""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+class AdaptiveRateLimiter:
+    """
+    Token bucket that adapts to upstream throttling.
+    The rate is halved on every 429 (honouring Retry-After) and recovers
+    additively on successful responses, up to the configured rate.
+    """
+
+    def __init__(self, rate: float, burst: int, min_rate: float):
+        self.max_rate = rate
+        self.min_rate = min(min_rate, rate)
+        self.rate = rate
+        self.burst = max(1, burst)
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._blocked_until = 0.0
+        self._lock = asyncio.Lock()
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    async def acquire(self) -> float:
+        """Wait for a token. Returns the number of seconds spent waiting."""
+        waited = 0.0
+        # The lock keeps waiters in FIFO order
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._refill(now)
+                if now < self._blocked_until:
+                    delay = self._blocked_until - now
+                elif self._tokens >= 1:
+                    self._tokens -= 1
+                    return waited
+                else:
+                    delay = (1 - self._tokens) / self.rate
+                await asyncio.sleep(delay)
+                waited += delay
+
+    def try_acquire(self) -> bool:
+        """Take a token only if one is available right now and nobody is waiting."""
+        if self._lock.locked():
+            return False
+        now = time.monotonic()
+        self._refill(now)
+        if now < self._blocked_until or self._tokens < 1:
+            return False
+        self._tokens -= 1
+        return True
+
+    def on_response(self, status_code: int, retry_after: float | None = None) -> None:
+        """Adapt the rate to an upstream response."""
+        now = time.monotonic()
+        if status_code == 429:
+            self._refill(now)
+            self.rate = max(self.min_rate, self.rate / 2)
+            self._tokens = min(self._tokens, 0.0)
+            if retry_after:
+                self._blocked_until = max(self._blocked_until, now + retry_after)
+        elif 200 <= status_code < 300 and self.rate < self.max_rate:
+            self._refill(now)
+            self.rate = min(self.max_rate, self.rate + self.max_rate * 0.05)
+
+
+class RateLimiterRegistry:
+    """Rate limiters keyed by (base_url, token hash), LRU-bounded."""
+
+    def __init__(self, rate: float, burst: int, min_rate: float, max_entries: int = 1024):
+        self.rate = rate
+        self.burst = burst
+        self.min_rate = min_rate
+        self.max_entries = max_entries
+        self._limiters: OrderedDict[tuple[str, str], AdaptiveRateLimiter] = OrderedDict()
+
+    def get(self, base_url: str, token_hash: str) -> AdaptiveRateLimiter:
+        key = (base_url, token_hash)
+        limiter = self._limiters.get(key)
+        if limiter is None:
+            limiter = AdaptiveRateLimiter(self.rate, self.burst, self.min_rate)
+            self._limiters[key] = limiter
+            while len(self._limiters) > self.max_entries:
+                self._limiters.popitem(last=False)
+        else:
+            self._limiters.move_to_end(key)
+        return limiter
+
+
+@lru_cache
+def get_rate_limiters() -> RateLimiterRegistry:
+    settings = get_settings()
+    return RateLimiterRegistry(
+        rate=settings.rate_limit_requests_per_second,
+        burst=settings.rate_limit_burst,
+        min_rate=settings.rate_limit_min_requests_per_second,
+    )
@@ -0,0 +1,237 @@
+import hashlib
+import json
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, AsyncIterator, Callable, Iterable
+
+try:
+    import ijson
+    from ijson.common import ObjectBuilder
+except ImportError:  # pragma: no cover - optional dependency
+    ijson = None
+
+if TYPE_CHECKING:
+    from app.services.drift import Fingerprint, FingerprintBuilder
+
+
+@dataclass
+class ResponseStats:
+    data_count: int = 0
+    latest_data_date: str | None = None
+    earliest_data_date: str | None = None
+    null_field_counts: dict[str, int] = field(default_factory=dict)
+    schema_fingerprint: str | None = None
+    edges_digest: str | None = None
+    fingerprint: "Fingerprint | None" = None
+
+
+class ResponseAnalyzer:
+    """
+    Computes response stats in a single pass over the data items.
+    Subclass and override extract_date() to support other item layouts.
+    Set `fingerprinter` to also hash the items for drift tracking.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.latest_date: str | None = None
+        self.earliest_date: str | None = None
+        self.null_field_counts: dict[str, int] = {}
+        self.field_types: dict[str, set[str]] = {}
+        self.first_item: Any = None
+        self.last_item: Any = None
+        self.fingerprinter: "FingerprintBuilder | None" = None
+
+    def feed(self, item: Any) -> None:
+        if self.count == 0:
+            self.first_item = item
+        self.last_item = item
+        self.count += 1
+        if not isinstance(item, dict):
+            if self.fingerprinter is not None:
+                self.fingerprinter.feed(item, None)
+            return
+
+        for key, value in item.items():
+            types = self.field_types.get(key)
+            if types is None:
+                types = self.field_types[key] = set()
+            types.add(type(value).__name__)
+            if value is None:
+                self.null_field_counts[key] = self.null_field_counts.get(key, 0) + 1
+
+        date = self.extract_date(item)
+        if date is not None:
+            if self.latest_date is None or date > self.latest_date:
+                self.latest_date = date
+            if self.earliest_date is None or date < self.earliest_date:
+                self.earliest_date = date
+        if self.fingerprinter is not None:
+            self.fingerprinter.feed(item, date)
+
+    def extract_date(self, item: dict) -> str | None:
+        """
+        Extract the date of a data item as YYYY-MM-DD.
+        Supports formats:
+        - 'date' field with YYYYMMDD format (e.g., "20251117")
+        - '_id' field with YYYY-MM-DD format (e.g., "2025-11-17")
+        """
+        # Try 'date' field (format: YYYYMMDD)
+        if "date" in item and isinstance(item["date"], str):
+            date_str = item["date"]
+            if len(date_str) == 8 and date_str.isdigit():
+                # Convert YYYYMMDD to YYYY-MM-DD for consistency
+                return f"{date_str[:4]}-{date_str[4:6]}-{date_str[6:8]}"
+
+        # Try '_id' field if it looks like a date (format: YYYY-MM-DD)
+        elif "_id" in item and isinstance(item["_id"], str):
+            id_str = item["_id"]
+            if len(id_str) == 10 and id_str[4] == "-" and id_str[7] == "-":
+                return id_str
+
+        return None
+
+    def schema_fingerprint(self) -> str | None:
+        """Short hash of the item field names and their value types."""
+        if not self.field_types:
+            return None
+        schema = "|".join(
+            f"{key}:{','.join(sorted(types))}" for key, types in sorted(self.field_types.items())
+        )
+        return hashlib.sha1(schema.encode("utf-8")).hexdigest()[:16]
+
+    def edges_digest(self) -> str | None:
+        """Short hash of the first and last items, to tell pages of a list apart."""
+        if not self.count:
+            return None
+        edges = json.dumps([self.first_item, self.last_item], sort_keys=True, default=str)
+        return hashlib.blake2b(edges.encode("utf-8"), digest_size=8).hexdigest()
+
+    def stats(self) -> ResponseStats:
+        return ResponseStats(
+            data_count=self.count,
+            latest_data_date=self.latest_date,
+            earliest_data_date=self.earliest_date,
+            null_field_counts=self.null_field_counts,
+            schema_fingerprint=self.schema_fingerprint(),
+            edges_digest=self.edges_digest(),
+            fingerprint=self.fingerprinter.build(self.latest_date) if self.fingerprinter else None,
+        )
+
+    def analyze(self, items: Iterable[Any]) -> ResponseStats:
+        for item in items:
+            self.feed(item)
+        return self.stats()
+
+
+class CountingAnalyzer(ResponseAnalyzer):
+    """Analyzer for non time-series responses: no date extraction."""
+
+    def extract_date(self, item: dict) -> str | None:
+        return None
+
+
+AnalyzerFactory = Callable[[], ResponseAnalyzer]
+
+# ijson item prefixes mapped to the list they belong to, in the same order
+# of precedence used by payload.find_data_list
+_ITEM_PREFIXES = {"data.item": "data", "items.item": "items", "item": ""}
+_LIST_PREFIXES = ("data", "items", "")
+_START_EVENTS = ("start_map", "start_array")
+_END_EVENTS = ("end_map", "end_array")
+
+
+def incremental_json_available() -> bool:
+    return ijson is not None
+
+
+class InvalidJSONStream(ValueError):
+    """A streamed body that is not valid JSON; the body has been read to the end."""
+
+    def __init__(self, message: str, bytes_read: int):
+        super().__init__(message)
+        self.bytes_read = bytes_read
+
+
+class _AsyncByteReader:
+    """File-like adapter exposing an async byte iterator to ijson."""
+
+    def __init__(self, chunks: AsyncIterator[bytes]):
+        self._chunks = chunks
+        self._buffer = b""
+        self.bytes_read = 0
+
+    async def read(self, size: int = -1) -> bytes:
+        while not self._buffer:
+            try:
+                self._buffer = await self._chunks.__anext__()
+            except StopAsyncIteration:
+                return b""
+            self.bytes_read += len(self._buffer)
+        if size < 0:
+            size = len(self._buffer)
+        data, self._buffer = self._buffer[:size], self._buffer[size:]
+        return data
+
+
+async def analyze_json_stream(
+    chunks: AsyncIterator[bytes],
+    analyzer_factory: AnalyzerFactory,
+) -> tuple[ResponseStats | None, int]:
+    """
+    Analyze a JSON body incrementally without materializing it.
+    Returns (stats, body_size); stats is None when the body has no item list.
+    Raises InvalidJSONStream for a malformed body.
+    Requires the optional ijson dependency.
+    """
+    reader = _AsyncByteReader(chunks)
+    try:
+        return await _analyze_events(reader, analyzer_factory)
+    except ijson.JSONError as e:
+        # Read the rest so the size is right and the connection can be reused
+        while await reader.read():
+            pass
+        # yajl appends a multi-line pointer to the error position
+        raise InvalidJSONStream(str(e).split("\n", 1)[0], reader.bytes_read) from e
+
+
+async def _analyze_events(
+    reader: _AsyncByteReader,
+    analyzer_factory: AnalyzerFactory,
+) -> tuple[ResponseStats | None, int]:
+    analyzers: dict[str, ResponseAnalyzer] = {}
+    builder = None
+    builder_list = ""
+    depth = 0
+
+    async for prefix, event, value in ijson.parse_async(reader, use_float=True):
+        if builder is not None:
+            if event in _START_EVENTS:
+                depth += 1
+            elif event in _END_EVENTS:
+                depth -= 1
+            if depth == 0:
+                analyzers[builder_list].feed(builder.value)
+                builder = None
+            else:
+                builder.event(event, value)
+            continue
+
+        if event == "start_array" and prefix in _LIST_PREFIXES:
+            analyzers.setdefault(prefix, analyzer_factory())
+            continue
+
+        list_key = _ITEM_PREFIXES.get(prefix)
+        if list_key is None or list_key not in analyzers:
+            continue
+        if event in _START_EVENTS:
+            builder = ObjectBuilder()
+            builder.event(event, value)
+            builder_list = list_key
+            depth = 1
+        elif event not in _END_EVENTS:
+            analyzers[list_key].feed(value)
+
+    for key in _LIST_PREFIXES:
+        if key in analyzers:
+            return analyzers[key].stats(), reader.bytes_read
+    return None, reader.bytes_read
@@ -0,0 +1,149 @@
+import json
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Hashable, Mapping
+
+from app.config import get_settings
+
+
+@dataclass
+class CachedResponse:
+    """An upstream response body with its HTTP validators."""
+
+    status_code: int
+    content: bytes
+    content_type: str
+    etag: str | None
+    last_modified: str | None
+    expires_at: float  # time.monotonic(); 0 = always revalidate
+
+    @property
+    def size(self) -> int:
+        return len(self.content)
+
+    def is_fresh(self) -> bool:
+        return time.monotonic() < self.expires_at
+
+    def conditional_headers(self) -> dict[str, str]:
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+def normalize_params(params: dict) -> str:
+    """Canonical JSON form of request params, for use in keys."""
+    return json.dumps(params, sort_keys=True, separators=(",", ":"), default=str)
+
+
+def cache_key(token_hash: str, endpoint_id: str, params: dict) -> tuple[str, str, str]:
+    """Key on the token hash, endpoint and normalized params."""
+    return token_hash, endpoint_id, normalize_params(params)
+
+
+def parse_cache_control(headers: Mapping[str, str]) -> tuple[bool, float]:
+    """
+    (storable, max_age seconds) from the Cache-Control header.
+    no-store is not storable; no-cache and a missing max-age store the
+    response but revalidate it on every use.
+    """
+    directives: dict[str, str | None] = {}
+    for part in headers.get("cache-control", "").split(","):
+        name, _, value = part.strip().partition("=")
+        if name:
+            directives[name.lower()] = value.strip('"') or None
+
+    if "no-store" in directives:
+        return False, 0.0
+    if "no-cache" in directives:
+        return True, 0.0
+    try:
+        return True, max(0.0, float(directives.get("max-age") or 0))
+    except ValueError:
+        return True, 0.0
+
+
+class ResponseCache:
+    """
+    Byte-bounded LRU cache of upstream response bodies.
+    Stale entries are kept while they have an ETag or Last-Modified so
+    they can be revalidated with a conditional request.
+    """
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self.total_bytes = 0
+        self._entries: OrderedDict[Hashable, CachedResponse] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> CachedResponse | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if not entry.is_fresh() and not (entry.etag or entry.last_modified):
+            self.invalidate(key)
+            return None
+        self._entries.move_to_end(key)
+        return entry
+
+    def set(self, key: Hashable, entry: CachedResponse) -> None:
+        self.invalidate(key)
+        if entry.size > self.max_bytes:
+            return
+        self._entries[key] = entry
+        self.total_bytes += entry.size
+        while self.total_bytes > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self.total_bytes -= evicted.size
+
+    def store(self, key: Hashable, status_code: int, content: bytes, headers: Mapping[str, str]) -> bool:
+        """Cache a response according to its headers. Returns whether it was stored."""
+        storable, max_age = parse_cache_control(headers)
+        etag = headers.get("etag")
+        last_modified = headers.get("last-modified")
+        # Without freshness or validators the entry could never be reused
+        if not storable or (max_age <= 0 and not (etag or last_modified)):
+            self.invalidate(key)
+            return False
+        self.set(
+            key,
+            CachedResponse(
+                status_code=status_code,
+                content=content,
+                content_type=headers.get("content-type", ""),
+                etag=etag,
+                last_modified=last_modified,
+                expires_at=time.monotonic() + max_age,
+            ),
+        )
+        return True
+
+    def refresh(self, key: Hashable, entry: CachedResponse, headers: Mapping[str, str]) -> None:
+        """Apply the headers of a 304 Not Modified to a cached entry."""
+        storable, max_age = parse_cache_control(headers)
+        if not storable:
+            self.invalidate(key)
+            return
+        entry.expires_at = time.monotonic() + max_age
+        entry.etag = headers.get("etag", entry.etag)
+        entry.last_modified = headers.get("last-modified", entry.last_modified)
+
+    def invalidate(self, key: Hashable) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self.total_bytes -= entry.size
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.total_bytes = 0
+
+
+@lru_cache
+def get_response_cache() -> ResponseCache:
+    return ResponseCache(max_bytes=get_settings().response_cache_max_bytes)
@@ -0,0 +1,81 @@
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import TYPE_CHECKING, Any
+
+from app.models import DriftReport, ParameterError, ValidationResult
+
+if TYPE_CHECKING:
+    from app.services.drift import Fingerprint
+
+
+@dataclass(slots=True)
+class ResultRecord:
+    """
+    Internal result of one endpoint validation. A slotted dataclass is a
+    fraction of the size and construction cost of a ValidationResult, so
+    the client and the aggregating services (benchmarks, pagination, health
+    checks) work with records; they become ValidationResults only when a
+    response is built, with to_validation_result().
+    """
+
+    endpoint_id: str
+    endpoint_name: str
+    success: bool
+    status_code: int
+    response_time_ms: float
+    request_url: str
+    request_params: dict
+    timestamp: datetime = field(default_factory=datetime.utcnow)
+    response_data: Any = None
+    error_message: str | None = None
+    data_count: int | None = None
+    latest_data_date: str | None = None
+    earliest_data_date: str | None = None
+    null_field_counts: dict[str, int] | None = None
+    schema_fingerprint: str | None = None
+    response_size_bytes: int | None = None
+    response_truncated: bool = False
+    retry_count: int = 0
+    retry_wait_ms: float = 0
+    cache_status: str | None = None
+    deduplicated: bool = False
+    hedged: bool = False
+    parameter_errors: list[ParameterError] | None = None
+    drift: DriftReport | None = None
+    # Upstream JSON body when response_data is passed through unchanged
+    raw_response_data: bytes | None = None
+    # Hash of the first and last data items (see ResponseAnalyzer.edges_digest)
+    edges_digest: str | None = None
+    # Row fingerprint of the response, when drift tracking was requested
+    fingerprint: "Fingerprint | None" = None
+
+    def to_validation_result(self) -> ValidationResult:
+        result = ValidationResult(
+            endpoint_id=self.endpoint_id,
+            endpoint_name=self.endpoint_name,
+            success=self.success,
+            status_code=self.status_code,
+            response_time_ms=self.response_time_ms,
+            timestamp=self.timestamp,
+            request_url=self.request_url,
+            request_params=self.request_params,
+            response_data=self.response_data,
+            error_message=self.error_message,
+            data_count=self.data_count,
+            latest_data_date=self.latest_data_date,
+            earliest_data_date=self.earliest_data_date,
+            null_field_counts=self.null_field_counts,
+            schema_fingerprint=self.schema_fingerprint,
+            response_size_bytes=self.response_size_bytes,
+            response_truncated=self.response_truncated,
+            retry_count=self.retry_count,
+            retry_wait_ms=self.retry_wait_ms,
+            cache_status=self.cache_status,
+            deduplicated=self.deduplicated,
+            hedged=self.hedged,
+            parameter_errors=self.parameter_errors,
+            drift=self.drift,
+        )
+        if self.raw_response_data is not None:
+            result.raw_response_data = self.raw_response_data
+        return result
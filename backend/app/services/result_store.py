@@ -0,0 +1,328 @@
+import asyncio
+import json
+import logging
+import sqlite3
+import time
+from datetime import datetime, timezone
+
+from app.config import get_settings
+from app.models import RollupBucket, StoredResult
+from app.services.histogram import LatencyHistogram
+from app.services.result_record import ResultRecord
+
+logger = logging.getLogger(__name__)
+
+RESOLUTIONS = {"minute": 60, "hour": 3600}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS validation_results (
+    id INTEGER PRIMARY KEY,
+    ts REAL NOT NULL,
+    endpoint_id TEXT NOT NULL,
+    token_hash TEXT NOT NULL,
+    account_id TEXT,
+    success INTEGER NOT NULL,
+    status_code INTEGER NOT NULL,
+    response_time_ms REAL NOT NULL,
+    data_count INTEGER,
+    latest_data_date TEXT,
+    response_size_bytes INTEGER,
+    retry_count INTEGER NOT NULL DEFAULT 0,
+    error_message TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_results_endpoint_ts ON validation_results (endpoint_id, ts);
+CREATE INDEX IF NOT EXISTS idx_results_ts ON validation_results (ts);
+CREATE TABLE IF NOT EXISTS validation_rollups (
+    endpoint_id TEXT NOT NULL,
+    resolution TEXT NOT NULL,
+    bucket_start REAL NOT NULL,
+    count INTEGER NOT NULL,
+    errors INTEGER NOT NULL,
+    histogram TEXT NOT NULL,
+    PRIMARY KEY (endpoint_id, resolution, bucket_start)
+);
+"""
+
+_INSERT_RESULT = """
+INSERT INTO validation_results (
+    ts, endpoint_id, token_hash, account_id, success, status_code, response_time_ms,
+    data_count, latest_data_date, response_size_bytes, retry_count, error_message
+) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_RESULT_COLUMNS = (
+    "ts, endpoint_id, account_id, success, status_code, response_time_ms, "
+    "data_count, latest_data_date, response_size_bytes, retry_count, error_message"
+)
+
+# Seconds between retention sweeps
+_PRUNE_INTERVAL = 3600
+
+
+def _to_epoch(value: datetime) -> float:
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.timestamp()
+
+
+def _from_epoch(value: float) -> datetime:
+    return datetime.fromtimestamp(value, tz=timezone.utc).replace(tzinfo=None)
+
+
+class ResultStore:
+    """
+    Append-only SQLite store of validation results (without payloads).
+    Results are queued in memory and written in batches by a background
+    writer, which also maintains per-endpoint minute/hour rollups holding
+    counts, errors and a latency histogram.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        batch_size: int = 200,
+        flush_interval: float = 1.0,
+        queue_size: int = 10000,
+        raw_retention_days: float = 7,
+    ):
+        self.path = path
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.raw_retention_days = raw_retention_days
+        self.dropped = 0
+        # None is the writer's stop signal
+        self._queue: asyncio.Queue[tuple | None] = asyncio.Queue(maxsize=queue_size)
+        self._connection: sqlite3.Connection | None = None
+        self._writer: asyncio.Task | None = None
+        self._last_prune = 0.0
+
+    def _connect(self) -> sqlite3.Connection:
+        connection = sqlite3.connect(self.path, check_same_thread=False)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        return connection
+
+    async def start(self) -> None:
+        self._connection = await asyncio.to_thread(self._connect)
+        await asyncio.to_thread(self._connection.executescript, _SCHEMA)
+        self._writer = asyncio.create_task(self._write_loop())
+
+    async def stop(self) -> None:
+        if self._writer is not None:
+            # Not cancelled: the writer commits the rows it holds, and no
+            # write thread is left running on the connection we close below
+            if not self._writer.done():
+                await self._queue.put(None)
+            await asyncio.gather(self._writer, return_exceptions=True)
+            self._writer = None
+        # Flush whatever was queued after the stop signal
+        rows = []
+        while not self._queue.empty():
+            row = self._queue.get_nowait()
+            if row is not None:
+                rows.append(row)
+        if rows and self._connection is not None:
+            await asyncio.to_thread(self._write_batch, rows)
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+    def record(self, result: ResultRecord, token_hash: str) -> None:
+        """Queue a result for writing. Never blocks; drops when the queue is full."""
+        row = (
+            _to_epoch(result.timestamp),
+            result.endpoint_id,
+            token_hash,
+            result.request_params.get("account_id"),
+            int(result.success),
+            result.status_code,
+            result.response_time_ms,
+            result.data_count,
+            result.latest_data_date,
+            result.response_size_bytes,
+            result.retry_count,
+            result.error_message,
+        )
+        try:
+            self._queue.put_nowait(row)
+        except asyncio.QueueFull:
+            self.dropped += 1
+
+    async def _write_loop(self) -> None:
+        stopping = False
+        while not stopping:
+            row = await self._queue.get()
+            if row is None:
+                return
+            rows = [row]
+            deadline = time.monotonic() + self.flush_interval
+            while len(rows) < self.batch_size:
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    break
+                try:
+                    row = await asyncio.wait_for(self._queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    break
+                if row is None:
+                    stopping = True
+                    break
+                rows.append(row)
+            try:
+                await asyncio.to_thread(self._write_batch, rows)
+            except Exception:
+                logger.exception("Failed to write %d validation results", len(rows))
+
+    def _write_batch(self, rows: list[tuple]) -> None:
+        # Aggregate the batch per rollup bucket before touching the table
+        buckets: dict[tuple[str, str, float], tuple[int, int, LatencyHistogram]] = {}
+        for row in rows:
+            ts, endpoint_id, success, response_time_ms = row[0], row[1], row[4], row[6]
+            for resolution, seconds in RESOLUTIONS.items():
+                key = (endpoint_id, resolution, ts - ts % seconds)
+                count, errors, histogram = buckets.get(key) or (0, 0, LatencyHistogram())
+                histogram.record(response_time_ms)
+                buckets[key] = (count + 1, errors + (0 if success else 1), histogram)
+
+        connection = self._connection
+        with connection:
+            connection.executemany(_INSERT_RESULT, rows)
+            for (endpoint_id, resolution, bucket_start), (count, errors, histogram) in buckets.items():
+                existing = connection.execute(
+                    "SELECT count, errors, histogram FROM validation_rollups "
+                    "WHERE endpoint_id = ? AND resolution = ? AND bucket_start = ?",
+                    (endpoint_id, resolution, bucket_start),
+                ).fetchone()
+                if existing:
+                    histogram.merge(LatencyHistogram.from_dict(json.loads(existing[2])))
+                    count += existing[0]
+                    errors += existing[1]
+                connection.execute(
+                    "INSERT OR REPLACE INTO validation_rollups "
+                    "(endpoint_id, resolution, bucket_start, count, errors, histogram) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    (endpoint_id, resolution, bucket_start, count, errors, json.dumps(histogram.to_dict())),
+                )
+
+            now = time.time()
+            if now - self._last_prune >= _PRUNE_INTERVAL:
+                self._last_prune = now
+                cutoff = now - self.raw_retention_days * 86400
+                connection.execute("DELETE FROM validation_results WHERE ts < ?", (cutoff,))
+                connection.execute(
+                    "DELETE FROM validation_rollups WHERE resolution = 'minute' AND bucket_start < ?",
+                    (cutoff,),
+                )
+
+    def _query(self, sql: str, params: tuple) -> list[tuple]:
+        # Separate read connection: WAL lets readers run alongside the writer
+        connection = sqlite3.connect(self.path)
+        try:
+            return connection.execute(sql, params).fetchall()
+        finally:
+            connection.close()
+
+    async def query_results(
+        self,
+        endpoint_id: str | None = None,
+        since: datetime | None = None,
+        until: datetime | None = None,
+        limit: int = 100,
+    ) -> list[StoredResult]:
+        sql, params = f"SELECT {_RESULT_COLUMNS} FROM validation_results WHERE ts >= ? AND ts < ?", [
+            _to_epoch(since) if since else 0,
+            _to_epoch(until) if until else float("inf"),
+        ]
+        if endpoint_id:
+            sql += " AND endpoint_id = ?"
+            params.append(endpoint_id)
+        sql += " ORDER BY ts DESC LIMIT ?"
+        params.append(limit)
+
+        rows = await asyncio.to_thread(self._query, sql, tuple(params))
+        return [
+            StoredResult(
+                timestamp=_from_epoch(row[0]),
+                endpoint_id=row[1],
+                account_id=row[2],
+                success=bool(row[3]),
+                status_code=row[4],
+                response_time_ms=row[5],
+                data_count=row[6],
+                latest_data_date=row[7],
+                response_size_bytes=row[8],
+                retry_count=row[9],
+                error_message=row[10],
+            )
+            for row in rows
+        ]
+
+    async def query_rollups(
+        self,
+        resolution: str,
+        endpoint_id: str | None = None,
+        since: datetime | None = None,
+        until: datetime | None = None,
+    ) -> list[RollupBucket]:
+        sql, params = (
+            "SELECT endpoint_id, bucket_start, count, errors, histogram FROM validation_rollups "
+            "WHERE resolution = ? AND bucket_start >= ? AND bucket_start < ?",
+            [resolution, _to_epoch(since) if since else 0, _to_epoch(until) if until else float("inf")],
+        )
+        if endpoint_id:
+            sql += " AND endpoint_id = ?"
+            params.append(endpoint_id)
+        sql += " ORDER BY bucket_start, endpoint_id"
+
+        rows = await asyncio.to_thread(self._query, sql, tuple(params))
+        buckets = []
+        for endpoint, bucket_start, count, errors, histogram_json in rows:
+            histogram = LatencyHistogram.from_dict(json.loads(histogram_json))
+            p = histogram.percentiles([50, 90, 99])
+            buckets.append(
+                RollupBucket(
+                    endpoint_id=endpoint,
+                    resolution=resolution,
+                    bucket_start=_from_epoch(bucket_start),
+                    count=count,
+                    errors=errors,
+                    error_rate=round(errors / count, 4) if count else 0.0,
+                    mean_ms=round(histogram.mean_ms, 3),
+                    p50_ms=p[50],
+                    p90_ms=p[90],
+                    p99_ms=p[99],
+                    max_ms=histogram.max_ms,
+                )
+            )
+        return buckets
+
+
+_store: ResultStore | None = None
+
+
+async def start_result_store() -> ResultStore | None:
+    """Open the store if RESULT_STORE_PATH is set. Called from the app lifespan."""
+    global _store
+    settings = get_settings()
+    if not settings.result_store_path:
+        return None
+    _store = ResultStore(
+        settings.result_store_path,
+        batch_size=settings.result_store_batch_size,
+        flush_interval=settings.result_store_flush_interval_seconds,
+        queue_size=settings.result_store_queue_size,
+        raw_retention_days=settings.result_store_raw_retention_days,
+    )
+    await _store.start()
+    return _store
+
+
+async def stop_result_store() -> None:
+    global _store
+    if _store is not None:
+        await _store.stop()
+        _store = None
+
+
+def get_result_store() -> ResultStore | None:
+    return _store
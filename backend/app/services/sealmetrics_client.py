@@ -1,188 +1,703 @@
+import asyncio
 import httpx
+import random
 import time
-from datetime import datetime
-from typing import Any
+from dataclasses import replace
+from typing import Any, Awaitable, Callable
 
 from app.config import get_settings
-from app.models import ValidationResult, EndpointInfo
+from app.models import ValidationResult, EndpointInfo, ResponseOptions
+from app.services.deadline import clip_timeout, current as current_deadline, remaining
+from app.services.drift import get_drift_tracker, with_fingerprint
 from app.services.endpoints_registry import EndpointsRegistry
+from app.services.hedging import get_latency_tracker
+from app.services.http_pool import get_http_client
+from app.services.metrics import (
+    HEDGED_REQUESTS,
+    RESPONSE_CACHE_LOOKUPS,
+    SINGLE_FLIGHT_REQUESTS,
+    UPSTREAM_IN_FLIGHT,
+    UpstreamTrace,
+)
+from app.services.payload import find_data_list, shape_response_data
+from app.services.rate_limiter import get_rate_limiters, parse_retry_after
+from app.services.response_cache import CachedResponse, cache_key, get_response_cache, normalize_params
+from app.services.response_analysis import (
+    AnalyzerFactory,
+    InvalidJSONStream,
+    ResponseStats,
+    analyze_json_stream,
+    incremental_json_available,
+)
+from app.services.result_record import ResultRecord
+from app.services.result_store import get_result_store
+from app.services.single_flight import get_single_flight
+from app.services.token_cache import TokenValidation, get_token_cache
+from app.services.token_hash import hash_token
+
+
+# Transport failures where the request never reached the upstream handler
+RETRYABLE_ERRORS = (
+    httpx.ConnectError,
+    httpx.ConnectTimeout,
+    httpx.PoolTimeout,
+    httpx.RemoteProtocolError,
+)
+
+_TIMEOUT_PHASES = (
+    (httpx.ConnectTimeout, "connect"),
+    (httpx.ReadTimeout, "read"),
+    (httpx.WriteTimeout, "write"),
+    (httpx.PoolTimeout, "pool"),
+)
+
+
+def _embeddable_json(content: bytes) -> bytes | None:
+    """
+    The body, stripped, when it can be embedded as-is in a JSON response:
+    valid UTF-8 without BOM, a single object or array whose closing bracket
+    matches the opening one, and on a single line, so it can't break
+    NDJSON/SSE framing. None otherwise, and the parsed data is re-serialized.
+    """
+    content = content.strip()
+    if content[:1] + content[-1:] not in (b"{}", b"[]"):
+        return None
+    if b"\n" in content or b"\r" in content:
+        return None
+    try:
+        content.decode("utf-8")
+    except UnicodeDecodeError:
+        return None
+    return content
+
+
+def _timeout_message(error: httpx.TimeoutException, timeout: httpx.Timeout) -> str:
+    for error_type, phase in _TIMEOUT_PHASES:
+        if isinstance(error, error_type):
+            return f"Request timeout ({phase}, {getattr(timeout, phase):g}s)"
+    return "Request timeout"
 
 
 class SealmetricsClient:
     """Client for making validated requests to the Sealmetrics API."""
 
-    def __init__(self, api_token: str):
+    def __init__(
+        self,
+        api_token: str,
+        http_client: httpx.AsyncClient | None = None,
+        rate_limited: bool = True,
+        max_retries: int | None = None,
+        deduplicate: bool = True,
+        hedge: bool = True,
+        store_results: bool = True,
+    ):
         self.api_token = api_token
         self.settings = get_settings()
+        self.http_client = http_client or get_http_client()
         self.base_url = self.settings.sealmetrics_api_base
+        self.max_retries = self.settings.retry_max_attempts if max_retries is None else max_retries
+        self.deduplicate = deduplicate and self.settings.single_flight_enabled
+        self.hedge = hedge and self.settings.hedge_enabled
+        # Whether results go to the history store (see ResultStore)
+        self.store_results = store_results
+        self.rate_limiter = None
+        if rate_limited and self.settings.rate_limit_enabled:
+            self.rate_limiter = get_rate_limiters().get(self.base_url, hash_token(api_token))
         self.headers = {
             "Authorization": f"Bearer {api_token}",
             "Accept": "application/json",
-            "Connection": "keep-alive",
             "Accept-Encoding": "gzip, deflate, br",
         }
 
     async def validate_token(self) -> tuple[bool, list[dict], str | None]:
         """
         Validates the API token by calling /auth/accounts.
+        Results are cached per token hash (see TokenValidationCache).
         Returns: (is_valid, accounts_list, error_message)
         """
-        async with httpx.AsyncClient() as client:
-            try:
-                response = await client.get(
-                    f"{self.base_url}/auth/accounts",
-                    headers=self.headers,
-                    timeout=30.0,
-                )
+        if not self.settings.token_cache_enabled:
+            validation, _ = await self._fetch_token_validation()
+            return validation
 
-                if response.status_code == 200:
-                    data = response.json()
-                    # Handle different response formats
-                    if isinstance(data, dict):
-                        # Check if it's a {data: [...]} response
-                        if "data" in data and isinstance(data["data"], list):
-                            accounts = data["data"]
-                        # Check if it's a {id: name, id: name, ...} format
-                        elif all(isinstance(k, str) and isinstance(v, str) for k, v in data.items()):
-                            accounts = [{"id": k, "name": v} for k, v in data.items()]
-                        else:
-                            accounts = [data]
-                    elif isinstance(data, list):
-                        accounts = data
+        key = (self.base_url, hash_token(self.api_token))
+        return await get_token_cache().get_or_load(key, self._fetch_token_validation)
+
+    async def _fetch_token_validation(self) -> tuple[TokenValidation, float | None]:
+        """
+        Calls /auth/accounts and returns the validation with its cache TTL.
+        Only successful and 401 responses are cacheable.
+        """
+        trace = UpstreamTrace("token_validation")
+        try:
+            if self.rate_limiter is not None:
+                await self.rate_limiter.acquire()
+            response = await self.http_client.get(
+                f"{self.base_url}/auth/accounts",
+                headers=self.headers,
+                timeout=clip_timeout(EndpointsRegistry.get_timeout("auth_accounts")),
+                extensions=trace.extensions,
+            )
+            trace.status_code = response.status_code
+            trace.observe()
+            if self.rate_limiter is not None:
+                retry_after = parse_retry_after(response.headers.get("retry-after"))
+                self.rate_limiter.on_response(response.status_code, retry_after)
+
+            if response.status_code == 200:
+                data = response.json()
+                # Handle different response formats
+                if isinstance(data, dict):
+                    # Check if it's a {data: [...]} response
+                    if "data" in data and isinstance(data["data"], list):
+                        accounts = data["data"]
+                    # Check if it's a {id: name, id: name, ...} format
+                    elif all(isinstance(k, str) and isinstance(v, str) for k, v in data.items()):
+                        accounts = [{"id": k, "name": v} for k, v in data.items()]
                     else:
-                        accounts = []
-                    return True, accounts, None
-                elif response.status_code == 401:
-                    return False, [], "Invalid API token"
+                        accounts = [data]
+                elif isinstance(data, list):
+                    accounts = data
                 else:
-                    return False, [], f"API error: {response.status_code}"
+                    accounts = []
+                return (True, accounts, None), self.settings.token_cache_ttl_seconds
+            elif response.status_code == 401:
+                return (False, [], "Invalid API token"), self.settings.token_cache_negative_ttl_seconds
+            else:
+                return (False, [], f"API error: {response.status_code}"), None
 
-            except httpx.TimeoutException:
-                return False, [], "Request timeout"
-            except Exception as e:
-                return False, [], str(e)
+        except httpx.TimeoutException:
+            return (False, [], "Request timeout"), None
+        except Exception as e:
+            return (False, [], str(e)), None
 
     async def validate_endpoint(
-        self, endpoint_id: str, parameters: dict
+        self,
+        endpoint_id: str,
+        parameters: dict,
+        response_options: ResponseOptions | None = None,
+        use_cache: bool = False,
+        track_drift: bool = False,
     ) -> ValidationResult:
         """
         Validates a specific endpoint with given parameters.
-        Returns detailed validation result.
+        Returns the result as a ValidationResult; see validate_endpoint_record.
+        """
+        record = await self.validate_endpoint_record(
+            endpoint_id, parameters, response_options, use_cache=use_cache, track_drift=track_drift
+        )
+        return record.to_validation_result()
+
+    async def validate_endpoint_record(
+        self,
+        endpoint_id: str,
+        parameters: dict,
+        response_options: ResponseOptions | None = None,
+        use_cache: bool = False,
+        track_drift: bool = False,
+    ) -> ResultRecord:
+        """
+        Validates a specific endpoint with given parameters.
+        response_options controls how much of the upstream payload is embedded.
+        use_cache serves GETs from the response cache (see ResponseCache),
+        revalidating stale entries with a conditional request.
+        track_drift compares the data with the previous response to the
+        same request (see DriftTracker).
+        Concurrent identical validations share one upstream call (see SingleFlight).
+        Returns a lightweight ResultRecord, for callers that aggregate many results.
         """
         endpoint = EndpointsRegistry.get_endpoint_by_id(endpoint_id)
         if not endpoint:
-            return ValidationResult(
+            return ResultRecord(
                 endpoint_id=endpoint_id,
                 endpoint_name="Unknown",
                 success=False,
                 status_code=0,
                 response_time_ms=0,
-                timestamp=datetime.utcnow(),
                 request_url="",
                 request_params=parameters,
                 error_message=f"Unknown endpoint: {endpoint_id}",
             )
 
+        if self.settings.parameter_validation_enabled:
+            # Normalize against the registry specs; invalid requests never reach the upstream
+            clean_params, errors = EndpointsRegistry.get_params_validator(endpoint.id).validate(parameters)
+            if errors:
+                return ResultRecord(
+                    endpoint_id=endpoint.id,
+                    endpoint_name=endpoint.name,
+                    success=False,
+                    status_code=0,
+                    response_time_ms=0,
+                    request_url="",
+                    request_params=parameters,
+                    error_message="Invalid parameters: " + ", ".join(f"{e.name} ({e.error})" for e in errors),
+                    parameter_errors=errors,
+                )
+        else:
+            # Filter out empty parameters
+            clean_params = {k: v for k, v in parameters.items() if v is not None and v != ""}
+
+        options = self._effective_response_options(response_options)
+
+        if not self.deduplicate:
+            return await self._validate(endpoint, clean_params, options, use_cache, track_drift)
+
+        flight_key = (
+            self.base_url,
+            hash_token(self.api_token),
+            endpoint.id,
+            normalize_params(clean_params),
+            options.model_dump_json(),
+            use_cache,
+            track_drift,
+            self.max_retries,
+            self.store_results,
+            # The shared call runs under the first caller's deadline
+            current_deadline(),
+        )
+        result, shared = await get_single_flight().do(
+            flight_key, lambda: self._validate(endpoint, clean_params, options, use_cache, track_drift)
+        )
+        SINGLE_FLIGHT_REQUESTS.labels(endpoint_id=endpoint.id, outcome="shared" if shared else "leader").inc()
+        if shared:
+            result = replace(result, deduplicated=True)
+        return result
+
+    async def _validate(
+        self,
+        endpoint: EndpointInfo,
+        clean_params: dict,
+        options: ResponseOptions,
+        use_cache: bool,
+        track_drift: bool = False,
+    ) -> ResultRecord:
+        """Validate an endpoint through the response cache or the upstream, and record the result."""
         # Build request URL
         url = f"{self.base_url}{endpoint.path}"
+        analyzer_factory = EndpointsRegistry.get_analyzer(endpoint.id)
+        if track_drift:
+            analyzer_factory = with_fingerprint(analyzer_factory)
 
-        # Filter out empty parameters
-        clean_params = {k: v for k, v in parameters.items() if v is not None and v != ""}
+        if endpoint.method == "GET":
+            request_kwargs = {"params": clean_params}
+        else:  # POST
+            request_kwargs = {"json": clean_params}
 
-        start_time = time.perf_counter()
+        key, cached = None, None
+        if use_cache and endpoint.method == "GET" and self.settings.response_cache_enabled:
+            key = cache_key(hash_token(self.api_token), endpoint.id, clean_params)
+            cached = get_response_cache().get(key)
+
+        if cached is not None and cached.is_fresh():
+            result = self._cached_result(
+                endpoint, str(httpx.URL(url, params=clean_params)), clean_params, cached, options, analyzer_factory
+            )
+            result.cache_status = "hit"
+        else:
+            result = await self._request_endpoint(
+                endpoint, url, clean_params, request_kwargs, options, analyzer_factory, key, cached
+            )
+        if result.cache_status is not None:
+            RESPONSE_CACHE_LOOKUPS.labels(endpoint_id=endpoint.id, cache_status=result.cache_status).inc()
+
+        if result.success and result.fingerprint is not None:
+            drift_key = (hash_token(self.api_token), endpoint.id, normalize_params(clean_params))
+            result.drift = get_drift_tracker().observe(drift_key, result.fingerprint)
 
-        async with httpx.AsyncClient() as client:
+        store = get_result_store() if self.store_results else None
+        if store is not None:
+            store.record(result, hash_token(self.api_token))
+        return result
+
+    async def _request_endpoint(
+        self,
+        endpoint: EndpointInfo,
+        url: str,
+        clean_params: dict,
+        request_kwargs: dict,
+        options: ResponseOptions,
+        analyzer_factory: AnalyzerFactory,
+        key: tuple | None,
+        cached: CachedResponse | None,
+    ) -> ResultRecord:
+        """Call the upstream, retrying idempotent GETs with backoff."""
+        max_retries = self.max_retries if endpoint.method == "GET" else 0
+        retry_count = 0
+        waited = 0.0
+
+        while True:
+            left = remaining()
+            if left is not None and left <= 0:
+                result = self._failed_result(endpoint, url, clean_params, "Deadline exceeded")
+                break
+            if self.rate_limiter is not None:
+                waited += await self.rate_limiter.acquire()
+
+            result, retry, retry_after = await self._attempt_endpoint(
+                endpoint,
+                url,
+                clean_params,
+                request_kwargs,
+                options,
+                analyzer_factory,
+                can_retry=retry_count < max_retries,
+                key=key,
+                cached=cached,
+            )
+            if not retry:
+                break
+
+            delay = self._retry_delay(retry_count, retry_after)
+            left = remaining()
+            if left is not None and delay >= left:
+                result = self._failed_result(endpoint, url, clean_params, "Deadline exceeded")
+                break
+            retry_count += 1
+            waited += delay
+            await asyncio.sleep(delay)
+
+        result.retry_count = retry_count
+        result.retry_wait_ms = round(waited * 1000, 2)
+        return result
+
+    async def _attempt_endpoint(
+        self,
+        endpoint: EndpointInfo,
+        url: str,
+        clean_params: dict,
+        request_kwargs: dict,
+        options: ResponseOptions,
+        analyzer_factory: AnalyzerFactory,
+        can_retry: bool,
+        key: tuple | None = None,
+        cached: CachedResponse | None = None,
+    ) -> tuple[ResultRecord | None, bool, float | None]:
+        """
+        Perform a single upstream request, hedged with a second identical
+        GET when it is slower than the endpoint's recent latency percentile.
+        Returns (result, retry, retry_after); result is None when the
+        request should be retried.
+        """
+
+        async def send() -> tuple[ResultRecord | None, bool, float | None]:
+            trace = UpstreamTrace(endpoint.id)
             try:
-                if endpoint.method == "GET":
-                    response = await client.get(
-                        url,
-                        headers=self.headers,
-                        params=clean_params,
-                        timeout=60.0,
-                    )
-                else:  # POST
-                    response = await client.post(
-                        url,
-                        headers=self.headers,
-                        json=clean_params,
-                        timeout=60.0,
-                    )
+                # The deadline bounds the whole exchange, not just each phase
+                async with asyncio.timeout(remaining()):
+                    with UPSTREAM_IN_FLIGHT.labels(endpoint_id=endpoint.id).track_inprogress():
+                        outcome = await self._send_attempt(
+                            endpoint,
+                            url,
+                            clean_params,
+                            request_kwargs,
+                            options,
+                            analyzer_factory,
+                            can_retry,
+                            trace,
+                            key,
+                            cached,
+                        )
+            except TimeoutError:
+                elapsed_ms = (time.perf_counter() - trace.started_at) * 1000
+                outcome = self._failed_result(endpoint, url, clean_params, "Deadline exceeded", elapsed_ms), False, None
+            trace.observe()
+            result = outcome[0]
+            if self.hedge and result is not None and (200 <= result.status_code < 300 or result.status_code == 304):
+                get_latency_tracker().record(endpoint.id, result.response_time_ms)
+            return outcome
+
+        delay = self._hedge_delay(endpoint)
+        if delay is None:
+            return await send()
+        return await self._hedged(endpoint, send, delay)
+
+    def _hedge_delay(self, endpoint: EndpointInfo) -> float | None:
+        """Seconds to wait before hedging a GET, or None when it shouldn't be hedged."""
+        if not self.hedge or endpoint.method != "GET":
+            return None
+        latency_ms = get_latency_tracker().percentile(
+            endpoint.id, self.settings.hedge_percentile, self.settings.hedge_min_samples
+        )
+        if latency_ms is None:
+            return None
+        return max(latency_ms, self.settings.hedge_min_delay_ms) / 1000
+
+    async def _hedged(
+        self,
+        endpoint: EndpointInfo,
+        send: Callable[[], Awaitable[tuple[ResultRecord | None, bool, float | None]]],
+        delay: float,
+    ) -> tuple[ResultRecord | None, bool, float | None]:
+        """
+        Run send(), and run it again if it hasn't finished after `delay`.
+        The first outcome with an upstream response wins; the other call is cancelled.
+        """
+        primary = asyncio.ensure_future(send())
+        tasks = {primary}
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=delay)
+            if done:
+                return primary.result()
+            # Hedges are extra load: never queue for them behind the rate limiter
+            if self.rate_limiter is not None and not self.rate_limiter.try_acquire():
+                HEDGED_REQUESTS.labels(endpoint_id=endpoint.id, outcome="skipped").inc()
+                return await primary
 
-                elapsed_ms = (time.perf_counter() - start_time) * 1000
-
-                # Parse response
-                try:
-                    response_data = response.json()
-                except Exception:
-                    response_data = response.text
-
-                # Count data items and extract latest date if applicable
-                data_count = None
-                latest_data_date = None
-                data_list = None
-
-                if isinstance(response_data, dict):
-                    if "data" in response_data and isinstance(response_data["data"], list):
-                        data_list = response_data["data"]
-                        data_count = len(data_list)
-                    elif "items" in response_data and isinstance(response_data["items"], list):
-                        data_list = response_data["items"]
-                        data_count = len(data_list)
-                elif isinstance(response_data, list):
-                    data_list = response_data
-                    data_count = len(data_list)
-
-                # Extract latest date from data
-                if data_list:
-                    latest_data_date = self._extract_latest_date(data_list)
+            hedge = asyncio.ensure_future(send())
+            tasks.add(hedge)
+            while True:
+                done, tasks = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+                # Prefer a real response when both finished together
+                for task in sorted(done, key=lambda t: t.result()[0] is None or t.result()[0].status_code == 0):
+                    outcome = task.result()
+                    result = outcome[0]
+                    # A transport failure only wins when nothing else is left
+                    if tasks and (result is None or result.status_code == 0):
+                        continue
+                    HEDGED_REQUESTS.labels(
+                        endpoint_id=endpoint.id, outcome="hedge" if task is hedge else "primary"
+                    ).inc()
+                    if result is not None:
+                        result.hedged = True
+                    return outcome
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def _send_attempt(
+        self,
+        endpoint: EndpointInfo,
+        url: str,
+        clean_params: dict,
+        request_kwargs: dict,
+        options: ResponseOptions,
+        analyzer_factory: AnalyzerFactory,
+        can_retry: bool,
+        trace: UpstreamTrace,
+        key: tuple | None,
+        cached: CachedResponse | None,
+    ) -> tuple[ResultRecord | None, bool, float | None]:
+        start_time = time.perf_counter()
+        headers = {**self.headers, **cached.conditional_headers()} if cached else self.headers
+        timeout = clip_timeout(EndpointsRegistry.get_timeout(endpoint.id))
+
+        try:
+            async with self.http_client.stream(
+                endpoint.method,
+                url,
+                headers=headers,
+                timeout=timeout,
+                extensions=trace.extensions,
+                **request_kwargs,
+            ) as response:
+                trace.status_code = response.status_code
+                retry_after = parse_retry_after(response.headers.get("retry-after"))
+                if self.rate_limiter is not None:
+                    self.rate_limiter.on_response(response.status_code, retry_after)
+                if can_retry and response.status_code in self.settings.retry_status_codes:
+                    return None, True, retry_after
+
+                if response.status_code == 304 and cached is not None:
+                    await response.aread()
+                    get_response_cache().refresh(key, cached, response.headers)
+                    result = self._cached_result(
+                        endpoint, str(response.request.url), clean_params, cached, options, analyzer_factory, start_time
+                    )
+                    result.cache_status = "revalidated"
+                    return result, False, None
 
                 # Determine success
                 success = 200 <= response.status_code < 300
+                # Cached responses need the whole body, so they can't be analyzed while streaming
+                if success and options.summary_only and key is None and self._can_stream_analysis(response):
+                    # The payload is dropped anyway: analyze it while it streams in
+                    response_data, raw, truncated, error_message = None, None, True, None
+                    try:
+                        stats, body_size = await analyze_json_stream(
+                            response.aiter_bytes(), analyzer_factory
+                        )
+                    except InvalidJSONStream as e:
+                        # Like a body that fails to parse in full: no stats, the status stands
+                        stats, body_size = None, e.bytes_read
+                        error_message = f"Response body is not valid JSON: {e}"
+                else:
+                    await response.aread()
+                    body_size = len(response.content)
+                    if key is not None and response.status_code == 200:
+                        get_response_cache().store(key, response.status_code, response.content, response.headers)
+                    response_data, raw, stats, truncated, error_message = self._process_body(
+                        response, success, options, analyzer_factory
+                    )
 
-                # Build full URL with params for display
-                request_url = str(response.request.url)
+            elapsed_ms = (time.perf_counter() - start_time) * 1000
 
-                return ValidationResult(
-                    endpoint_id=endpoint_id,
-                    endpoint_name=endpoint.name,
-                    success=success,
-                    status_code=response.status_code,
-                    response_time_ms=round(elapsed_ms, 2),
-                    timestamp=datetime.utcnow(),
-                    request_url=request_url,
-                    request_params=clean_params,
-                    response_data=response_data,
-                    data_count=data_count,
-                    latest_data_date=latest_data_date,
-                    error_message=None if success else self._extract_error(response_data),
-                )
+            # Build full URL with params for display
+            request_url = str(response.request.url)
 
-            except httpx.TimeoutException:
-                elapsed_ms = (time.perf_counter() - start_time) * 1000
-                return ValidationResult(
-                    endpoint_id=endpoint_id,
-                    endpoint_name=endpoint.name,
-                    success=False,
-                    status_code=0,
-                    response_time_ms=round(elapsed_ms, 2),
-                    timestamp=datetime.utcnow(),
-                    request_url=url,
-                    request_params=clean_params,
-                    error_message="Request timeout (60s)",
-                )
-            except Exception as e:
-                elapsed_ms = (time.perf_counter() - start_time) * 1000
-                return ValidationResult(
-                    endpoint_id=endpoint_id,
-                    endpoint_name=endpoint.name,
-                    success=False,
-                    status_code=0,
-                    response_time_ms=round(elapsed_ms, 2),
-                    timestamp=datetime.utcnow(),
-                    request_url=url,
-                    request_params=clean_params,
-                    error_message=str(e),
-                )
+            result = ResultRecord(
+                endpoint_id=endpoint.id,
+                endpoint_name=endpoint.name,
+                success=success,
+                status_code=response.status_code,
+                response_time_ms=round(elapsed_ms, 2),
+                request_url=request_url,
+                request_params=clean_params,
+                response_data=response_data,
+                data_count=stats.data_count if stats else None,
+                latest_data_date=stats.latest_data_date if stats else None,
+                earliest_data_date=stats.earliest_data_date if stats else None,
+                null_field_counts=stats.null_field_counts if stats else None,
+                schema_fingerprint=stats.schema_fingerprint if stats else None,
+                edges_digest=stats.edges_digest if stats else None,
+                response_size_bytes=body_size,
+                response_truncated=truncated,
+                error_message=error_message,
+                cache_status="miss" if key is not None else None,
+            )
+            result.raw_response_data = raw
+            result.fingerprint = stats.fingerprint if stats else None
+            return result, False, None
+
+        except httpx.TimeoutException as e:
+            if can_retry and isinstance(e, RETRYABLE_ERRORS):
+                return None, True, None
+            elapsed_ms = (time.perf_counter() - start_time) * 1000
+            return self._failed_result(
+                endpoint, url, clean_params, _timeout_message(e, timeout), elapsed_ms
+            ), False, None
+        except Exception as e:
+            if can_retry and isinstance(e, RETRYABLE_ERRORS):
+                return None, True, None
+            elapsed_ms = (time.perf_counter() - start_time) * 1000
+            return self._failed_result(endpoint, url, clean_params, str(e), elapsed_ms), False, None
+
+    def _failed_result(
+        self,
+        endpoint: EndpointInfo,
+        url: str,
+        clean_params: dict,
+        error_message: str,
+        elapsed_ms: float = 0,
+    ) -> ResultRecord:
+        """Result of a request that got no upstream response."""
+        return ResultRecord(
+            endpoint_id=endpoint.id,
+            endpoint_name=endpoint.name,
+            success=False,
+            status_code=0,
+            response_time_ms=round(elapsed_ms, 2),
+            request_url=url,
+            request_params=clean_params,
+            error_message=error_message,
+        )
+
+    def _process_body(
+        self,
+        response: httpx.Response,
+        success: bool,
+        options: ResponseOptions,
+        analyzer_factory: AnalyzerFactory,
+    ) -> tuple[Any, bytes | None, ResponseStats | None, bool, str | None]:
+        """
+        Parse and analyze a fully read body.
+        Returns (response_data, raw, stats, truncated, error_message); raw is
+        the body itself when response_data is the unmodified parsed JSON and
+        the body is compact, strict JSON, so it can be passed through
+        without re-encoding.
+        """
+        # Parse response; NaN/Infinity are accepted but rule out passing the body through
+        non_finite: list[str] = []
+
+        def parse_constant(name: str) -> float:
+            non_finite.append(name)
+            return float(name)
+
+        try:
+            response_data = response.json(parse_constant=parse_constant)
+        except Exception:
+            response_data = response.text
+
+        # Count data items and extract dates in one pass
+        data_list, _ = find_data_list(response_data)
+        stats = None
+        if data_list is not None:
+            stats = analyzer_factory().analyze(data_list)
+
+        error_message = None if success else self._extract_error(response_data)
+
+        # Bound the embedded payload
+        parsed = response_data
+        response_data, truncated = shape_response_data(response_data, options, len(response.content))
+
+        raw = None
+        if response_data is parsed and isinstance(parsed, (dict, list)) and not non_finite:
+            raw = _embeddable_json(response.content)
+        return response_data, raw, stats, truncated, error_message
+
+    def _cached_result(
+        self,
+        endpoint: EndpointInfo,
+        request_url: str,
+        clean_params: dict,
+        cached: CachedResponse,
+        options: ResponseOptions,
+        analyzer_factory: AnalyzerFactory,
+        start_time: float | None = None,
+    ) -> ResultRecord:
+        """Build a validation result from a cached response body."""
+        start_time = start_time or time.perf_counter()
+        response = httpx.Response(
+            cached.status_code, content=cached.content, headers={"content-type": cached.content_type}
+        )
+        response_data, raw, stats, truncated, _ = self._process_body(response, True, options, analyzer_factory)
+        elapsed_ms = (time.perf_counter() - start_time) * 1000
+
+        result = ResultRecord(
+            endpoint_id=endpoint.id,
+            endpoint_name=endpoint.name,
+            success=True,
+            status_code=cached.status_code,
+            response_time_ms=round(elapsed_ms, 2),
+            request_url=request_url,
+            request_params=clean_params,
+            response_data=response_data,
+            data_count=stats.data_count if stats else None,
+            latest_data_date=stats.latest_data_date if stats else None,
+            earliest_data_date=stats.earliest_data_date if stats else None,
+            null_field_counts=stats.null_field_counts if stats else None,
+            schema_fingerprint=stats.schema_fingerprint if stats else None,
+            edges_digest=stats.edges_digest if stats else None,
+            response_size_bytes=cached.size,
+            response_truncated=truncated,
+        )
+        result.raw_response_data = raw
+        result.fingerprint = stats.fingerprint if stats else None
+        return result
+
+    def _retry_delay(self, attempt: int, retry_after: float | None) -> float:
+        """Delay before the next retry: Retry-After if given, else jittered exponential backoff."""
+        max_delay = self.settings.retry_backoff_max_seconds
+        if retry_after is not None:
+            return min(retry_after, max_delay)
+        backoff = min(max_delay, self.settings.retry_backoff_base_seconds * (2 ** attempt))
+        return random.uniform(backoff / 2, backoff)
+
+    def _effective_response_options(self, options: ResponseOptions | None) -> ResponseOptions:
+        """Merge request options with the server-wide response_max_bytes cap."""
+        options = options or ResponseOptions()
+        cap = self.settings.response_max_bytes
+        if cap is not None and (options.max_bytes is None or options.max_bytes > cap):
+            options = options.model_copy(update={"max_bytes": cap})
+        return options
+
+    def _can_stream_analysis(self, response: httpx.Response) -> bool:
+        """Whether the body can be analyzed incrementally instead of fully parsed."""
+        content_type = response.headers.get("content-type", "")
+        return (
+            self.settings.incremental_json_enabled
+            and incremental_json_available()
+            and "json" in content_type
+        )
 
     def _extract_error(self, response_data: Any) -> str | None:
         """Extract error message from API response."""
@@ -194,33 +709,3 @@ class SealmetricsClient:
             if "detail" in response_data:
                 return str(response_data["detail"])
         return None
-
-    def _extract_latest_date(self, data_list: list) -> str | None:
-        """
-        Extract the latest date from a list of data items.
-        Supports formats:
-        - 'date' field with YYYYMMDD format (e.g., "20251117")
-        - '_id' field with YYYY-MM-DD format (e.g., "2025-11-17")
-        """
-        dates = []
-        for item in data_list:
-            if not isinstance(item, dict):
-                continue
-
-            # Try 'date' field (format: YYYYMMDD)
-            if "date" in item and isinstance(item["date"], str):
-                date_str = item["date"]
-                if len(date_str) == 8 and date_str.isdigit():
-                    # Convert YYYYMMDD to YYYY-MM-DD for consistency
-                    formatted = f"{date_str[:4]}-{date_str[4:6]}-{date_str[6:8]}"
-                    dates.append(formatted)
-
-            # Try '_id' field if it looks like a date (format: YYYY-MM-DD)
-            elif "_id" in item and isinstance(item["_id"], str):
-                id_str = item["_id"]
-                if len(id_str) == 10 and id_str[4] == "-" and id_str[7] == "-":
-                    dates.append(id_str)
-
-        if dates:
-            return max(dates)
-        return None
@@ -0,0 +1,63 @@
+from typing import Any
+
+from fastapi import Response
+from pydantic import BaseModel
+from pydantic_core import to_json
+
+from app.models import ValidationResult
+
+
+def dump_json(value: Any) -> bytes:
+    """
+    Serialize models to JSON bytes with pydantic-core, splicing in the raw
+    upstream body of results whose response_data was passed through
+    unchanged instead of re-encoding the parsed payload.
+    """
+    if isinstance(value, ValidationResult):
+        raw = value.raw_response_data
+        if raw is None:
+            return value.model_dump_json().encode()
+        head = value.model_dump_json(exclude={"response_data"}).encode()
+        return head[:-1] + b',"response_data":' + raw + b"}"
+
+    if isinstance(value, list):
+        return b"[" + b",".join(dump_json(v) for v in value) + b"]"
+
+    if isinstance(value, BaseModel):
+        nested = [
+            name
+            for name in type(value).model_fields
+            if isinstance(getattr(value, name), (BaseModel, list)) and _has_results(getattr(value, name))
+        ]
+        if not nested:
+            return value.model_dump_json().encode()
+        head = value.model_dump_json(exclude=set(nested)).encode()
+        parts = b",".join(b'"' + name.encode() + b'":' + dump_json(getattr(value, name)) for name in nested)
+        return head[:-1] + (b"," if len(head) > 2 else b"") + parts + b"}"
+
+    return to_json(value)
+
+
+def _has_results(value: Any) -> bool:
+    """Whether a field value holds ValidationResults (directly or nested)."""
+    if isinstance(value, ValidationResult):
+        return True
+    if isinstance(value, list):
+        # Model lists are homogeneous: the first item decides
+        return bool(value) and _has_results(value[0])
+    if isinstance(value, BaseModel):
+        return any(_has_results(getattr(value, name)) for name in type(value).model_fields)
+    return False
+
+
+class ModelJSONResponse(Response):
+    """
+    JSON response for models, bypassing FastAPI's jsonable_encoder pass.
+    Routes keep their response_model for the OpenAPI schema and return
+    this response directly.
+    """
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return dump_json(content)
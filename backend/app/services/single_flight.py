@@ -0,0 +1,79 @@
+import asyncio
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Awaitable, Callable, Generic, Hashable, TypeVar
+
+from app.config import get_settings
+
+T = TypeVar("T")
+
+
+class _Flight:
+    def __init__(self, task: asyncio.Task):
+        self.task = task
+        self.waiters = 0
+
+
+class SingleFlight(Generic[T]):
+    """
+    Coalesces concurrent calls with the same key into one execution.
+    With a window > 0, a completed result is also handed to callers that
+    arrive within `window` seconds after it finished.
+    The execution is cancelled when every caller waiting on it is cancelled.
+    """
+
+    def __init__(self, window: float = 0.0, max_recent: int = 1024):
+        self.window = window
+        self.max_recent = max_recent
+        self._in_flight: dict[Hashable, _Flight] = {}
+        # Insertion order == expiry order, since the window is constant
+        self._recent: OrderedDict[Hashable, tuple[float, T]] = OrderedDict()
+
+    def _prune(self, now: float) -> None:
+        while self._recent:
+            key, (expires_at, _) = next(iter(self._recent.items()))
+            if expires_at > now and len(self._recent) <= self.max_recent:
+                break
+            del self._recent[key]
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> tuple[T, bool]:
+        """Run fn once per key. Returns (result, shared); shared is False for the caller that ran it."""
+        if self.window > 0:
+            self._prune(time.monotonic())
+            recent = self._recent.get(key)
+            if recent is not None:
+                return recent[1], True
+
+        flight = self._in_flight.get(key)
+        shared = flight is not None
+        if flight is None:
+            flight = self._in_flight[key] = _Flight(asyncio.ensure_future(self._run(key, fn)))
+        flight.waiters += 1
+        try:
+            # Shield so one caller being cancelled doesn't cancel the others' call
+            return await asyncio.shield(flight.task), shared
+        finally:
+            flight.waiters -= 1
+            if flight.waiters == 0 and not flight.task.done():
+                # Every caller is gone: stop the call, and let new callers start afresh
+                flight.task.cancel()
+                if self._in_flight.get(key) is flight:
+                    del self._in_flight[key]
+
+    async def _run(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        try:
+            result = await fn()
+            if self.window > 0:
+                self._recent.pop(key, None)
+                self._recent[key] = (time.monotonic() + self.window, result)
+            return result
+        finally:
+            flight = self._in_flight.get(key)
+            if flight is not None and flight.task is asyncio.current_task():
+                del self._in_flight[key]
+
+
+@lru_cache
+def get_single_flight() -> SingleFlight:
+    return SingleFlight(window=get_settings().single_flight_window_seconds)
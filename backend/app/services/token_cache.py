@@ -0,0 +1,77 @@
+import asyncio
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Awaitable, Callable, Hashable
+
+from app.config import get_settings
+
+# (is_valid, accounts_list, error_message), as returned by validate_token
+TokenValidation = tuple[bool, list[dict], str | None]
+
+# Loaders return the validation plus a TTL in seconds (None = don't cache)
+TokenLoader = Callable[[], Awaitable[tuple[TokenValidation, float | None]]]
+
+
+class TokenValidationCache:
+    """
+    In-process LRU cache of token validations with per-entry TTL.
+    Keys are token hashes, never raw tokens. Concurrent lookups for a key
+    that is not cached share a single upstream call.
+    """
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._entries: OrderedDict[Hashable, tuple[float, TokenValidation]] = OrderedDict()
+        self._in_flight: dict[Hashable, asyncio.Task] = {}
+
+    def get(self, key: Hashable) -> TokenValidation | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: TokenValidation, ttl: float) -> None:
+        if ttl <= 0 or self.max_entries <= 0:
+            return
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, key: Hashable) -> None:
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    async def get_or_load(self, key: Hashable, loader: TokenLoader) -> TokenValidation:
+        cached = self.get(key)
+        if cached is not None:
+            return cached
+
+        task = self._in_flight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._load(key, loader))
+            self._in_flight[key] = task
+        # Shield so one caller being cancelled doesn't cancel the shared call
+        return await asyncio.shield(task)
+
+    async def _load(self, key: Hashable, loader: TokenLoader) -> TokenValidation:
+        try:
+            value, ttl = await loader()
+            if ttl is not None:
+                self.set(key, value, ttl)
+            return value
+        finally:
+            self._in_flight.pop(key, None)
+
+
+@lru_cache
+def get_token_cache() -> TokenValidationCache:
+    return TokenValidationCache(max_entries=get_settings().token_cache_max_entries)
@@ -0,0 +1,9 @@
+import hashlib
+
+
+def hash_token(api_token: str) -> str:
+    """
+    Return a stable fingerprint for an API token.
+    Used as a key for per-token state so raw tokens are never kept around.
+    """
+    return hashlib.sha256(api_token.encode("utf-8")).hexdigest()
@@ -0,0 +1,145 @@
+"""
+Local stand-in for the Sealmetrics API.
+
+Serves every path in EndpointsRegistry with configurable latency,
+payload size and error rates. Use it in-process through
+httpx.ASGITransport (see benchmarks/run.py) or standalone:
+
+    MOCK_LATENCY_MS=50 MOCK_ITEMS=500 uvicorn benchmarks.mock_upstream:app --port 9000
+    SEALMETRICS_API_BASE=http://localhost:9000/api uvicorn app.main:app
+"""
+import asyncio
+import hashlib
+import json
+import os
+import random
+from dataclasses import dataclass
+from datetime import date, timedelta
+
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, Response
+
+from app.services import EndpointsRegistry
+
+API_PREFIX = "/api"
+INVALID_TOKEN = "invalid"
+
+
+@dataclass
+class MockUpstreamConfig:
+    latency_ms: float = 20.0
+    latency_jitter_ms: float = 5.0
+    items: int = 50
+    item_padding_bytes: int = 0
+    error_rate: float = 0.0
+    throttle_rate: float = 0.0
+    accounts: int = 3
+    cache_max_age: float = 0.0
+    # Behave like an API without offset support: every page starts at the first row
+    ignore_skip: bool = False
+    seed: int | None = None
+
+    @classmethod
+    def from_env(cls) -> "MockUpstreamConfig":
+        seed = os.environ.get("MOCK_SEED")
+        return cls(
+            latency_ms=float(os.environ.get("MOCK_LATENCY_MS", cls.latency_ms)),
+            latency_jitter_ms=float(os.environ.get("MOCK_LATENCY_JITTER_MS", cls.latency_jitter_ms)),
+            items=int(os.environ.get("MOCK_ITEMS", cls.items)),
+            item_padding_bytes=int(os.environ.get("MOCK_ITEM_PADDING_BYTES", cls.item_padding_bytes)),
+            error_rate=float(os.environ.get("MOCK_ERROR_RATE", cls.error_rate)),
+            throttle_rate=float(os.environ.get("MOCK_THROTTLE_RATE", cls.throttle_rate)),
+            accounts=int(os.environ.get("MOCK_ACCOUNTS", cls.accounts)),
+            cache_max_age=float(os.environ.get("MOCK_CACHE_MAX_AGE", cls.cache_max_age)),
+            ignore_skip=os.environ.get("MOCK_IGNORE_SKIP", "").lower() in ("1", "true"),
+            seed=int(seed) if seed else None,
+        )
+
+
+def _build_items(config: MockUpstreamConfig, limit: int | None, skip: int = 0) -> list[dict]:
+    end = config.items if limit is None else min(config.items, skip + limit)
+    today = date.today()
+    padding = "x" * config.item_padding_bytes
+    items = []
+    for i in range(skip, end):
+        day = today - timedelta(days=i)
+        item = {
+            "_id": day.isoformat(),
+            "clicks": (i * 37) % 1000,
+            "conversions": (i * 7) % 50,
+            "revenue": round(((i * 13) % 500) * 1.5, 2),
+            "utm_term": None if i % 3 else "brand",
+        }
+        if padding:
+            item["padding"] = padding
+        items.append(item)
+    return items
+
+
+def create_app(config: MockUpstreamConfig | None = None) -> FastAPI:
+    config = config or MockUpstreamConfig()
+    rng = random.Random(config.seed)
+    mock = FastAPI(title="Mock Sealmetrics API")
+    mock.state.config = config
+    # Requests received, answered (not cancelled) and concurrently in progress
+    mock.state.requests = 0
+    mock.state.completed = 0
+    mock.state.in_flight = 0
+    mock.state.peak_in_flight = 0
+
+    async def handle(request: Request) -> Response:
+        mock.state.requests += 1
+        mock.state.in_flight += 1
+        mock.state.peak_in_flight = max(mock.state.peak_in_flight, mock.state.in_flight)
+        try:
+            response = await respond(request)
+        finally:
+            mock.state.in_flight -= 1
+        mock.state.completed += 1
+        return response
+
+    async def respond(request: Request) -> Response:
+        if config.latency_ms or config.latency_jitter_ms:
+            delay = config.latency_ms + rng.uniform(-1, 1) * config.latency_jitter_ms
+            await asyncio.sleep(max(0.0, delay) / 1000)
+
+        if request.headers.get("authorization") == f"Bearer {INVALID_TOKEN}":
+            return JSONResponse({"error": "Unauthenticated"}, status_code=401)
+        if config.throttle_rate and rng.random() < config.throttle_rate:
+            return JSONResponse({"error": "Too many requests"}, status_code=429, headers={"Retry-After": "1"})
+        if config.error_rate and rng.random() < config.error_rate:
+            return JSONResponse({"error": "Internal server error"}, status_code=500)
+
+        if request.url.path == f"{API_PREFIX}/auth/accounts":
+            return JSONResponse({f"acc_{i}": f"Account {i}" for i in range(1, config.accounts + 1)})
+
+        limit = request.query_params.get("limit")
+        skip = request.query_params.get("skip")
+        items = _build_items(
+            config,
+            int(limit) if limit and limit.isdigit() else None,
+            int(skip) if skip and skip.isdigit() and not config.ignore_skip else 0,
+        )
+        body = json.dumps({"data": items, "total": len(items)}).encode()
+
+        # Reports are deterministic per day: serve validators for conditional requests
+        headers = {
+            "ETag": f'"{hashlib.sha1(body).hexdigest()}"',
+            "Cache-Control": f"private, max-age={config.cache_max_age:g}" if config.cache_max_age else "no-cache",
+        }
+        if request.headers.get("if-none-match") == headers["ETag"]:
+            return Response(status_code=304, headers=headers)
+        return Response(body, media_type="application/json", headers=headers)
+
+    for endpoint in EndpointsRegistry.get_all_endpoints():
+        mock.add_api_route(
+            f"{API_PREFIX}{endpoint.path}",
+            handle,
+            methods=[endpoint.method],
+            name=endpoint.id,
+        )
+
+    return mock
+
+
+app = create_app(MockUpstreamConfig.from_env())
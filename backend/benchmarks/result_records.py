@@ -0,0 +1,110 @@
+"""
+Result representation benchmark.
+
+Compares building a validated ValidationResult per upstream response (the
+previous internal representation) with the slotted ResultRecord the client
+now uses internally, and with converting a record at the API boundary.
+Reports construction time and retained memory per result.
+
+    cd backend
+    python -m benchmarks.result_records --results 100000
+"""
+import argparse
+import gc
+import json
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+from typing import Callable
+
+from app.models import ValidationResult
+from app.services.result_record import ResultRecord
+
+_PARAMS = {"account_id": "acc_1", "date_range": "last_30_days", "limit": 100}
+_URL = "https://app.sealmetrics.com/api/report/pages?account_id=acc_1&date_range=last_30_days&limit=100"
+# A summary_only result, as produced for benchmark and pagination requests
+_FIELDS = dict(
+    endpoint_id="report_pages",
+    endpoint_name="Pages",
+    success=True,
+    status_code=200,
+    response_time_ms=42.17,
+    request_url=_URL,
+    request_params=_PARAMS,
+    data_count=100,
+    latest_data_date="2026-10-17",
+    earliest_data_date="2026-09-18",
+    null_field_counts={"utm_source": 3},
+    schema_fingerprint="5f2a9c1e",
+    response_size_bytes=48213,
+    response_truncated=True,
+)
+
+
+def _validation_result() -> ValidationResult:
+    return ValidationResult(timestamp=datetime.utcnow(), **_FIELDS)
+
+
+def _record() -> ResultRecord:
+    return ResultRecord(**_FIELDS)
+
+
+def _record_converted() -> ValidationResult:
+    return ResultRecord(**_FIELDS).to_validation_result()
+
+
+_BUILDERS: dict[str, Callable[[], object]] = {
+    "validation_result": _validation_result,
+    "result_record": _record,
+    "record_to_validation_result": _record_converted,
+}
+
+
+def _measure(build: Callable[[], object], results: int) -> dict:
+    build()  # warm up
+    gc.collect()
+    start = time.perf_counter()
+    for _ in range(results):
+        build()
+    elapsed = time.perf_counter() - start
+
+    gc.collect()
+    tracemalloc.start()
+    baseline = tracemalloc.get_traced_memory()[0]
+    kept = [build() for _ in range(results)]
+    retained = tracemalloc.get_traced_memory()[0] - baseline
+    tracemalloc.stop()
+    del kept
+
+    return {
+        "construct_us_per_result": round(elapsed / results * 1e6, 3),
+        # Includes the list slot holding each result
+        "bytes_per_result": round(retained / results, 1),
+    }
+
+
+def run(args: argparse.Namespace) -> dict:
+    report = {"config": vars(args), "representations": {}}
+    for name, build in _BUILDERS.items():
+        report["representations"][name] = _measure(build, args.results)
+        print(f"{name:>28}: {json.dumps(report['representations'][name])}", file=sys.stderr)
+
+    model = report["representations"]["validation_result"]
+    record = report["representations"]["result_record"]
+    report["construct_speedup"] = round(model["construct_us_per_result"] / record["construct_us_per_result"], 2)
+    report["memory_ratio"] = round(model["bytes_per_result"] / record["bytes_per_result"], 2)
+    return report
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.result_records", description=__doc__.split("\n\n")[0])
+    parser.add_argument("--results", type=int, default=100_000, help="Results built per representation")
+    args = parser.parse_args(argv)
+
+    print(json.dumps(run(args), indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,207 @@
+"""
+Reproducible backend benchmark suite.
+
+Drives the validator routes in-process against the mock upstream
+(no network access needed) and reports latency percentiles, throughput
+and allocations per request for each scenario.
+
+    cd backend
+    python -m benchmarks.run --requests 500 --concurrency 20
+    python -m benchmarks.run --output bench.json
+    python -m benchmarks.run --baseline bench.json --max-regression 0.2
+
+With --baseline the run exits non-zero when a scenario's throughput
+drops by more than --max-regression compared to the baseline file.
+"""
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+# The upstream is local and synthetic: don't throttle or retry against it.
+# Workers send identical requests, so deduplication would skip the work being measured.
+os.environ.setdefault("SEALMETRICS_API_BASE", "http://mock-upstream/api")
+os.environ.setdefault("RATE_LIMIT_ENABLED", "false")
+os.environ.setdefault("RETRY_MAX_ATTEMPTS", "0")
+os.environ.setdefault("SINGLE_FLIGHT_ENABLED", "false")
+
+import httpx  # noqa: E402
+
+from app.main import app as validator_app  # noqa: E402
+from app.services import EndpointsRegistry  # noqa: E402
+from app.services.histogram import LatencyHistogram  # noqa: E402
+from app.services.http_pool import close_http_client, open_http_client  # noqa: E402
+from benchmarks.mock_upstream import MockUpstreamConfig, create_app  # noqa: E402
+
+API_TOKEN = "benchmark-token"
+ACCOUNT_ID = "acc_1"
+
+
+def _scenarios() -> dict[str, dict]:
+    endpoint_ids = EndpointsRegistry.get_health_check_endpoints()
+    return {
+        "endpoint": {
+            "method": "POST",
+            "url": "/validate/endpoint",
+            "json": {
+                "api_token": API_TOKEN,
+                "endpoint_id": "report_pages",
+                "parameters": {"account_id": ACCOUNT_ID, "date_range": "last_30_days"},
+            },
+        },
+        "batch": {
+            "method": "POST",
+            "url": "/validate/batch",
+            "json": {
+                "api_token": API_TOKEN,
+                "account_id": ACCOUNT_ID,
+                "jobs": [{"endpoint_id": endpoint_id} for endpoint_id in endpoint_ids],
+            },
+        },
+        "health-check": {
+            "method": "POST",
+            "url": "/validate/health-check",
+            "json": {"api_token": API_TOKEN, "account_id": ACCOUNT_ID},
+        },
+    }
+
+
+async def _drive(client: httpx.AsyncClient, request: dict, total: int, concurrency: int) -> dict:
+    histogram = LatencyHistogram()
+    status_codes: dict[str, int] = {}
+    remaining = total
+
+    async def worker() -> None:
+        nonlocal remaining
+        while remaining > 0:
+            remaining -= 1
+            start = time.perf_counter()
+            response = await client.request(**request)
+            histogram.record((time.perf_counter() - start) * 1000)
+            status = str(response.status_code)
+            status_codes[status] = status_codes.get(status, 0) + 1
+
+    start = time.perf_counter()
+    await asyncio.gather(*[worker() for _ in range(concurrency)])
+    elapsed = time.perf_counter() - start
+
+    p = histogram.percentiles([50, 90, 99])
+    return {
+        "requests": histogram.total_count,
+        "throughput_rps": round(histogram.total_count / elapsed, 2),
+        "p50_ms": p[50],
+        "p90_ms": p[90],
+        "p99_ms": p[99],
+        "max_ms": histogram.max_ms,
+        "status_codes": status_codes,
+    }
+
+
+async def _measure_allocations(client: httpx.AsyncClient, request: dict, total: int) -> dict:
+    """Sequential pass under tracemalloc: bytes allocated per request and peak."""
+    tracemalloc.start()
+    try:
+        tracemalloc.reset_peak()
+        before, _ = tracemalloc.get_traced_memory()
+        for _ in range(total):
+            await client.request(**request)
+        after, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {
+        "retained_bytes_per_request": round((after - before) / total),
+        "peak_bytes": peak - before,
+    }
+
+
+async def run(args: argparse.Namespace) -> dict:
+    mock_config = MockUpstreamConfig(
+        latency_ms=args.latency_ms,
+        latency_jitter_ms=args.latency_jitter_ms,
+        items=args.items,
+        item_padding_bytes=args.item_padding_bytes,
+        error_rate=args.error_rate,
+        seed=args.seed,
+    )
+    await open_http_client(transport=httpx.ASGITransport(app=create_app(mock_config)))
+
+    report = {"config": vars(args).copy(), "scenarios": {}}
+    report["config"].pop("baseline", None)
+
+    try:
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=validator_app),
+            base_url="http://validator",
+            timeout=None,
+        ) as client:
+            scenarios = _scenarios()
+            for name in args.scenario or scenarios:
+                request = scenarios[name]
+                # Warm up pools and caches before measuring
+                await _drive(client, request, min(args.concurrency, args.requests), args.concurrency)
+                result = await _drive(client, request, args.requests, args.concurrency)
+                if args.allocations:
+                    result.update(await _measure_allocations(client, request, args.allocation_requests))
+                report["scenarios"][name] = result
+                print(f"{name:>14}: {json.dumps(result)}", file=sys.stderr)
+    finally:
+        await close_http_client()
+
+    return report
+
+
+def _check_regressions(report: dict, baseline: dict, max_regression: float) -> list[str]:
+    failures = []
+    for name, result in report["scenarios"].items():
+        previous = baseline.get("scenarios", {}).get(name)
+        if not previous:
+            continue
+        floor = previous["throughput_rps"] * (1 - max_regression)
+        if result["throughput_rps"] < floor:
+            failures.append(
+                f"{name}: throughput {result['throughput_rps']} rps < {floor:.2f} rps "
+                f"(baseline {previous['throughput_rps']} rps)"
+            )
+    return failures
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.run", description=__doc__.split("\n\n")[0])
+    parser.add_argument("--scenario", action="append", choices=list(_scenarios()), help="Run only these scenarios")
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--latency-ms", type=float, default=5.0, help="Mock upstream latency")
+    parser.add_argument("--latency-jitter-ms", type=float, default=1.0)
+    parser.add_argument("--items", type=int, default=100, help="Items per mock report")
+    parser.add_argument("--item-padding-bytes", type=int, default=0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--no-allocations", dest="allocations", action="store_false")
+    parser.add_argument("--allocation-requests", type=int, default=20)
+    parser.add_argument("--output", help="Write the JSON report to this file")
+    parser.add_argument("--baseline", help="Compare throughput against a previous report")
+    parser.add_argument("--max-regression", type=float, default=0.2)
+    args = parser.parse_args(argv)
+
+    report = asyncio.run(run(args))
+    output = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(output)
+    else:
+        print(output)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            failures = _check_regressions(report, json.load(f), args.max_regression)
+        for failure in failures:
+            print(f"REGRESSION {failure}", file=sys.stderr)
+        return 1 if failures else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
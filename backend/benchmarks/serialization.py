@@ -0,0 +1,120 @@
+"""
+Response serialization benchmark.
+
+Compares FastAPI's default response_model path (jsonable_encoder-style
+validation and re-encoding of response_data) with ModelJSONResponse,
+which passes the upstream body through as raw JSON, for a large
+report_pages payload fetched from the mock upstream.
+
+    cd backend
+    python -m benchmarks.serialization --items 5000 --requests 200
+"""
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+
+os.environ.setdefault("SEALMETRICS_API_BASE", "http://mock-upstream/api")
+os.environ.setdefault("RATE_LIMIT_ENABLED", "false")
+
+import httpx  # noqa: E402
+from fastapi import FastAPI  # noqa: E402
+
+from app.models import ResponseOptions, ValidationResult  # noqa: E402
+from app.services.histogram import LatencyHistogram  # noqa: E402
+from app.services.http_pool import close_http_client, open_http_client  # noqa: E402
+from app.services.sealmetrics_client import SealmetricsClient  # noqa: E402
+from app.services.serialization import ModelJSONResponse  # noqa: E402
+from benchmarks.mock_upstream import MockUpstreamConfig, create_app  # noqa: E402
+
+
+async def _fetch_result(items: int, padding: int) -> ValidationResult:
+    mock = create_app(MockUpstreamConfig(latency_ms=0, latency_jitter_ms=0, items=items, item_padding_bytes=padding))
+    await open_http_client(transport=httpx.ASGITransport(app=mock))
+    try:
+        client = SealmetricsClient("benchmark-token")
+        return await client.validate_endpoint(
+            "report_pages",
+            {"account_id": "acc_1", "date_range": "last_30_days"},
+            ResponseOptions(),
+        )
+    finally:
+        await close_http_client()
+
+
+def _create_app(result: ValidationResult) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/default", response_model=ValidationResult)
+    async def default():
+        return result
+
+    @app.get("/raw", response_model=ValidationResult)
+    async def raw():
+        return ModelJSONResponse(result)
+
+    return app
+
+
+async def _measure(client: httpx.AsyncClient, path: str, requests: int) -> dict:
+    histogram = LatencyHistogram()
+    await client.get(path)  # warm up
+    cpu_start = time.process_time()
+    start = time.perf_counter()
+    for _ in range(requests):
+        request_start = time.perf_counter()
+        response = await client.get(path)
+        histogram.record((time.perf_counter() - request_start) * 1000)
+    elapsed = time.perf_counter() - start
+    cpu = time.process_time() - cpu_start
+
+    p = histogram.percentiles([50, 99])
+    return {
+        "response_bytes": len(response.content),
+        "throughput_rps": round(requests / elapsed, 2),
+        "cpu_ms_per_request": round(cpu / requests * 1000, 3),
+        "p50_ms": p[50],
+        "p99_ms": p[99],
+    }
+
+
+async def run(args: argparse.Namespace) -> dict:
+    result = await _fetch_result(args.items, args.item_padding_bytes)
+    if result.raw_response_data is None:
+        raise SystemExit("response_data was not passed through as raw JSON")
+
+    report = {"config": vars(args), "upstream_bytes": result.response_size_bytes, "paths": {}}
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=_create_app(result)),
+        base_url="http://validator",
+        timeout=None,
+    ) as client:
+        # Both paths must produce the same document
+        default, raw = (await client.get("/default")).json(), (await client.get("/raw")).json()
+        if default != raw:
+            raise SystemExit("Serialized responses differ")
+        for path in ("default", "raw"):
+            report["paths"][path] = await _measure(client, f"/{path}", args.requests)
+            print(f"{path:>8}: {json.dumps(report['paths'][path])}", file=sys.stderr)
+
+    default_cpu = report["paths"]["default"]["cpu_ms_per_request"]
+    raw_cpu = report["paths"]["raw"]["cpu_ms_per_request"]
+    report["cpu_speedup"] = round(default_cpu / raw_cpu, 2) if raw_cpu else None
+    return report
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.serialization", description=__doc__.split("\n\n")[0])
+    parser.add_argument("--items", type=int, default=5000, help="Items in the report payload")
+    parser.add_argument("--item-padding-bytes", type=int, default=0)
+    parser.add_argument("--requests", type=int, default=100)
+    args = parser.parse_args(argv)
+
+    print(json.dumps(asyncio.run(run(args)), indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
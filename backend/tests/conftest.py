@@ -0,0 +1,76 @@
+"""
+Behaviour tests run the services against benchmarks.mock_upstream, served
+in-process through httpx.ASGITransport: no network, and cancelling a client
+call cancels the mock handler, so mock.state shows what really ran upstream.
+"""
+import httpx
+import pytest
+
+from app.config import get_settings
+from app.services.concurrency import get_health_check_limiter
+from app.services.drift import get_drift_tracker
+from app.services.hedging import get_latency_tracker
+from app.services.http_pool import close_http_client, open_http_client
+from app.services.rate_limiter import get_rate_limiters
+from app.services.response_cache import get_response_cache
+from app.services.single_flight import get_single_flight
+from app.services.token_cache import get_token_cache
+from benchmarks.mock_upstream import MockUpstreamConfig, create_app
+
+MOCK_API_BASE = "http://mock-upstream/api"
+
+_SINGLETONS = (
+    get_settings,
+    get_health_check_limiter,
+    get_drift_tracker,
+    get_latency_tracker,
+    get_rate_limiters,
+    get_response_cache,
+    get_single_flight,
+    get_token_cache,
+)
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+@pytest.fixture(autouse=True)
+def settings_env(monkeypatch):
+    """Point the client at the mock and start every test with fresh singletons."""
+    monkeypatch.setenv("SEALMETRICS_API_BASE", MOCK_API_BASE)
+    monkeypatch.setenv("RATE_LIMIT_ENABLED", "false")
+    monkeypatch.delenv("RESULT_STORE_PATH", raising=False)
+    monkeypatch.delenv("MONITORS_CONFIG_PATH", raising=False)
+    for getter in _SINGLETONS:
+        getter.cache_clear()
+    yield monkeypatch
+    for getter in _SINGLETONS:
+        getter.cache_clear()
+
+
+@pytest.fixture
+def mock_config() -> MockUpstreamConfig:
+    """Override in a test module (or parametrize) to change the mock's behaviour."""
+    return MockUpstreamConfig(latency_ms=0, latency_jitter_ms=0, seed=1)
+
+
+@pytest.fixture
+async def upstream(mock_config):
+    """The mock upstream app, installed as the transport of the shared HTTP client."""
+    mock = create_app(mock_config)
+    await open_http_client(transport=httpx.ASGITransport(app=mock))
+    try:
+        yield mock
+    finally:
+        await close_http_client()
+
+
+@pytest.fixture
+async def api(upstream):
+    """Client for the validator app itself, whose upstream calls go to the mock."""
+    from app.main import app
+
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://validator") as client:
+        yield client
@@ -0,0 +1,50 @@
+import asyncio
+
+import pytest
+
+from app.models import BatchRequest
+from app.services.batch import expand_batch, iter_batch, run_batch
+from app.services.sealmetrics_client import SealmetricsClient
+from benchmarks.mock_upstream import MockUpstreamConfig
+
+pytestmark = pytest.mark.anyio
+
+DATE_RANGES = ["today", "yesterday", "last_7_days", "last_14_days", "last_30_days", "last_60_days"]
+
+
+@pytest.fixture
+def mock_config() -> MockUpstreamConfig:
+    # Spread latencies so results complete one at a time
+    return MockUpstreamConfig(latency_ms=100, latency_jitter_ms=80, seed=3)
+
+
+def _request(**overrides) -> BatchRequest:
+    return BatchRequest(
+        api_token="token",
+        account_id="acc_1",
+        jobs=[{"endpoint_id": "report_pages", "matrix": {"date_range": DATE_RANGES}}],
+        response_options={"summary_only": True},
+        **overrides,
+    )
+
+
+async def test_run_batch_keeps_job_order(upstream):
+    request = _request()
+    jobs = expand_batch(request)
+    results = await run_batch(SealmetricsClient("token"), request, jobs)
+    assert [r.request_params["date_range"] for r in results] == DATE_RANGES
+    assert all(r.success for r in results)
+
+
+async def test_stopping_iteration_cancels_pending_upstream_requests(upstream):
+    request = _request()
+    stream = iter_batch(SealmetricsClient("token"), request, expand_batch(request))
+    first = await stream.__anext__()
+    assert first.success
+    completed = upstream.state.completed
+    assert completed < len(DATE_RANGES)
+
+    await stream.aclose()
+    assert upstream.state.in_flight == 0
+    await asyncio.sleep(0.3)
+    assert upstream.state.completed == completed
@@ -0,0 +1,16 @@
+import pytest
+
+from app import cli
+
+
+def test_param_parses_key_value():
+    assert cli._param("date_range=today") == ("date_range", "today")
+    assert cli._param("filter=a=b") == ("filter", "a=b")
+
+
+@pytest.mark.parametrize("value", ["bad", "=today"])
+def test_bad_param_is_a_usage_error(value, capsys):
+    with pytest.raises(SystemExit) as exc:
+        cli.main(["benchmark", "--token", "t", "--endpoint", "report_pages", "--param", value])
+    assert exc.value.code == 2
+    assert "expected KEY=VALUE" in capsys.readouterr().err
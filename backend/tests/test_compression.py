@@ -0,0 +1,65 @@
+import json
+
+import pytest
+
+from app.middleware.compression import available_encodings, choose_encoding
+from benchmarks.mock_upstream import MockUpstreamConfig
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+def mock_config() -> MockUpstreamConfig:
+    return MockUpstreamConfig(latency_ms=0, latency_jitter_ms=0, items=200)
+
+
+def _validation(**overrides) -> dict:
+    return {
+        "api_token": "token",
+        "endpoint_id": "report_pages",
+        "parameters": {"account_id": "acc_1", "date_range": "last_30_days", "limit": 200},
+        **overrides,
+    }
+
+
+def test_choose_encoding_prefers_q_value_then_server_order():
+    assert choose_encoding("gzip, br", ["zstd", "br", "gzip"]) == "br"
+    assert choose_encoding("gzip;q=1, br;q=0.5", ["zstd", "br", "gzip"]) == "gzip"
+    assert choose_encoding("*", ["zstd", "br", "gzip"]) == "zstd"
+    assert choose_encoding("identity", ["zstd", "br", "gzip"]) is None
+    assert choose_encoding("gzip;q=0", ["gzip"]) is None
+
+
+@pytest.mark.parametrize("encoding", sorted(available_encodings()))
+async def test_complete_body_round_trips(api, encoding):
+    plain = await api.post("/validate/endpoint", json=_validation(), headers={"Accept-Encoding": "identity"})
+    assert "content-encoding" not in plain.headers
+
+    # httpx decodes gzip, br and zstd transparently
+    compressed = await api.post("/validate/endpoint", json=_validation(), headers={"Accept-Encoding": encoding})
+    assert compressed.headers["content-encoding"] == encoding
+    assert "Accept-Encoding" in compressed.headers["vary"]
+    assert int(compressed.headers["content-length"]) < len(plain.content)
+    assert compressed.json()["response_data"] == plain.json()["response_data"]
+
+
+async def test_small_body_is_not_compressed(api):
+    response = await api.post(
+        "/validate/endpoint",
+        json=_validation(response_options={"summary_only": True}, parameters={"account_id": "acc_1", "limit": 1}),
+        headers={"Accept-Encoding": "gzip"},
+    )
+    assert len(response.content) < 1024
+    assert "content-encoding" not in response.headers
+
+
+async def test_streamed_ndjson_is_compressed_per_line(api):
+    batch = {
+        "api_token": "token",
+        "account_id": "acc_1",
+        "jobs": [{"endpoint_id": "report_pages", "parameters": {"date_range": d}} for d in ("today", "yesterday")],
+    }
+    response = await api.post("/validate/batch/stream", json=batch, headers={"Accept-Encoding": "gzip"})
+    assert response.headers["content-encoding"] == "gzip"
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert [line["success"] for line in lines] == [True, True]
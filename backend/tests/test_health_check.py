@@ -0,0 +1,62 @@
+import pytest
+
+from app.config import get_settings
+from app.services.concurrency import get_health_check_limiter
+from app.services.health_check import run_health_check, run_multi_account_health_check
+from app.services.sealmetrics_client import SealmetricsClient
+from benchmarks.mock_upstream import MockUpstreamConfig
+
+pytestmark = pytest.mark.anyio
+
+ENDPOINTS = ["report_pages", "report_acquisition", "report_conversions", "report_microconversions"]
+
+
+@pytest.fixture
+def mock_config() -> MockUpstreamConfig:
+    return MockUpstreamConfig(latency_ms=50, latency_jitter_ms=0, accounts=8)
+
+
+@pytest.fixture
+def limits(settings_env):
+    def set_limits(max_concurrency: int = 20) -> None:
+        settings_env.setenv("HEALTH_CHECK_MAX_CONCURRENCY", str(max_concurrency))
+        settings_env.setenv("HEALTH_CHECK_PER_TOKEN_CONCURRENCY", "5")
+        settings_env.setenv("HEALTH_CHECK_MAX_CONCURRENT_ACCOUNTS", "4")
+        settings_env.setenv("HEALTH_CHECK_PER_ACCOUNT_CONCURRENCY", "3")
+        get_settings.cache_clear()
+        get_health_check_limiter.cache_clear()
+
+    set_limits()
+    return set_limits
+
+
+def _accounts(count: int) -> list[dict]:
+    return [{"id": f"acc_{i}", "name": f"Account {i}"} for i in range(1, count + 1)]
+
+
+async def test_single_account_is_bounded_per_token(upstream, limits):
+    # Same endpoint twice would be deduplicated into one upstream call
+    client = SealmetricsClient("token", deduplicate=False)
+    result = await run_health_check(client, "acc_1", ENDPOINTS * 2)
+    assert result.overall_status == "healthy"
+    assert upstream.state.peak_in_flight == 5
+
+
+async def test_multi_account_fan_out_uses_account_bounds(upstream, limits):
+    result = await run_multi_account_health_check(SealmetricsClient("token"), _accounts(8), endpoint_ids=ENDPOINTS)
+    assert result.overall_status == "healthy"
+    assert result.total_endpoints == 32
+    # 4 accounts x 3 calls, not the per-token limit of 5
+    assert upstream.state.peak_in_flight == 12
+
+
+async def test_multi_account_fan_out_stays_under_the_global_limit(upstream, limits):
+    limits(max_concurrency=8)
+    await run_multi_account_health_check(SealmetricsClient("token"), _accounts(8), endpoint_ids=ENDPOINTS)
+    assert upstream.state.peak_in_flight == 8
+
+
+async def test_no_account_to_check_is_unhealthy(upstream):
+    result = await run_multi_account_health_check(SealmetricsClient("token"), _accounts(2), account_ids=["nope"])
+    assert result.overall_status == "unhealthy"
+    assert result.unknown_account_ids == ["nope"]
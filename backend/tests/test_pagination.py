@@ -0,0 +1,67 @@
+import asyncio
+
+import pytest
+
+from app.services.endpoints_registry import EndpointsRegistry
+from app.services.pagination import run_paginated
+from app.services.sealmetrics_client import SealmetricsClient
+from benchmarks.mock_upstream import MockUpstreamConfig
+
+pytestmark = pytest.mark.anyio
+
+PARAMS = {"account_id": "acc_1", "date_range": "last_year"}
+
+
+async def _walk(page_size: int = 100, max_pages: int = 100, concurrency: int = 1):
+    endpoint = EndpointsRegistry.get_endpoint_by_id("report_pages")
+    return await run_paginated(
+        SealmetricsClient("token", store_results=False),
+        endpoint,
+        PARAMS,
+        page_size=page_size,
+        max_pages=max_pages,
+        concurrency=concurrency,
+    )
+
+
+@pytest.mark.parametrize(
+    ("items", "pages"),
+    [(250, 3), (200, 3), (50, 1)],
+)
+async def test_short_page_ends_the_walk(upstream, items, pages):
+    upstream.state.config.items = items
+    result = await _walk()
+    assert result.success and result.complete
+    assert result.total_rows == items
+    assert result.pages == pages
+
+
+async def test_max_pages_leaves_the_walk_incomplete(upstream):
+    upstream.state.config.items = 250
+    result = await _walk(max_pages=2)
+    assert result.success and not result.complete
+    assert result.total_rows == 200
+
+
+async def test_repeated_page_ends_the_walk_when_skip_is_ignored(upstream):
+    upstream.state.config.items = 250
+    upstream.state.config.ignore_skip = True
+    result = await _walk()
+    assert not result.success and not result.complete
+    assert result.pages == 2
+    assert result.total_rows == 100
+    assert "ignores skip" in result.error_message
+
+
+class TestPrefetch:
+    @pytest.fixture
+    def mock_config(self) -> MockUpstreamConfig:
+        return MockUpstreamConfig(latency_ms=50, latency_jitter_ms=40, items=120, seed=7)
+
+    async def test_pages_past_the_end_are_cancelled_upstream(self, upstream):
+        result = await _walk(page_size=50, concurrency=4)
+        assert result.complete and result.total_rows == 120 and result.pages == 3
+        assert upstream.state.in_flight == 0
+        completed = upstream.state.completed
+        await asyncio.sleep(0.2)
+        assert upstream.state.completed == completed
@@ -0,0 +1,57 @@
+import json
+
+import httpx
+import pytest
+
+from app.models import ResponseOptions
+from app.services.sealmetrics_client import SealmetricsClient, _embeddable_json
+from app.services.serialization import dump_json
+
+pytestmark = pytest.mark.anyio
+
+PARAMS = {"account_id": "acc_1", "date_range": "today"}
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+def test_embeddable_json_accepts_compact_utf8():
+    body = '{"data":[{"page":"/café"}]}\n'.encode()
+    assert _embeddable_json(body) == body.strip()
+
+
+@pytest.mark.parametrize(
+    "body",
+    [
+        b'{"data":[{"page":"/caf\xe9"}]}',  # Latin-1, not UTF-8
+        b'{"data":[{"page":"/a"}]',  # closing bracket missing
+        b'{"data":[{"page":"/a"}]]',  # mismatched closing bracket
+        b'\xef\xbb\xbf{"data":[]}',  # BOM
+        b'{"data":\n[]}',  # multi-line
+    ],
+)
+def test_embeddable_json_rejects(body):
+    assert _embeddable_json(body) is None
+
+
+async def _validate(body: bytes, content_type: str):
+    transport = httpx.MockTransport(lambda request: httpx.Response(200, content=body, headers={"content-type": content_type}))
+    async with httpx.AsyncClient(transport=transport) as http_client:
+        client = SealmetricsClient("token", http_client=http_client, rate_limited=False, deduplicate=False)
+        result = await client.validate_endpoint("report_pages", PARAMS, ResponseOptions())
+    return result, dump_json(result)
+
+
+async def test_non_utf8_body_is_reserialized():
+    result, out = await _validate(b'{"data":[{"page":"/caf\xe9","views":1}]}', "application/json; charset=latin-1")
+    assert result.raw_response_data is None
+    json.loads(out)
+
+
+async def test_compact_utf8_body_is_passed_through():
+    body = '{"data":[{"page":"/café","views":1}]}'.encode()
+    result, out = await _validate(body, "application/json")
+    assert result.raw_response_data == body
+    assert json.loads(out)["response_data"]["data"][0]["page"] == "/café"
@@ -0,0 +1,76 @@
+import asyncio
+
+import pytest
+
+from app.services.sealmetrics_client import SealmetricsClient
+from app.services.single_flight import SingleFlight
+from benchmarks.mock_upstream import MockUpstreamConfig
+
+pytestmark = pytest.mark.anyio
+
+PARAMS = {"account_id": "acc_1", "date_range": "today"}
+
+
+@pytest.fixture
+def mock_config() -> MockUpstreamConfig:
+    return MockUpstreamConfig(latency_ms=200, latency_jitter_ms=0)
+
+
+class _Call:
+    def __init__(self):
+        self.started = 0
+        self.cancelled = 0
+
+    async def __call__(self) -> str:
+        self.started += 1
+        try:
+            await asyncio.sleep(0.2)
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        return "done"
+
+
+async def test_concurrent_callers_share_one_call():
+    flight, call = SingleFlight(), _Call()
+    results = await asyncio.gather(flight.do("k", call), flight.do("k", call))
+    assert results == [("done", False), ("done", True)]
+    assert call.started == 1
+
+
+async def test_cancelling_one_waiter_keeps_the_call_for_the_others():
+    flight, call = SingleFlight(), _Call()
+    first = asyncio.create_task(flight.do("k", call))
+    second = asyncio.create_task(flight.do("k", call))
+    await asyncio.sleep(0.05)
+    first.cancel()
+    assert await second == ("done", True)
+    assert call.cancelled == 0
+
+
+async def test_cancelling_every_waiter_cancels_the_call():
+    flight, call = SingleFlight(), _Call()
+    waiters = [asyncio.create_task(flight.do("k", call)) for _ in range(3)]
+    await asyncio.sleep(0.05)
+    for waiter in waiters:
+        waiter.cancel()
+    await asyncio.gather(*waiters, return_exceptions=True)
+    await asyncio.sleep(0)
+    assert call.cancelled == 1
+
+    # A later caller starts a new call instead of joining the cancelled one
+    assert await flight.do("k", call) == ("done", False)
+    assert call.started == 2
+
+
+async def test_cancelled_validation_cancels_the_upstream_request(upstream):
+    client = SealmetricsClient("token")
+    assert client.deduplicate
+    tasks = [asyncio.create_task(client.validate_endpoint_record("report_pages", PARAMS)) for _ in range(2)]
+    await asyncio.sleep(0.05)
+    assert upstream.state.requests == 1
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+    await asyncio.sleep(0.3)
+    assert upstream.state.completed == 0